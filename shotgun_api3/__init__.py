@@ -44,7 +44,9 @@ elif sys.version_info < (3, 9):
 
 from .shotgun import (
     Shotgun,
+    BulkWriter,
     ShotgunError,
+    ShotgunBatchError,
     ShotgunFileDownloadError,  # noqa unused imports
     ShotgunThumbnailNotReady,
     Fault,
@@ -57,3 +59,4 @@ from .shotgun import (
     __version__,
 )
 from .shotgun import SG_TIMEZONE as sg_timezone  # noqa unused imports
+from .async_shotgun import AsyncShotgun  # noqa unused imports
@@ -0,0 +1,908 @@
+"""
+-----------------------------------------------------------------------------
+Copyright (c) 2009-2019, Shotgun Software Inc.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+ - Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+ - Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+ - Neither the name of the Shotgun Software Inc nor the names of its
+   contributors may be used to endorse or promote products derived from this
+   software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+-----------------------------------------------------------------------------
+"""
+
+import asyncio
+import collections
+import logging
+import ssl
+import time
+import urllib.parse
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .shotgun import (
+    BaseEntity,
+    GroupingItem,
+    OrderItem,
+    ProtocolError,
+    ServerCapabilities,
+    Shotgun,
+    ShotgunError,
+    _keyset_filters,
+)
+
+LOG = logging.getLogger("shotgun_api3")
+
+
+class AsyncShotgun(object):
+    """
+    Asyncio client for the Flow Production Tracking API.
+
+    The methods of this client are coroutines that mirror the methods of the same name of
+    :class:`~shotgun_api3.Shotgun`. Requests are sent over connections opened with
+    :mod:`asyncio`, so a single thread can have many requests in flight::
+
+        async with AsyncShotgun(url, script_name, api_key) as sg:
+            shots, assets = await asyncio.gather(
+                sg.find("Shot", [], ["code"]),
+                sg.find("Asset", [], ["code"]),
+            )
+
+    Connections are kept alive and reused between requests. At most ``max_connections``
+    requests are sent to the server at the same time, other requests wait for a
+    connection to be released. Idle connections are limited by
+    ``sg.config.connection_pool_size`` and ``sg.config.connection_idle_timeout``, like the
+    connections of :class:`~shotgun_api3.Shotgun`.
+
+    The client must be used from a single event loop at a time. Uploads, downloads and
+    proxies are not supported: use a :class:`~shotgun_api3.Shotgun` instance for those.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        script_name: Optional[str] = None,
+        api_key: Optional[str] = None,
+        convert_datetimes_to_utc: bool = True,
+        ca_certs: Optional[str] = None,
+        login: Optional[str] = None,
+        password: Optional[str] = None,
+        sudo_as_login: Optional[str] = None,
+        session_token: Optional[str] = None,
+        max_connections: int = 20,
+    ) -> None:
+        """
+        Initializes a new instance of the asyncio client.
+
+        No request is sent to the server until the first coroutine is awaited.
+
+        :param str base_url: http or https url of the server. See :class:`~shotgun_api3.Shotgun`.
+        :param str script_name: name of the Script entity used to authenticate to the server.
+        :param str api_key: API key for the provided ``script_name``.
+        :param bool convert_datetimes_to_utc: (optional) When ``True``, datetime values are
+            converted between local time and UTC time. Default is ``True``.
+        :param str ca_certs: (optional) path to an external SSL certificates file.
+        :param str login: The user login str to use to authenticate to the server.
+        :param str password: The password str to use to authenticate to the server.
+        :param str sudo_as_login: A user login string for the user whose permissions will be
+            applied to all actions.
+        :param str session_token: A session token to authenticate to the server.
+        :param int max_connections: (optional) Maximum number of requests sent to the server at
+            the same time. Default is ``20``.
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be greater than 0")
+
+        # The synchronous client validates the arguments, holds the configuration and
+        # builds and decodes the payloads. It never sends a request itself.
+        self._sg = Shotgun(
+            base_url,
+            script_name,
+            api_key,
+            convert_datetimes_to_utc=convert_datetimes_to_utc,
+            connect=False,
+            ca_certs=ca_certs,
+            login=login,
+            password=password,
+            sudo_as_login=sudo_as_login,
+            session_token=session_token,
+        )
+        self.config = self._sg.config
+        self._max_connections = max_connections
+
+        self._ssl_context = None
+        if self.config.scheme == "https":
+            self._ssl_context = ssl.create_default_context(
+                cafile=self._sg._get_certs_file(ca_certs)
+            )
+
+        # Asyncio primitives are bound to the event loop running when they are first
+        # used. They are created again if the client is used from another loop.
+        self._loop = None
+        self._semaphore = None
+        self._caps_lock = None
+        # Idle connections as (release_time, reader, writer), most recent last.
+        self._idle = collections.deque()
+
+    async def __aenter__(self) -> "AsyncShotgun":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    # ========================================================================
+    # API Functions
+
+    @property
+    def server_caps(self) -> Optional[ServerCapabilities]:
+        """
+        Property containing the :class:`~shotgun_api3.shotgun.ServerCapabilities` object, or
+        ``None`` until a first request is sent to the server.
+        """
+        return self._sg._server_caps
+
+    async def info(self) -> Dict[str, Any]:
+        """
+        Get API-related metadata from the server.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.info`
+        """
+        return await self._call_rpc("info", None, include_auth_params=False)
+
+    async def find_one(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        order: Optional[List[OrderItem]] = None,
+        filter_operator: Optional[str] = None,
+        retired_only: bool = False,
+        include_archived_projects: bool = True,
+        additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[BaseEntity]:
+        """
+        Shortcut for :meth:`find` with ``limit=1`` so it returns a single result.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.find_one`
+        """
+        results = await self.find(
+            entity_type,
+            filters,
+            fields,
+            order,
+            filter_operator,
+            1,
+            retired_only,
+            include_archived_projects=include_archived_projects,
+            additional_filter_presets=additional_filter_presets,
+        )
+
+        if results:
+            return results[0]
+        return None
+
+    async def find(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        order: Optional[List[OrderItem]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        include_archived_projects: bool = True,
+        additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+        keyset_paging: bool = False,
+    ) -> List[BaseEntity]:
+        """
+        Find entities matching the given filters.
+
+        The pages of the query are read one after the other. Run several queries
+        concurrently, with :func:`asyncio.gather` for example, to overlap their requests.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.find`
+        """
+        records = []
+        async for entities in self._find_pages(
+            entity_type,
+            filters,
+            fields,
+            order,
+            filter_operator,
+            limit,
+            retired_only,
+            page,
+            include_archived_projects,
+            additional_filter_presets,
+            keyset_paging,
+        ):
+            records.extend(entities)
+
+        return records
+
+    def find_iter(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        order: Optional[List[OrderItem]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        include_archived_projects: bool = True,
+        additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+        keyset_paging: bool = False,
+    ) -> AsyncIterator[BaseEntity]:
+        """
+        Find entities matching the given filters, yielding them one at a time as the
+        pages are read::
+
+            async for version in sg.find_iter("Version", [], ["code"]):
+                ...
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.find_iter`
+        """
+        # The arguments are checked when find_iter() is called, like for the
+        # synchronous client, and the pages are only read as the records are consumed.
+        # The checks depending on the server are made when the first page is read.
+        filters = self._sg._check_find_arguments(
+            filters, filter_operator, limit, page, order, keyset_paging
+        )
+
+        async def iter_records():
+            async for entities in self._find_pages(
+                entity_type,
+                filters,
+                fields,
+                order,
+                None,
+                limit,
+                retired_only,
+                page,
+                include_archived_projects,
+                additional_filter_presets,
+                keyset_paging,
+            ):
+                for record in entities:
+                    yield record
+
+        return iter_records()
+
+    async def summarize(
+        self,
+        entity_type: str,
+        filters: Union[List, Dict[str, Any]],
+        summary_fields: List[Dict[str, str]],
+        filter_operator: Optional[str] = None,
+        grouping: Optional[List[GroupingItem]] = None,
+        include_archived_projects: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Summarize field data returned by a query.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.summarize`
+        """
+        await self._ensure_server_caps()
+        params = self._sg._construct_summarize_parameters(
+            entity_type,
+            filters,
+            summary_fields,
+            filter_operator,
+            grouping,
+            include_archived_projects,
+        )
+        return await self._call_rpc("summarize", params)
+
+    async def create(
+        self,
+        entity_type: str,
+        data: Dict[str, Any],
+        return_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a new entity of the specified ``entity_type``.
+
+        Thumbnails cannot be uploaded by this client: the ``image`` and
+        ``filmstrip_image`` fields are not supported.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.create`
+        """
+        self._check_no_upload("create", data)
+
+        params = {
+            "type": entity_type,
+            "fields": self._sg._dict_to_list(data),
+            "return_fields": return_fields or ["id"],
+        }
+
+        record = await self._call_rpc("create", params, first=True)
+        return self._sg._parse_records(record)[0]
+
+    async def update(
+        self,
+        entity_type: str,
+        entity_id: int,
+        data: Dict[str, Any],
+        multi_entity_update_modes: Optional[Dict[str, Any]] = None,
+    ) -> BaseEntity:
+        """
+        Update the specified entity with the supplied data.
+
+        Thumbnails cannot be uploaded by this client: the ``image`` and
+        ``filmstrip_image`` fields are not supported.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.update`
+        """
+        self._check_no_upload("update", data)
+
+        if not data:
+            return {"id": entity_id, "type": entity_type}
+
+        params = self._sg._translate_update_params(
+            entity_type, entity_id, data, multi_entity_update_modes
+        )
+        record = await self._call_rpc("update", params)
+        return self._sg._parse_records(record)[0]
+
+    async def delete(self, entity_type: str, entity_id: int) -> bool:
+        """
+        Retire the specified entity.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.delete`
+        """
+        params = {"type": entity_type, "id": entity_id}
+        return await self._call_rpc("delete", params)
+
+    async def revive(self, entity_type: str, entity_id: int) -> bool:
+        """
+        Revive an entity that has previously been deleted.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.revive`
+        """
+        params = {"type": entity_type, "id": entity_id}
+        return await self._call_rpc("revive", params)
+
+    async def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Make a batch request of several :meth:`create`, :meth:`update`, and :meth:`delete`
+        calls, all run in a single transaction.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun.batch`
+        """
+        if not isinstance(requests, list):
+            raise ShotgunError(
+                "batch() expects a list.  Instead was sent a %s" % type(requests)
+            )
+
+        if len(requests) == 0:
+            return []
+
+        for req in requests:
+            if isinstance(req.get("data"), dict):
+                self._check_no_upload("batch", req["data"])
+
+        calls = self._sg._translate_batch_requests(requests)
+        records = await self._call_rpc("batch", calls)
+        return self._sg._parse_records(records)
+
+    async def close(self) -> None:
+        """
+        Close the idle connections to the server.
+
+        Connections in use are closed once their request completes. The client can still
+        be used afterwards, new connections are opened on demand.
+        """
+        while self._idle:
+            _, _, writer = self._idle.pop()
+            await self._close_writer(writer)
+
+    # ========================================================================
+    # Reading pages
+
+    async def _find_pages(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]],
+        order: Optional[List[OrderItem]],
+        filter_operator: Optional[str],
+        limit: int,
+        retired_only: bool,
+        page: int,
+        include_archived_projects: bool,
+        additional_filter_presets: Optional[List[Dict[str, Any]]],
+        keyset_paging: bool,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Validate the arguments of a find() call and read the raw entities of its pages.
+        """
+        await self._ensure_server_caps()
+        params, page = self._sg._prepare_find(
+            entity_type,
+            filters,
+            fields,
+            order,
+            filter_operator,
+            limit,
+            retired_only,
+            page,
+            include_archived_projects,
+            additional_filter_presets,
+            keyset_paging,
+        )
+
+        await self._read_field_types(params)
+        async for entities in self._read_pages(params, limit, page, keyset_paging):
+            yield entities
+
+    async def _read_field_types(self, params: Dict[str, Any]) -> None:
+        """
+        Read the schemas of the entity types of a find() query, when they are used to
+        decode its dates and times, so that the synchronous client never reads them.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun._get_field_types`
+        """
+        if not self.config.schema_datetime_decoding:
+            return
+
+        entity_types = [params["type"]]
+        for field_name in params["return_fields"]:
+            parts = field_name.split(".")
+            if len(parts) >= 3 and len(parts) % 2 == 1:
+                entity_types.append(parts[-2])
+
+        for entity_type in entity_types:
+            with self._sg._field_types_lock:
+                if entity_type in self._sg._field_types:
+                    continue
+            try:
+                schema = await self._call_rpc(
+                    "schema_field_read", {"type": entity_type}
+                )
+                self._sg._set_field_types(entity_type, schema)
+            except Exception as e:
+                LOG.debug("Unable to read the schema of %s: %s", entity_type, e)
+                self._sg._set_field_types(entity_type, None)
+
+    async def _read_pages(
+        self,
+        params: Dict[str, Any],
+        limit: int,
+        page: int,
+        keyset_paging: bool = False,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Read the pages of a find() query from the server, one after the other.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun._read_pages`
+        """
+        inbound = self._sg._read_inbound_transform(params)
+
+        if page != 0:
+            params["paging"]["current_page"] = page
+            result = await self._call_rpc("read", params, inbound=inbound)
+            yield result.get("entities", [])
+            return
+
+        if keyset_paging:
+            async for entities in self._read_pages_by_keyset(params, limit, inbound):
+                yield entities
+            return
+
+        paging_info_param = self._sg._paging_info_param()
+        params[paging_info_param] = True
+        count = 0
+
+        while True:
+            result = await self._call_rpc("read", params, inbound=inbound)
+            entities = result.get("entities")
+            if not entities and paging_info_param == "return_paging_info":
+                return
+            count += len(entities)
+
+            if limit and count >= limit:
+                yield entities[: len(entities) - (count - limit)]
+                return
+            yield entities
+
+            if paging_info_param == "return_paging_info_without_counts":
+                if not result["paging_info"]["has_next_page"]:
+                    return
+            elif count == result["paging_info"]["entity_count"]:
+                return
+
+            params["paging"]["current_page"] += 1
+
+    async def _read_pages_by_keyset(
+        self,
+        params: Dict[str, Any],
+        limit: int,
+        inbound: Optional[Callable[[Any], Any]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Read the pages of a find() query ordered by id, using the id of the last
+        record read to request the next page.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun._read_pages_by_keyset`
+        """
+        filters = params["filters"]
+        entities_per_page = params["paging"]["entities_per_page"]
+        count = 0
+
+        while True:
+            result = await self._call_rpc("read", params, inbound=inbound)
+            entities = result.get("entities") or []
+            count += len(entities)
+
+            if limit and count >= limit:
+                yield entities[: len(entities) - (count - limit)]
+                return
+            if entities:
+                yield entities
+
+            if len(entities) < entities_per_page:
+                return
+
+            params["filters"] = _keyset_filters(filters, entities[-1]["id"])
+
+    # ========================================================================
+    # RPC Functions
+
+    def _check_no_upload(self, method: str, data: Dict[str, Any]) -> None:
+        """
+        Raise a ShotgunError if the data holds a thumbnail to upload.
+        """
+        for field in ("image", "filmstrip_image"):
+            if data.get(field) is not None:
+                raise ShotgunError(
+                    "%s() does not support the '%s' field with AsyncShotgun. "
+                    "Use Shotgun.upload_thumbnail() or "
+                    "Shotgun.upload_filmstrip_thumbnail() instead." % (method, field)
+                )
+
+    async def _ensure_server_caps(self) -> None:
+        """
+        Read the server capabilities the first time they are needed.
+
+        The payloads of most requests depend on the server version. Concurrent callers
+        wait for the same info() request.
+        """
+        self._bind_loop()
+        if self._sg._server_caps is not None:
+            return
+
+        async with self._caps_lock:
+            if self._sg._server_caps is None:
+                info = self._sg._read_server_info_cache()
+                if info is None:
+                    info = await self.info()
+                    self._sg._write_server_info_cache(info)
+                self._sg._server_caps = ServerCapabilities(self.config.server, info)
+
+    async def _call_rpc(
+        self,
+        method: str,
+        params: Any,
+        include_auth_params: bool = True,
+        first: bool = False,
+        inbound: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Call the specified method on the server sending the supplied payload.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun._call_rpc`
+        """
+        LOG.debug("Starting async rpc call to %s with params %s" % (method, params))
+
+        if include_auth_params:
+            await self._ensure_server_caps()
+        encoded_payload, req_headers = self._sg._prepare_rpc(
+            method, params, include_auth_params
+        )
+
+        attempt = 1
+        while attempt <= self._sg.MAX_ATTEMPTS:
+            http_status, resp_headers, body = await self._make_call(
+                "POST",
+                self.config.api_path,
+                encoded_payload,
+                req_headers,
+            )
+
+            LOG.debug("Completed async rpc call to %s" % (method))
+
+            try:
+                self._sg._parse_http_status(http_status)
+            except ProtocolError as e:
+                e.headers = resp_headers
+
+                if attempt != self._sg.MAX_ATTEMPTS and e.errcode in [502, 504]:
+                    LOG.debug("Got a 502 or 504 response. Waiting and retrying...")
+                    await asyncio.sleep(float(attempt) * self._sg.BACKOFF)
+                    attempt += 1
+                    continue
+                elif e.errcode == 403:
+                    # 403 is returned with custom error page when api access is blocked
+                    e.errmsg += ": %s" % body
+                raise
+            else:
+                break
+
+        return self._sg._process_rpc_response(resp_headers, body, first, inbound)
+
+    async def _make_call(
+        self, verb: str, path: str, body: bytes, headers: Optional[Dict[str, Any]]
+    ) -> Tuple[Tuple[int, str], Dict[str, Any], bytes]:
+        """
+        Make an HTTP call to the server.
+
+        Handles retry and failure.
+
+        .. seealso:: :meth:`~shotgun_api3.Shotgun._make_call`
+        """
+        attempt = 0
+        req_headers = self._sg._build_request_headers(headers)
+
+        max_rpc_attempts = self.config.max_rpc_attempts
+        rpc_attempt_interval = self.config.rpc_attempt_interval / 1000.0
+
+        while attempt < max_rpc_attempts:
+            attempt += 1
+            try:
+                return await self._http_request(verb, path, body, req_headers)
+            except (ssl.SSLError, ssl.CertificateError) as e:
+                LOG.debug("SSL error: {}".format(e))
+                await self.close()
+                if attempt == max_rpc_attempts:
+                    LOG.debug("Request failed.  Giving up after %d attempts." % attempt)
+                    raise
+            except Exception as e:
+                LOG.debug(f"Request failed.  Reason: {e}", exc_info=True)
+                raise
+
+            LOG.debug(
+                "Request failed, attempt %d of %d.  Retrying in %.2f seconds..."
+                % (attempt, max_rpc_attempts, rpc_attempt_interval)
+            )
+            await asyncio.sleep(rpc_attempt_interval)
+
+    async def _http_request(
+        self, verb: str, path: str, body: bytes, headers: Dict[str, Any]
+    ) -> Tuple[Tuple[int, str], Dict[str, Any], bytes]:
+        """
+        Make the actual HTTP request.
+
+        A connection reused from the pool may have been closed by the server while it
+        was idle. The request is then sent again once on a new connection.
+        """
+        LOG.debug("Request is %s:%s%s" % (verb, self.config.server, path))
+        LOG.debug("Request headers are %s" % headers)
+        LOG.debug("Request body is %s" % body)
+
+        request = self._encode_request(verb, path, body, headers)
+
+        self._bind_loop()
+        async with self._semaphore:
+            reader, writer = self._checkout()
+            reused = writer is not None
+            while True:
+                if writer is None:
+                    reader, writer = await asyncio.wait_for(
+                        self._open_connection(), self.config.timeout_secs
+                    )
+                try:
+                    writer.write(request)
+                    # Wait for large bodies to be sent rather than buffering them.
+                    await asyncio.wait_for(writer.drain(), self.config.timeout_secs)
+                    response = await asyncio.wait_for(
+                        self._read_response(verb, reader), self.config.timeout_secs
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    await self._close_writer(writer)
+                    if not reused:
+                        raise
+                    LOG.debug("Reused connection failed, reconnecting: %s" % e)
+                    reused = False
+                    writer = None
+                    continue
+                except BaseException:
+                    # Also reached on timeout or cancellation, where the response
+                    # may be partially read: the connection cannot be reused.
+                    writer.close()
+                    raise
+                break
+
+        http_status, resp_headers, resp_body, keep_alive = response
+        if keep_alive:
+            self._release(reader, writer)
+        else:
+            await self._close_writer(writer)
+
+        LOG.debug("Response status is %s %s" % http_status)
+        LOG.debug("Response headers are %s" % resp_headers)
+        LOG.debug("Response body is %s" % resp_body)
+
+        return (http_status, resp_headers, resp_body)
+
+    def _encode_request(
+        self, verb: str, path: str, body: Optional[bytes], headers: Dict[str, Any]
+    ) -> bytes:
+        """
+        Encode the request line, the headers and the body of an HTTP/1.1 request.
+        """
+        body = body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        lines = ["%s %s HTTP/1.1" % (verb, path), "host: %s" % self.config.server]
+        lines.extend("%s: %s" % (name, value) for name, value in headers.items())
+        lines.append("content-length: %d" % len(body))
+        head = "\r\n".join(lines) + "\r\n\r\n"
+        return head.encode("latin-1") + body
+
+    @staticmethod
+    async def _read_response(
+        verb: str, reader: asyncio.StreamReader
+    ) -> Tuple[Tuple[int, str], Dict[str, Any], bytes, bool]:
+        """
+        Read an HTTP/1.1 response.
+
+        :returns: Tuple of the (code, reason) status, the headers with lower case names,
+            the body and whether the connection can be reused.
+        """
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by the server")
+
+        parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        version = parts[0]
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            value = value.strip()
+            if name in headers:
+                value = "%s, %s" % (headers[name], value)
+            headers[name] = value
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+
+        if verb == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0], 16)
+                if size == 0:
+                    # Skip the trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+
+        return (status, reason), headers, body, keep_alive
+
+    # ========================================================================
+    # Connections
+
+    def _bind_loop(self) -> None:
+        """
+        Create the asyncio primitives of the client for the running event loop.
+
+        Idle connections opened from another event loop cannot be reused and are
+        dropped.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self._max_connections)
+        self._caps_lock = asyncio.Lock()
+        while self._idle:
+            _, _, writer = self._idle.pop()
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def _open_connection(
+        self,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        Open a new connection to the server.
+        """
+        parts = urllib.parse.urlsplit("//%s" % self.config.server)
+        port = parts.port or (443 if self.config.scheme == "https" else 80)
+        return await asyncio.open_connection(
+            parts.hostname, port, ssl=self._ssl_context
+        )
+
+    def _checkout(
+        self,
+    ) -> Tuple[Optional[asyncio.StreamReader], Optional[asyncio.StreamWriter]]:
+        """
+        Take the most recently used idle connection, if any.
+
+        Connections idle for longer than ``config.connection_idle_timeout`` are closed.
+        """
+        timeout = self.config.connection_idle_timeout
+        if timeout is not None:
+            now = time.time()
+            while self._idle and now - self._idle[0][0] > timeout:
+                _, _, writer = self._idle.popleft()
+                writer.close()
+
+        while self._idle:
+            _, reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None, None
+
+    def _release(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Put a connection back in the idle list, or close it if the list is full.
+        """
+        if len(self._idle) < self.config.connection_pool_size:
+            self._idle.append((time.time(), reader, writer))
+        else:
+            writer.close()
+
+    @staticmethod
+    async def _close_writer(writer: asyncio.StreamWriter) -> None:
+        """
+        Close a connection, ignoring errors.
+        """
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
@@ -32,4 +32,5 @@
 
 from .schema import generate_schema # noqa
 from .mockgun import Shotgun # noqa
-from .errors import MockgunError # noqa
\ No newline at end of file
+from .errors import MockgunError # noqa
+from .storage import SQLiteStorage # noqa
\ No newline at end of file
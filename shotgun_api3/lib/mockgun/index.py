@@ -0,0 +1,236 @@
+"""
+ -----------------------------------------------------------------------------
+ Copyright (c) 2009-2017, Shotgun Software Inc
+
+ Redistribution and use in source and binary forms, with or without
+ modification, are permitted provided that the following conditions are met:
+
+  - Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+  - Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  - Neither the name of the Shotgun Software Inc nor the names of its
+    contributors may be used to endorse or promote products derived from this
+    software without specific prior written permission.
+
+ THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+-----------------------------------------------------------------------------
+"""
+
+import bisect
+import itertools
+from typing import Any, Callable, Iterable, Iterator, Optional, Set, Tuple
+
+
+# Compares greater than any entity id, to find the end of the entries of a key.
+_MAX_ID = float("inf")
+
+
+class HashIndex(object):
+    """
+    Index of the ids of the rows of an entity type by the value of a field.
+
+    Indexes are only used to narrow down the rows a filter is evaluated on, so they
+    may return more rows than the filter matches, but never less.
+    """
+
+    def __init__(self, key_func: Callable[[Any], Any]) -> None:
+        """
+        :param key_func: Function returning the key a value is indexed by. Values
+            which compare equal for the filters must have the same key.
+        """
+        self._key_func = key_func
+        self._rows = {}
+        # Rows holding a value which can't be hashed, candidates for any lookup.
+        self._unhashable = set()
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._rows.values()) + len(self._unhashable)
+
+    def add(self, row_id: int, value: Any) -> None:
+        """
+        Add a row holding the given value to the index.
+        """
+        for key in self._keys(row_id, value):
+            ids = self._rows.get(key)
+            if ids is None or isinstance(ids, frozenset):
+                # Ids restored from a snapshot are shared with it, and copied on write.
+                ids = self._rows[key] = set(ids or ())
+            ids.add(row_id)
+
+    def build(self, rows: Iterable[Tuple[int, Any]]) -> None:
+        """
+        Add the rows given as ``(row_id, value)`` tuples to the index.
+        """
+        for row_id, value in rows:
+            self.add(row_id, value)
+
+    def remove(self, row_id: int, value: Any) -> None:
+        """
+        Remove a row which was added with the given value from the index.
+        """
+        self._unhashable.discard(row_id)
+        for key in self._keys(None, value):
+            ids = self._rows.get(key)
+            if ids is not None and row_id in ids:
+                if isinstance(ids, frozenset):
+                    ids = self._rows[key] = set(ids)
+                ids.discard(row_id)
+                if not ids:
+                    del self._rows[key]
+
+    def snapshot(self) -> Any:
+        """
+        Return the state of the index, to restore it later with restore().
+        """
+        return dict((key, frozenset(ids)) for key, ids in self._rows.items()), frozenset(self._unhashable)
+
+    def restore(self, state: Any) -> None:
+        """
+        Restore the state returned by snapshot(). The sets of ids are shared with the
+        state until they are changed, so only the table of keys is copied.
+        """
+        rows, unhashable = state
+        self._rows = dict(rows)
+        self._unhashable = set(unhashable)
+
+    def lookup(self, values: list) -> Optional[Set[int]]:
+        """
+        Return the ids of the rows holding any of the given values.
+
+        :returns: A set of ids, or ``None`` if the values can't be looked up.
+        """
+        ids = set(self._unhashable)
+        try:
+            for value in values:
+                ids.update(self._rows.get(self._key_func(value), ()))
+        except (TypeError, KeyError):
+            return None
+        return ids
+
+    def _keys(self, row_id: Optional[int], value: Any) -> list:
+        # A row matches a filter if any of the values of a list matches it.
+        values = value if isinstance(value, list) else [value]
+        keys = []
+        for item in values:
+            try:
+                key = self._key_func(item)
+                hash(key)
+            except (TypeError, KeyError):
+                if row_id is not None:
+                    self._unhashable.add(row_id)
+                continue
+            keys.append(key)
+        return keys
+
+
+class SortedIndex(object):
+    """
+    Index of the ids of the rows of an entity type sorted by the value of a field.
+
+    :raises TypeError: When values which can't be compared are added. The index can't
+        be used anymore.
+    """
+
+    def __init__(self, key_func: Callable[[Any], Any]) -> None:
+        """
+        :param key_func: Function returning the key a value is sorted by.
+        """
+        self._key_func = key_func
+        # Sorted list of (key, id) tuples.
+        self._entries = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, row_id: int, value: Any) -> None:
+        """
+        Add a row holding the given value to the index.
+        """
+        bisect.insort(self._entries, (self._key_func(value), row_id))
+
+    def build(self, rows: Iterable[Tuple[int, Any]]) -> None:
+        """
+        Add the rows given as ``(row_id, value)`` tuples to the index, sorting the
+        entries once rather than inserting them one by one.
+        """
+        key_func = self._key_func
+        self._entries.extend((key_func(value), row_id) for row_id, value in rows)
+        self._entries.sort()
+
+    def remove(self, row_id: int, value: Any) -> None:
+        """
+        Remove a row which was added with the given value from the index.
+        """
+        entry = (self._key_func(value), row_id)
+        position = bisect.bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+    def snapshot(self) -> Any:
+        """
+        Return the state of the index, to restore it later with restore().
+        """
+        return tuple(self._entries)
+
+    def restore(self, state: Any) -> None:
+        """
+        Restore the state returned by snapshot().
+        """
+        self._entries = list(state)
+
+    def range(self, low: Any = None, high: Any = None, low_inclusive: bool = True,
+              high_inclusive: bool = True) -> Optional[Set[int]]:
+        """
+        Return the ids of the rows with a value between the given bounds.
+
+        :param low: Lowest value, ``None`` for no lower bound.
+        :param high: Highest value, ``None`` for no upper bound.
+        :returns: A set of ids, or ``None`` if the bounds can't be compared to the
+            values of the index.
+        """
+        try:
+            start = 0
+            end = len(self._entries)
+            if low is not None:
+                if low_inclusive:
+                    start = bisect.bisect_left(self._entries, (low,))
+                else:
+                    start = bisect.bisect_right(self._entries, (low, _MAX_ID))
+            if high is not None:
+                if high_inclusive:
+                    end = bisect.bisect_right(self._entries, (high, _MAX_ID))
+                else:
+                    end = bisect.bisect_left(self._entries, (high,))
+        except TypeError:
+            return None
+        return set(row_id for _, row_id in self._entries[start:end])
+
+    def ordered_ids(self, reverse: bool = False) -> Iterator[int]:
+        """
+        Return the ids of the rows in the order of their values.
+
+        Rows with the same value are always returned in the order of their ids, as a
+        stable sort of rows in id order would.
+        """
+        if not reverse:
+            for _, row_id in self._entries:
+                yield row_id
+            return
+
+        for _, entries in itertools.groupby(reversed(self._entries), key=lambda entry: entry[0]):
+            for _, row_id in reversed(list(entries)):
+                yield row_id
@@ -0,0 +1,470 @@
+"""
+ -----------------------------------------------------------------------------
+ Copyright (c) 2009-2017, Shotgun Software Inc
+
+ Redistribution and use in source and binary forms, with or without
+ modification, are permitted provided that the following conditions are met:
+
+  - Redistributions of source code must retain the above copyright notice, this
+    list of conditions and the following disclaimer.
+
+  - Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+  - Neither the name of the Shotgun Software Inc nor the names of its
+    contributors may be used to endorse or promote products derived from this
+    software without specific prior written permission.
+
+ THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+ DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+ FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+ DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+ SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+-----------------------------------------------------------------------------
+"""
+
+import pickle
+import sqlite3
+import threading
+import urllib.parse
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Iterator, Optional, Tuple
+
+from .errors import MockgunError
+
+
+# Field types which get a column of their own, so that filters on them can be
+# evaluated by SQLite.
+_COLUMN_TYPES = ("checkbox", "number", "float", "text", "entity_type", "list", "status_list", "entity")
+
+# Columns which are not fields.
+_RESERVED_COLUMNS = ("id", "__retired", "__loose", "__row")
+
+# Number of rows fetched at once when iterating over the rows of a query.
+_FETCH_SIZE = 1000
+
+# Limits of the integers SQLite can store.
+_MIN_INTEGER = -(2 ** 63)
+_MAX_INTEGER = 2 ** 63 - 1
+
+
+class _Unsupported(Exception):
+    """
+    Raised when a value can't be stored in a column or a filter can't be expressed in SQL.
+    """
+
+
+def _quote(name: str) -> str:
+    return '"%s"' % name.replace('"', '""')
+
+
+def _to_column(field_type: str, value: Any) -> Any:
+    """
+    Return the value stored in the column of a field for a value.
+
+    Values are converted so that two values compare equal in SQL when they compare
+    equal for the filters of Mockgun.
+
+    :raises _Unsupported: If the value can't be stored in a column.
+    """
+    if value is None:
+        return None
+    elif field_type in ("number", "float"):
+        if isinstance(value, int) and _MIN_INTEGER <= value <= _MAX_INTEGER:
+            return value
+        elif isinstance(value, float):
+            return value
+    elif field_type == "checkbox":
+        if isinstance(value, bool):
+            return int(value)
+    elif field_type == "text":
+        # Text comparisons are case insensitive.
+        if isinstance(value, str):
+            return value.lower()
+    elif field_type in ("entity_type", "list", "status_list"):
+        if isinstance(value, str):
+            return value
+    elif field_type == "entity":
+        if (
+            isinstance(value, dict)
+            and isinstance(value.get("type"), str)
+            and type(value.get("id")) is int
+        ):
+            return "%s:%d" % (value["type"], value["id"])
+    raise _Unsupported()
+
+
+class SQLiteStorage(Mapping):
+    """
+    Mockgun database kept in a SQLite file, to be passed as the ``storage`` of a
+    Mockgun instance::
+
+        storage = SQLiteStorage("/tmp/fixture.sqlite")
+        sg = Shotgun("https://mysite.shotgunstudio.com", storage=storage)
+
+    It maps entity types to tables which behave like the dictionaries of the default
+    in-memory database. Each row is pickled along with a column for each field which
+    can be filtered in SQL, so that find() only loads the rows which may match.
+
+    Changes are only visible to other connections to the file once commit() is called.
+
+    The storage can be used from several threads: the connection is shared and each
+    query holds a lock while it runs.
+    """
+
+    def __init__(self, path: str, read_only: bool = False, mmap_size: int = 256 * 1024 * 1024) -> None:
+        """
+        :param str path: Path of the SQLite file, created if needed.
+        :param bool read_only: Open the file in read-only mode, for example to share a
+            fixture between several test processes.
+        :param int mmap_size: Size of the file which is memory-mapped when reading it.
+        """
+        self.path = path
+        self.read_only = read_only
+        # guards the connection, which is shared by the threads using the storage
+        self._lock = threading.RLock()
+        if read_only:
+            self._connection = sqlite3.connect(
+                "file:%s?mode=ro" % urllib.parse.quote(path), uri=True, check_same_thread=False
+            )
+        else:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA mmap_size = %d" % mmap_size)
+        self._tables = {}
+        # number of the last snapshot, to name their savepoints
+        self._snapshots = 0
+
+    def __getitem__(self, entity_type: str) -> "SQLiteTable":
+        return self._tables[entity_type]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def load_schema(self, schema: dict) -> None:
+        """
+        Create the tables of the entity types of a schema which don't exist yet.
+
+        Tables which already exist are used as they are, so filters on fields added to
+        the schema since they were created are only evaluated by Mockgun.
+
+        :param dict schema: Schema of the fields of each entity type, as returned by
+            schema_read().
+        """
+        for entity_type, fields in schema.items():
+            table_name = _quote(entity_type)
+            with self._lock:
+                table_columns = [
+                    row[1] for row in self._connection.execute("PRAGMA table_info(%s)" % table_name).fetchall()
+                ]
+                if not table_columns:
+                    if self.read_only:
+                        raise MockgunError("Table %s is missing from read-only storage %s" % (entity_type, self.path))
+                    table_columns = list(fields)
+                    columns = self._get_columns(fields, table_columns)
+                    self._connection.execute(
+                        'CREATE TABLE %s (id INTEGER PRIMARY KEY, "__retired" INTEGER, "__loose" INTEGER, '
+                        '"__row" BLOB%s)' % (table_name, "".join(", %s" % _quote(field) for field in columns))
+                    )
+                    for field in columns:
+                        index_name = _quote("%s.%s" % (entity_type, field))
+                        self._connection.execute(
+                            "CREATE INDEX %s ON %s (%s)" % (index_name, table_name, _quote(field))
+                        )
+                    self._connection.commit()
+
+            self._tables[entity_type] = SQLiteTable(self, entity_type, self._get_columns(fields, table_columns))
+
+    def _get_columns(self, fields: dict, names: list) -> dict:
+        """
+        Return the field types of the fields among the given names which can have a column.
+        """
+        return dict(
+            (field, fields[field]["data_type"]["value"])
+            for field in names
+            if field in fields
+            and field not in _RESERVED_COLUMNS
+            and fields[field]["data_type"]["value"] in _COLUMN_TYPES
+        )
+
+    def commit(self) -> None:
+        """
+        Commit the changes made to the database to the file.
+
+        Snapshots taken before can't be restored anymore.
+        """
+        with self._lock:
+            self._connection.commit()
+
+    def snapshot(self) -> str:
+        """
+        Capture the state of the database in a savepoint.
+
+        :returns: The name of the savepoint.
+        """
+        with self._lock:
+            self._snapshots += 1
+            name = "mockgun_snapshot_%d" % self._snapshots
+            self._connection.execute("SAVEPOINT %s" % name)
+        return name
+
+    def restore(self, snapshot: str) -> None:
+        """
+        Restore the state of the database captured by snapshot().
+
+        Snapshots taken after the restored one can't be restored anymore.
+
+        :raises MockgunError: If the snapshot is not available anymore.
+        """
+        if not isinstance(snapshot, str) or not snapshot.startswith("mockgun_snapshot_"):
+            raise MockgunError("Snapshots of the in-memory database can't be restored in %s" % self.path)
+        try:
+            with self._lock:
+                self._connection.execute("ROLLBACK TO %s" % _quote(snapshot))
+        except sqlite3.OperationalError:
+            raise MockgunError("Snapshot %s is not available anymore" % snapshot)
+
+    def close(self) -> None:
+        """
+        Commit the changes made to the database and close the file.
+        """
+        with self._lock:
+            if not self.read_only:
+                self._connection.commit()
+            self._connection.close()
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        Run a statement, reporting the writes refused by read-only storage.
+        """
+        try:
+            with self._lock:
+                return self._connection.execute(sql, params)
+        except sqlite3.OperationalError as e:
+            if self.read_only:
+                raise MockgunError("Storage %s is read-only: %s" % (self.path, e))
+            raise
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """
+        Run a query and return its first row, ``None`` if it has none.
+        """
+        with self._lock:
+            return self._execute(sql, params).fetchone()
+
+    def _fetch(self, sql: str, params: tuple = ()) -> Iterator[tuple]:
+        """
+        Run a query and yield its rows.
+
+        Rows are fetched in batches, holding the lock, so that other threads can use the
+        connection while the rows are processed.
+        """
+        with self._lock:
+            cursor = self._execute(sql, params)
+            rows = cursor.fetchmany(_FETCH_SIZE)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_SIZE)
+
+
+class SQLiteTable(MutableMapping):
+    """
+    Rows of an entity type in a SQLite database, by id.
+
+    Rows are unpickled each time they are read, so changes made to a row must be saved by
+    setting it again.
+    """
+
+    def __init__(self, storage: SQLiteStorage, entity_type: str, columns: dict) -> None:
+        """
+        :param storage: Database of the table.
+        :param str entity_type: Entity type of the rows.
+        :param dict columns: Field types of the fields which have a column.
+        """
+        self._storage = storage
+        self._name = _quote(entity_type)
+        self._columns = columns
+        self._insert = 'INSERT OR REPLACE INTO %s (id, "__retired", "__loose", "__row"%s) VALUES (?, ?, ?, ?%s)' % (
+            self._name,
+            "".join(", %s" % _quote(field) for field in columns),
+            ", ?" * len(columns),
+        )
+
+    def __getitem__(self, row_id: int) -> dict:
+        result = self._storage._fetchone("SELECT \"__row\" FROM %s WHERE id = ?" % self._name, (row_id,))
+        if result is None:
+            raise KeyError(row_id)
+        return pickle.loads(result[0])
+
+    def __setitem__(self, row_id: int, row: dict) -> None:
+        loose = False
+        values = []
+        for field, field_type in self._columns.items():
+            try:
+                values.append(_to_column(field_type, row.get(field)))
+            except _Unsupported:
+                # The filters on this row can't be evaluated in SQL.
+                loose = True
+                values.append(None)
+        self._storage._execute(
+            self._insert,
+            (row_id, int(bool(row.get("__retired"))), int(loose), pickle.dumps(row, pickle.HIGHEST_PROTOCOL))
+            + tuple(values),
+        )
+
+    def __delitem__(self, row_id: int) -> None:
+        if self._storage._execute("DELETE FROM %s WHERE id = ?" % self._name, (row_id,)).rowcount == 0:
+            raise KeyError(row_id)
+
+    def __contains__(self, row_id: Any) -> bool:
+        try:
+            return self._storage._fetchone("SELECT 1 FROM %s WHERE id = ?" % self._name, (row_id,)) is not None
+        except sqlite3.InterfaceError:
+            return False
+
+    def __iter__(self) -> Iterator[int]:
+        for (row_id,) in self._storage._fetch("SELECT id FROM %s ORDER BY id" % self._name):
+            yield row_id
+
+    def __len__(self) -> int:
+        return self._storage._fetchone("SELECT COUNT(*) FROM %s" % self._name)[0]
+
+    def values(self) -> Iterator[dict]:
+        """
+        Return the rows of the table, in the order of their ids.
+        """
+        return self.select()
+
+    def max_id(self) -> int:
+        """
+        Return the highest id of the table, ``0`` if it is empty.
+        """
+        return self._storage._fetchone("SELECT MAX(id) FROM %s" % self._name)[0] or 0
+
+    def select(self, filters: Optional[list] = None, filter_operator: Optional[str] = None,
+               retired_only: Optional[bool] = None) -> Iterator[dict]:
+        """
+        Return the rows which may match filters, in the order of their ids.
+
+        The filters which can be expressed in SQL are evaluated by SQLite. The rows
+        returned still need to be checked against all the filters.
+
+        :param list filters: Filters, in the syntax of find().
+        :param str filter_operator: Operator combining the filters.
+        :param bool retired_only: Whether to return the retired rows or the live rows,
+            ``None`` for both.
+        """
+        conditions = []
+        params = []
+        if retired_only is not None:
+            conditions.append('"__retired" = ?')
+            params.append(int(bool(retired_only)))
+        if filters:
+            try:
+                condition, filter_params = self._get_condition(filters, filter_operator)
+            except _Unsupported:
+                pass
+            else:
+                conditions.append('(%s OR "__loose")' % condition)
+                params.extend(filter_params)
+
+        sql = 'SELECT "__row" FROM %s' % self._name
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        for (row,) in self._storage._fetch(sql + " ORDER BY id", tuple(params)):
+            yield pickle.loads(row)
+
+    def _get_condition(self, filters: Any, filter_operator: Optional[str]) -> Tuple[str, list]:
+        """
+        Return the SQL condition matching at least the rows matching filters.
+
+        :raises _Unsupported: If no rows can be ruled out.
+        """
+        if filter_operator in ("all", None):
+            any_filter = False
+        elif filter_operator == "any":
+            any_filter = True
+        else:
+            raise _Unsupported()
+        if not isinstance(filters, (list, tuple)):
+            raise _Unsupported()
+
+        conditions = []
+        params = []
+        for sg_filter in filters:
+            try:
+                condition, filter_params = self._get_filter_condition(sg_filter)
+            except _Unsupported:
+                # Any row may match this filter.
+                if any_filter:
+                    raise
+                continue
+            conditions.append(condition)
+            params.extend(filter_params)
+
+        if not conditions:
+            raise _Unsupported()
+        return "(%s)" % (" OR " if any_filter else " AND ").join(conditions), params
+
+    def _get_filter_condition(self, sg_filter: Any) -> Tuple[str, list]:
+        if isinstance(sg_filter, dict):
+            if "filter_operator" not in sg_filter or "filters" not in sg_filter:
+                raise _Unsupported()
+            return self._get_condition(sg_filter["filters"], sg_filter["filter_operator"])
+        if not isinstance(sg_filter, list) or len(sg_filter) < 3:
+            raise _Unsupported()
+
+        field, operator = sg_filter[0], sg_filter[1]
+        # same as Shotgun._rearrange_filters
+        if len(sg_filter) > 3:
+            rval = sg_filter[2:]
+        elif operator == "in" and not isinstance(sg_filter[2], list):
+            rval = [sg_filter[2]]
+        else:
+            rval = sg_filter[2]
+
+        field_type = self._columns.get(field)
+        if field_type is None:
+            raise _Unsupported()
+        column = _quote(field)
+
+        if operator == "is":
+            value = _to_column(field_type, rval)
+            if value is None:
+                return "%s IS NULL" % column, []
+            return "%s = ?" % column, [value]
+        elif operator == "in" and field_type in ("number", "float", "text", "list", "status_list"):
+            values = [_to_column(field_type, value) for value in rval]
+            conditions = []
+            if None in values:
+                conditions.append("%s IS NULL" % column)
+                values = [value for value in values if value is not None]
+            if values:
+                conditions.append("%s IN (%s)" % (column, ", ".join("?" * len(values))))
+            if not conditions:
+                raise _Unsupported()
+            return "(%s)" % " OR ".join(conditions), values
+        elif operator in ("less_than", "greater_than", "between") and field_type in ("number", "float"):
+            # Rows without a value are kept, so that comparing them fails as usual.
+            if operator == "between":
+                if not isinstance(rval, (list, tuple)) or len(rval) != 2:
+                    raise _Unsupported()
+                values = [_to_column(field_type, value) for value in rval]
+                if None in values:
+                    raise _Unsupported()
+                return "(%s BETWEEN ? AND ? OR %s IS NULL)" % (column, column), values
+            value = _to_column(field_type, rval)
+            if value is None:
+                raise _Unsupported()
+            return "(%s %s ? OR %s IS NULL)" % (column, "<" if operator == "less_than" else ">", column), [value]
+        raise _Unsupported()
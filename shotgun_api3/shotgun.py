@@ -31,9 +31,13 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from __future__ import annotations  # Required for compatibility with Python 3.7
 
+import array
 import base64
+import collections
+import concurrent.futures
 import copy
 import datetime
+import hashlib
 import json
 import http.client  # Used for secure file upload
 import http.cookiejar  # used for attachment upload
@@ -46,6 +50,7 @@ import shutil  # used for attachment download
 import ssl
 import stat  # used for attachment upload
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
@@ -55,8 +60,10 @@ import xml.etree.ElementTree
 from typing import (
     Any,
     BinaryIO,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -90,6 +97,11 @@ SG_TIMEZONE = SgTimezone()
 
 SHOTGUN_API_DISABLE_ENTITY_OPTIMIZATION = False
 
+# Results of info() shared by the Shotgun instances of the process, by server url.
+# Values are tuples of the time the info was read at and the info.
+_SERVER_INFO_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_SERVER_INFO_CACHE_LOCK = threading.Lock()
+
 
 # ----------------------------------------------------------------------------
 # Version
@@ -151,6 +163,36 @@ class ShotgunThumbnailNotReady(ShotgunError):
     pass
 
 
+class ShotgunBatchError(ShotgunError):
+    """
+    Exception when some chunks of a batch request failed.
+
+    :ivar list results: Results of the batch requests, in the order of the requests.
+        Requests of chunks which failed or were not sent have a ``None`` result.
+    :ivar list errors: List of ``(start, stop, exception)`` tuples, one for each chunk
+        which failed, where ``requests[start:stop]`` were the requests of the chunk.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        results: List[Any],
+        errors: List[Tuple[int, int, Exception]],
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+
+class _UploadNotFoundError(ShotgunError):
+    """
+    Exception when the server or the storage no longer knows a multipart upload,
+    because it expired or was aborted.
+    """
+
+    pass
+
+
 class Fault(ShotgunError):
     """
     Exception when server-side exception detected.
@@ -412,6 +454,91 @@ class _Config(object):
         self.api_ver = "api3"
         self.convert_datetimes_to_utc = True
         self._records_per_page: Optional[int] = None
+        # read_page_workers is the number of pages find() and find_iter() may
+        # request from the server at the same time when a query spans several
+        # pages. Records are still returned in order. By default, pages are
+        # read one after the other. You can opt in to concurrent reads by
+        # setting this property on the config like so:
+        #
+        #      sg.config.read_page_workers = 4
+        self.read_page_workers = 1
+        # batch_workers is the number of chunks batch() sends to the server at
+        # the same time when it is called with sequential=False.
+        self.batch_workers = 4
+        # upload_part_workers is the number of parts of a large file uploaded
+        # to the Cloud storage at the same time. By default, parts are uploaded
+        # one after the other.
+        #
+        #      sg.config.upload_part_workers = 4
+        self.upload_part_workers = 1
+        # When upload_state_dir is set, the progress of multipart uploads is
+        # saved to a small state file in this directory. If such an upload
+        # fails, calling upload() again with the same unchanged file resumes it
+        # from the first part which was not uploaded. The state file is removed
+        # once the upload succeeds.
+        #
+        #      sg.config.upload_state_dir = "/tmp/sg_uploads"
+        self.upload_state_dir: Optional[str] = None
+        # upload_state_ttl is the number of seconds after which the saved state
+        # of an upload expires, since the upload urls it holds stop working.
+        # Expired uploads, and uploads the server or the storage no longer
+        # knows, are started over. Other errors keep the saved state.
+        self.upload_state_ttl = 6 * 3600
+        # download_part_workers is the number of HTTP Range requests
+        # download_attachment() sends at the same time when it writes an
+        # attachment to disk. By default, attachments are downloaded in a
+        # single stream.
+        #
+        #      sg.config.download_part_workers = 8
+        self.download_part_workers = 1
+        # When attachment_cache_dir is set, downloaded attachments are kept
+        # in this directory and served from it when they are downloaded again.
+        # attachment_cache_size is the maximum size of the cache in bytes, the
+        # least recently used attachments being evicted first. The directory
+        # can be shared by several processes.
+        #
+        #      sg.config.attachment_cache_dir = "/var/cache/sg_attachments"
+        self.attachment_cache_dir: Optional[str] = None
+        self.attachment_cache_size = 10 * 1024 * 1024 * 1024
+        # Files downloaded through the attachment cache are copies of the cached
+        # files. When attachment_cache_hard_links is True, they are hard links to
+        # the read only files of the cache instead, when the file system allows
+        # it. This saves time and disk space, but the downloaded files must not
+        # be modified since the cache would then be corrupted.
+        self.attachment_cache_hard_links = False
+        # When schema_cache_dir is set, the results of schema_read(),
+        # schema_entity_read() and schema_field_read() are kept in this
+        # directory for each server and project, and read again from it until
+        # the server version changes. Entries older than schema_cache_ttl
+        # seconds are still returned, while they are read again from the server
+        # in the background. Set schema_cache_ttl to None to only refresh them
+        # when the server version changes.
+        #
+        #      sg.config.schema_cache_dir = "/var/cache/sg_schema"
+        self.schema_cache_dir: Optional[str] = None
+        self.schema_cache_ttl: Optional[float] = 3600
+        # When schema_datetime_decoding is True, find() reads the schema of the
+        # entity types it queries once, and only converts the values of their
+        # date_time fields to datetime objects, instead of checking every string
+        # it receives. Use it along with schema_cache_dir to avoid reading the
+        # schema each time a new instance is created.
+        self.schema_datetime_decoding = False
+        # server_info_cache_ttl is the number of seconds the result of info()
+        # is shared by the Shotgun instances of the process connecting to the
+        # same server, 0 to disable. When server_info_cache_dir is also set,
+        # the result is shared with other processes through this directory.
+        # Both are read from the SHOTGUN_API_SERVER_INFO_CACHE_TTL and
+        # SHOTGUN_API_SERVER_INFO_CACHE_DIR environment variables, so that new
+        # instances can start without any request to the server.
+        self.server_info_cache_ttl: float = 0
+        self.server_info_cache_dir: Optional[str] = None
+        # A Shotgun instance can be shared between threads, each thread checking
+        # a connection to the server out of a pool for the duration of a request.
+        # connection_pool_size is the number of idle connections kept open for
+        # reuse once released, and connection_idle_timeout the number of seconds
+        # after which an idle connection is closed instead of being reused.
+        self.connection_pool_size = 10
+        self.connection_idle_timeout: Optional[float] = 60
         self.api_key: Optional[str] = None
         self.script_name: Optional[str] = None
         self.user_login: Optional[str] = None
@@ -477,6 +604,630 @@ class _Config(object):
         return self._records_per_page
 
 
+class _ConnectionPool(object):
+    """
+    Pool of the connections to the server used by a Shotgun instance.
+
+    Each thread checks out its own connection, so that requests made at the same
+    time by different threads don't share an :class:`Http` object. Released
+    connections are kept open for reuse, which avoids new TLS handshakes.
+    """
+
+    def __init__(self, config: _Config):
+        """
+        :param config: Client configuration holding the pool settings.
+        """
+        self._config = config
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Idle connections as (release time, connection) tuples, oldest first.
+        self._idle: "collections.deque[Tuple[float, Http]]" = collections.deque()
+        # Incremented when the pool is drained, so connections checked out
+        # before are closed instead of being returned to the pool.
+        self._generation = 0
+
+    def current(self) -> Optional[Http]:
+        """
+        Return the connection checked out by the current thread, if any.
+        """
+        return getattr(self._local, "connection", None)
+
+    def set_current(self, connection: Optional[Http]) -> None:
+        """
+        Set the connection checked out by the current thread.
+        """
+        self._local.connection = connection
+        self._local.generation = self._generation
+
+    def checkout(self, create) -> Http:
+        """
+        Return the current thread's connection, checking one out if needed.
+
+        :param create: Callable creating a new connection when no idle one is available.
+        """
+        connection = self.current()
+        if connection is not None:
+            return connection
+
+        with self._lock:
+            self._evict_idle()
+            if self._idle:
+                connection = self._idle.pop()[1]
+
+        if connection is None:
+            connection = create()
+        self.set_current(connection)
+        return connection
+
+    def release(self) -> None:
+        """
+        Return the current thread's connection to the idle connections.
+        """
+        connection = self.current()
+        if connection is None:
+            return
+        generation = self._local.generation
+        self._local.connection = None
+
+        with self._lock:
+            if (
+                generation == self._generation
+                and len(self._idle) < self._config.connection_pool_size
+            ):
+                self._idle.append((time.time(), connection))
+                return
+        self._close(connection)
+
+    def discard(self) -> None:
+        """
+        Close the current thread's connection, after a failed request for example.
+
+        The idle connections and the connections of other threads are kept.
+        """
+        connection = self.current()
+        self._local.connection = None
+        if connection is not None:
+            self._close(connection)
+
+    def drain(self) -> None:
+        """
+        Close the current thread's connection and all the idle connections.
+        """
+        with self._lock:
+            self._generation += 1
+            idle = [connection for _, connection in self._idle]
+            self._idle.clear()
+
+        connection = self.current()
+        self._local.connection = None
+        if connection is not None:
+            idle.append(connection)
+        for connection in idle:
+            self._close(connection)
+
+    def _evict_idle(self) -> None:
+        """
+        Close the connections which have been idle for too long.
+
+        Must be called with the lock held.
+        """
+        timeout = self._config.connection_idle_timeout
+        if timeout is None:
+            return
+        expiry = time.time() - timeout
+        while self._idle and self._idle[0][0] < expiry:
+            self._close(self._idle.popleft()[1])
+
+    @staticmethod
+    def _close(connection: Http) -> None:
+        """
+        Close all the underlying connections of an :class:`Http` object.
+        """
+        for conn in connection.connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        connection.connections.clear()
+
+
+class _FileRegion(io.RawIOBase):
+    """
+    Read-only stream over a region of a file.
+
+    Data is read from the file as the stream is consumed, so that a part of a large
+    file can be sent without loading it in memory first.
+    """
+
+    def __init__(self, path: str, offset: int, size: int) -> None:
+        """
+        :param str path: Full path to the file.
+        :param int offset: Position of the region in the file.
+        :param int size: Size of the region in bytes.
+        """
+        super().__init__()
+        self._fh = open(path, "rb")
+        self._offset = offset
+        self._size = size
+        self._position = 0
+        self._fh.seek(offset)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._size
+        self._position = max(0, min(position, self._size))
+        self._fh.seek(self._offset + self._position)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._size - self._position)
+        if size <= 0:
+            return 0
+        with memoryview(buffer) as view:
+            size = self._fh.readinto(view[:size])
+        self._position += size
+        return size
+
+    def close(self) -> None:
+        self._fh.close()
+        super().close()
+
+
+class _UploadState(object):
+    """
+    Progress of a multipart upload, saved to a file so that the upload can be resumed.
+
+    The state file name is derived from the server, the path, size and modification
+    time of the uploaded file, and the size of the parts. Any change to the file
+    starts a new upload.
+    """
+
+    def __init__(
+        self,
+        state_dir: str,
+        server: str,
+        path: str,
+        is_thumbnail: bool,
+        part_size: int,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Load the state of a previous upload of the file, if any.
+
+        :param str state_dir: Directory holding the state files.
+        :param str server: Server the file is uploaded to.
+        :param str path: Full path to the uploaded file.
+        :param bool is_thumbnail: Whether the file is uploaded as a thumbnail.
+        :param int part_size: Size in bytes of the parts of the upload.
+        :param float ttl: Number of seconds after which a saved upload expires and is
+            discarded, ``None`` for no limit.
+        """
+        file_stat = os.stat(path)
+        self._key = {
+            "server": server,
+            "path": path,
+            "size": file_stat.st_size,
+            "mtime": file_stat.st_mtime_ns,
+            "is_thumbnail": is_thumbnail,
+            "part_size": part_size,
+        }
+        digest = hashlib.sha1(
+            json.dumps(self._key, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.path = os.path.join(state_dir, "%s.json" % digest)
+        self._lock = threading.Lock()
+        self._ttl = ttl
+        # upload_info returned by the server, None until the upload is started.
+        self.upload_info: Optional[Dict[str, Any]] = None
+        # Time at which upload_info was received.
+        self.started: Optional[float] = None
+        # Etags of the uploaded parts, by part number.
+        self.etags: Dict[int, str] = {}
+        # Whether all the parts were uploaded and the upload completed.
+        self.completed = False
+        self._load()
+
+    def start(self, upload_info: Dict[str, Any]) -> None:
+        """
+        Record the start of a new upload.
+        """
+        with self._lock:
+            self.upload_info = upload_info
+            self.started = time.time()
+            self.etags = {}
+            self.completed = False
+            self._save()
+
+    def add_part(self, part_number: int, etag: str) -> None:
+        """
+        Record the upload of a part.
+        """
+        with self._lock:
+            self.etags[part_number] = etag
+            self._save()
+
+    def complete(self) -> None:
+        """
+        Record the completion of the upload, before the file is linked to its entity.
+        """
+        with self._lock:
+            self.completed = True
+            self._save()
+
+    def remove(self) -> None:
+        """
+        Remove the state file once the upload is done, or when it can't be resumed.
+        """
+        self.upload_info = None
+        self.started = None
+        self.etags = {}
+        self.completed = False
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as fh:
+                state = json.load(fh)
+        except (OSError, ValueError):
+            return
+
+        if state.get("key") != self._key:
+            return
+        started = state.get("started")
+        if started is None or (
+            self._ttl is not None and time.time() - started > self._ttl
+        ):
+            # The upload urls of the saved upload_info have expired.
+            self.remove()
+            return
+        self.started = started
+        self.upload_info = state["upload_info"]
+        self.etags = dict((int(n), etag) for n, etag in state["etags"].items())
+        self.completed = state["completed"]
+
+    def _save(self) -> None:
+        state = {
+            "key": self._key,
+            "upload_info": self.upload_info,
+            "started": self.started,
+            "etags": self.etags,
+            "completed": self.completed,
+        }
+        try:
+            _atomic_write_json(self.path, state)
+        except OSError as e:
+            # The upload can go on, it just can't be resumed.
+            LOG.warning("Unable to save upload state to %s: %s", self.path, e)
+
+
+class _AttachmentCache(object):
+    """
+    Content addressed cache of downloaded attachments.
+
+    The content of each attachment is stored once in ``objects/<sha256>``, whatever
+    the number of keys pointing to it. Each key is stored in its own file in ``keys``,
+    so that several processes can share the cache without a common index. The
+    modification time of the objects is updated on each hit and the least recently
+    used objects are evicted first.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param str path: Directory of the cache.
+        """
+        self.path = path
+        self._objects_dir = os.path.join(path, "objects")
+        self._keys_dir = os.path.join(path, "keys")
+        self._tmp_dir = os.path.join(path, "tmp")
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def temp_path(self) -> str:
+        """
+        Return a unique path to download a file to, on the same file system as the
+        objects of the cache.
+        """
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        return os.path.join(self._tmp_dir, uuid.uuid4().hex)
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the entry stored for the given key, or None if there is no entry or
+        its object has been evicted.
+        """
+        try:
+            with open(self._key_path(key), "r") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key or not os.path.exists(
+            self._object_path(entry["digest"])
+        ):
+            return None
+        return entry
+
+    def store(
+        self, key: str, path: str, validator: Optional[str], max_size: int
+    ) -> Dict[str, Any]:
+        """
+        Move the downloaded file at ``path`` to the cache and record it for the key.
+
+        :param str key: Key of the downloaded file.
+        :param str path: Path to the downloaded file, on the file system of the cache.
+        :param str validator: ETag or Last-Modified header of the response, if any.
+        :param int max_size: Size in bytes above which objects are evicted.
+        :returns: The new entry.
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+        object_path = self._object_path(digest)
+        os.makedirs(self._objects_dir, exist_ok=True)
+        if os.path.exists(object_path):
+            os.utime(object_path)
+        else:
+            # Objects are read only since they may be hard linked to the user files.
+            os.chmod(path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(path, object_path)
+
+        entry = {
+            "key": key,
+            "digest": digest,
+            "validator": validator,
+            "size": os.path.getsize(object_path),
+        }
+        _atomic_write_json(self._key_path(key), entry)
+        self._evict(max_size, keep=digest)
+        return entry
+
+    def hit(
+        self, entry: Dict[str, Any], file_path: Optional[str], hard_link: bool = False
+    ) -> Union[str, bytes]:
+        """
+        Serve a cached entry and count a hit.
+        """
+        with self._lock:
+            self.hits += 1
+        return self._serve(entry, file_path, hard_link)
+
+    def miss(
+        self, entry: Dict[str, Any], file_path: Optional[str], hard_link: bool = False
+    ) -> Union[str, bytes]:
+        """
+        Serve a newly stored entry and count a miss.
+        """
+        with self._lock:
+            self.misses += 1
+        return self._serve(entry, file_path, hard_link)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the cache and the size of its objects.
+        """
+        entries = 0
+        size = 0
+        for _, file_stat in self._objects():
+            entries += 1
+            size += file_stat.st_size
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size": size,
+            }
+
+    def _serve(
+        self, entry: Dict[str, Any], file_path: Optional[str], hard_link: bool
+    ) -> Union[str, bytes]:
+        """
+        Return the content of an entry, or write it to ``file_path``.
+
+        :param bool hard_link: Whether ``file_path`` can be a hard link to the read only
+            object of the cache, rather than a copy of it.
+        """
+        object_path = self._object_path(entry["digest"])
+        try:
+            os.utime(object_path)
+        except OSError:
+            pass
+        if file_path is None:
+            with open(object_path, "rb") as fh:
+                return fh.read()
+
+        if os.path.lexists(file_path):
+            os.remove(file_path)
+        if hard_link:
+            try:
+                os.link(object_path, file_path)
+                return file_path
+            except OSError:
+                # Different file system, or hard links are not supported.
+                pass
+        # The copy is writable, unlike the object.
+        shutil.copyfile(object_path, file_path)
+        return file_path
+
+    def _evict(self, max_size: int, keep: str) -> None:
+        objects = sorted(self._objects(), key=lambda item: item[1].st_mtime)
+        size = sum(file_stat.st_size for _, file_stat in objects)
+        for name, file_stat in objects:
+            if size <= max_size:
+                break
+            if name == keep:
+                continue
+            try:
+                os.remove(os.path.join(self._objects_dir, name))
+            except OSError:
+                continue
+            size -= file_stat.st_size
+            with self._lock:
+                self.evictions += 1
+        # Keys pointing to evicted objects are ignored by lookup() and replaced on
+        # the next download.
+
+    def _objects(self) -> List[Tuple[str, os.stat_result]]:
+        objects = []
+        try:
+            names = os.listdir(self._objects_dir)
+        except OSError:
+            return objects
+        for name in names:
+            try:
+                objects.append((name, os.stat(os.path.join(self._objects_dir, name))))
+            except OSError:
+                pass
+        return objects
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest)
+
+    def _key_path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._keys_dir, "%s.json" % digest)
+
+
+class _SchemaCache(object):
+    """
+    On disk cache of the results of the schema read methods.
+
+    Entries are stored in one file per request, in a directory per server so that all
+    the entries of a server can be invalidated at once. An entry is valid for the server
+    version it was read from. Expired entries are still returned while they are
+    refreshed in the background.
+    """
+
+    def __init__(self, path: str, server: str) -> None:
+        """
+        :param str path: Directory of the cache.
+        :param str server: Server the schema is read from.
+        """
+        self.path = path
+        self.server = server
+        self._dir = os.path.join(
+            path, hashlib.sha1(server.encode("utf-8")).hexdigest()
+        )
+        self._lock = threading.Lock()
+        # Background refreshes in progress, by key.
+        self.refreshing: Dict[str, threading.Thread] = {}
+
+    def get(
+        self, key: str, server_version: Optional[Tuple[int, ...]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the entry stored for the given key, or None if there is no entry or it
+        was read from another server version.
+
+        The entry holds the ``value`` and the ``time`` it was stored at. Its
+        ``datetimes`` item is ``True`` when dates and times of the value are stored as
+        strings, in the format they are received from the server in.
+        """
+        try:
+            with open(self._entry_path(key), "r") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != key or entry.get("server_version") != (
+            list(server_version) if server_version else None
+        ):
+            return None
+        return entry
+
+    def set(
+        self, key: str, server_version: Optional[Tuple[int, ...]], value: Any
+    ) -> None:
+        """
+        Store the value for the given key.
+        """
+        datetimes = []
+
+        def _encode_datetime(obj):
+            if not isinstance(obj, datetime.datetime):
+                raise TypeError("%r is not JSON serializable" % (obj,))
+            datetimes.append(obj)
+            if obj.tzinfo:
+                obj = obj.astimezone(SG_TIMEZONE.utc)
+            return obj.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        path = self._entry_path(key)
+        try:
+            # The value is encoded first to know whether it holds datetimes, and is
+            # not encoded again when the entry is written.
+            data = json.dumps(value, default=_encode_datetime)
+            _atomic_write(
+                path,
+                '{"key": %s, "server_version": %s, "time": %r, '
+                '"datetimes": %s, "value": %s}'
+                % (
+                    json.dumps(key),
+                    json.dumps(list(server_version) if server_version else None),
+                    time.time(),
+                    json.dumps(bool(datetimes)),
+                    data,
+                ),
+            )
+        except (OSError, TypeError) as e:
+            LOG.warning("Unable to save schema cache entry to %s: %s", path, e)
+
+    def refresh(self, key: str, read: Callable[[], Any]) -> None:
+        """
+        Call ``read`` in a background thread, unless the key is already being refreshed.
+        """
+
+        def _refresh():
+            try:
+                read()
+            except Exception as e:
+                LOG.warning("Unable to refresh schema cache: %s", e)
+            finally:
+                with self._lock:
+                    self.refreshing.pop(key, None)
+
+        with self._lock:
+            if key in self.refreshing:
+                return
+            thread = threading.Thread(target=_refresh, daemon=True)
+            self.refreshing[key] = thread
+        thread.start()
+
+    def clear(self) -> None:
+        """
+        Remove all the entries of the server.
+        """
+        try:
+            names = os.listdir(self._dir)
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(self._dir, name))
+            except OSError:
+                pass
+
+    def _entry_path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._dir, "%s.json" % digest)
+
+
 class Shotgun(object):
     """
     Shotgun Client connection.
@@ -492,6 +1243,7 @@ class Shotgun(object):
     )
 
     _MULTIPART_UPLOAD_CHUNK_SIZE = 20000000
+    _DOWNLOAD_PART_SIZE = 16 * 1024 * 1024
     MAX_ATTEMPTS = 3  # Retries on failure
     BACKOFF = 0.75  # Seconds to wait before retry, times the attempt number
 
@@ -648,6 +1400,20 @@ class Shotgun(object):
                 "got '%s'." % self.config.rpc_attempt_interval
             )
 
+        try:
+            self.config.server_info_cache_ttl = float(
+                os.environ.get("SHOTGUN_API_SERVER_INFO_CACHE_TTL", 0)
+            )
+        except ValueError:
+            raise ValueError(
+                "Invalid value '%s' found in environment variable "
+                "SHOTGUN_API_SERVER_INFO_CACHE_TTL, must be a number."
+                % os.environ.get("SHOTGUN_API_SERVER_INFO_CACHE_TTL")
+            )
+        self.config.server_info_cache_dir = (
+            os.environ.get("SHOTGUN_API_SERVER_INFO_CACHE_DIR") or None
+        )
+
         global SHOTGUN_API_DISABLE_ENTITY_OPTIMIZATION
         if (
             os.environ.get("SHOTGUN_API_DISABLE_ENTITY_OPTIMIZATION", "0")
@@ -657,7 +1423,12 @@ class Shotgun(object):
         ):
             SHOTGUN_API_DISABLE_ENTITY_OPTIMIZATION = True
 
-        self._connection: Optional[Http] = None
+        self._connection_pool = _ConnectionPool(self.config)
+        self._attachment_cache: Optional[_AttachmentCache] = None
+        self._schema_cache: Optional[_SchemaCache] = None
+        self._field_types: Dict[str, Optional[Dict[str, str]]] = {}
+        self._field_types_lock = threading.Lock()
+        self._attachment_cache_lock = threading.Lock()
 
         self.__ca_certs = self._get_certs_file(ca_certs)
 
@@ -764,6 +1535,17 @@ class Shotgun(object):
 
         return auth, server
 
+    @property
+    def _connection(self) -> Optional[Http]:
+        """
+        The connection checked out of the pool by the current thread, if any.
+        """
+        return self._connection_pool.current()
+
+    @_connection.setter
+    def _connection(self, connection: Optional[Http]) -> None:
+        self._connection_pool.set_current(connection)
+
     # ========================================================================
     # API Functions
 
@@ -798,9 +1580,69 @@ class Shotgun(object):
         :rtype: :class:`ServerCapabilities` object
         """
         if not self._server_caps or (self._server_caps.host != self.config.server):
-            self._server_caps = ServerCapabilities(self.config.server, self.info())
+            info = self._read_server_info_cache()
+            if info is None:
+                info = self.info()
+                self._write_server_info_cache(info)
+            self._server_caps = ServerCapabilities(self.config.server, info)
         return self._server_caps
 
+    def _read_server_info_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the result of info() cached for the current server, if it is recent
+        enough.
+        """
+        ttl = self.config.server_info_cache_ttl
+        if ttl <= 0:
+            return None
+
+        key = "%s://%s" % (self.config.scheme, self.config.server)
+        now = time.time()
+        with _SERVER_INFO_CACHE_LOCK:
+            cached = _SERVER_INFO_CACHE.get(key)
+        if (
+            cached is None or now - cached[0] > ttl
+        ) and self.config.server_info_cache_dir:
+            # Another process may have read the info more recently.
+            try:
+                with open(self._server_info_cache_path(key), "r") as fh:
+                    entry = json.load(fh)
+            except (OSError, ValueError):
+                entry = {}
+            if entry.get("key") == key and (
+                cached is None or entry["time"] > cached[0]
+            ):
+                cached = (entry["time"], entry["info"])
+                with _SERVER_INFO_CACHE_LOCK:
+                    _SERVER_INFO_CACHE[key] = cached
+        if cached is None or now - cached[0] > ttl:
+            return None
+        return copy.deepcopy(cached[1])
+
+    def _write_server_info_cache(self, info: Dict[str, Any]) -> None:
+        """
+        Cache the result of info() for the current server.
+        """
+        if self.config.server_info_cache_ttl <= 0:
+            return
+
+        key = "%s://%s" % (self.config.scheme, self.config.server)
+        now = time.time()
+        with _SERVER_INFO_CACHE_LOCK:
+            _SERVER_INFO_CACHE[key] = (now, copy.deepcopy(info))
+        if not self.config.server_info_cache_dir:
+            return
+
+        path = self._server_info_cache_path(key)
+        try:
+            _atomic_write_json(path, {"key": key, "time": now, "info": info})
+        except (OSError, TypeError) as e:
+            LOG.warning("Unable to save server info to %s: %s", path, e)
+
+    def _server_info_cache_path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.config.server_info_cache_dir, "%s.json" % digest)
+
     def connect(self) -> None:
         """
         Connect client to the server if it is not already connected.
@@ -818,7 +1660,7 @@ class Shotgun(object):
 
         If the client needs to connect again it will do so automatically.
         """
-        self._close_connection()
+        self._connection_pool.drain()
         return
 
     def info(self) -> Dict[str, Any]:
@@ -944,6 +1786,7 @@ class Shotgun(object):
         page: int = 0,
         include_archived_projects: bool = True,
         additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+        keyset_paging: bool = False,
     ) -> List[BaseEntity]:
         """
         Find entities matching the given filters.
@@ -988,6 +1831,11 @@ class Shotgun(object):
              {'code': 'bird_v001', 'id': 137, 'type': 'Version'},
              {'code': 'birdAltBlue_v002', 'id': 236, 'type': 'Version'}]
 
+        .. note::
+            Results spanning several pages are read one page after the other. Large queries
+            can read several pages at the same time by setting ``sg.config.read_page_workers``
+            to the number of pages to request concurrently.
+
         :param str entity_type: Shotgun entity type to find.
         :param list filters: list of filters to apply to the query.
 
@@ -1036,6 +1884,13 @@ class Shotgun(object):
 
             For details on supported presets and the format of this parameter see
             :ref:`additional_filter_presets`
+        :param bool keyset_paging: Optional boolean flag to read the pages of the query from the
+            ``id`` of the last record read instead of the page number. Results are ordered by
+            ``id`` and each page is requested with an additional ``id`` ``greater_than``
+            condition, so reading deep pages is as fast as reading the first one, and entities
+            created or deleted while the pages are read don't cause other entities to be
+            skipped or returned twice. Can't be combined with ``order`` or ``page``. Defaults
+            to ``False``.
         :returns: list of dictionaries representing each entity with the requested fields, and the
             defaults ``"id"`` and ``"type"`` which are always included.
 
@@ -1044,48 +1899,198 @@ class Shotgun(object):
         :rtype: list
         """
 
-        if not isinstance(limit, int) or limit < 0:
-            raise ValueError("limit parameter must be a positive integer")
-
-        if not isinstance(page, int) or page < 0:
-            raise ValueError("page parameter must be a positive integer")
-
-        if isinstance(filters, (list, tuple)):
-            filters = _translate_filters(filters, filter_operator)
-        elif filter_operator:
-            # TODO: Not sure if this test is correct, replicated from prev api
-            raise ShotgunError(
-                "Deprecated: Use of filter_operator for find() is not valid any more."
-                " See the documentation on find()"
-            )
-
-        if not include_archived_projects:
-            # This defaults to True on the server (no argument is sent)
-            # So we only need to check the server version if it is False
-            self.server_caps.ensure_include_archived_projects()
-
-        if additional_filter_presets:
-            self.server_caps.ensure_support_for_additional_filter_presets()
-
-        params = self._construct_read_parameters(
+        params, page = self._prepare_find(
             entity_type,
-            fields,
             filters,
-            retired_only,
+            fields,
             order,
-            include_archived_projects,
+            filter_operator,
+            limit,
+            retired_only,
+            page,
+            include_archived_projects,
+            additional_filter_presets,
+            keyset_paging,
+        )
+
+        records = []
+        for entities in self._read_pages(params, limit, page, keyset_paging):
+            records.extend(entities)
+
+        return records
+
+    def find_iter(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        order: Optional[List[OrderItem]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        include_archived_projects: bool = True,
+        additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+        keyset_paging: bool = False,
+    ) -> Iterator[BaseEntity]:
+        """
+        Find entities matching the given filters, yielding them one page at a time.
+
+        This accepts the same parameters as :meth:`~shotgun_api3.Shotgun.find`, but instead of
+        returning a list of every matching entity, it returns a generator. Pages are requested
+        from the server as the generator is consumed, so only a single page of results is held
+        in memory at once. This is useful when reading very large result sets.
+
+            >>> for version in sg.find_iter("Version", [["project", "is", project]], ["code"]):
+            ...     process(version)
+
+        .. note::
+            Pages are read lazily, so entities created, updated or deleted on the server while
+            iterating may cause records to be skipped or returned twice. Use ``keyset_paging``
+            to avoid this when scanning large tables.
+
+        :returns: generator of dictionaries representing each entity with the requested fields,
+            and the defaults ``"id"`` and ``"type"`` which are always included.
+
+            .. seealso:: :ref:`entity-fields`
+
+        :rtype: generator
+        """
+
+        params, page = self._prepare_find(
+            entity_type,
+            filters,
+            fields,
+            order,
+            filter_operator,
+            limit,
+            retired_only,
+            page,
+            include_archived_projects,
+            additional_filter_presets,
+            keyset_paging,
+        )
+
+        # The parameters are checked when find_iter() is called, like for find(), and
+        # the pages are only read as the records are consumed.
+        def iter_records():
+            for entities in self._read_pages(params, limit, page, keyset_paging):
+                for record in entities:
+                    yield record
+
+        return iter_records()
+
+    def find_columns(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        order: Optional[List[OrderItem]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        include_archived_projects: bool = True,
+        additional_filter_presets: Optional[List[Dict[str, Any]]] = None,
+        keyset_paging: bool = False,
+    ) -> Dict[str, Union[List, "array.array"]]:
+        """
+        Find entities matching the given filters and return their values by field.
+
+        This accepts the same parameters as :meth:`~shotgun_api3.Shotgun.find`, but returns a
+        dictionary holding one column of values per field instead of one dictionary per entity.
+        Columns are built page by page as the results are read, so the entity dictionaries of
+        a single page are held in memory at once. This is useful for analyzing the values of a
+        few fields over a large number of entities.
+
+            >>> sg.find_columns("Version", [["project", "is", project]], ["code", "frame_count"])
+            {'id': array('q', [42, 134, 137]),
+             'code': ['scene_010_anim_v001', 'scene_010_anim_v002', 'bird_v001'],
+             'frame_count': [120, None, 96]}
+
+        Columns holding only integer values or only float values are returned as
+        :class:`array.array` objects, other columns are returned as lists. A field missing from
+        an entity has a ``None`` value.
+
+        :returns: dictionary of the ``"id"`` field and each of the requested fields to the list
+            of their values, in the order the entities were returned.
+        :rtype: dict
+        """
+
+        params, page = self._prepare_find(
+            entity_type,
+            filters,
+            fields,
+            order,
+            filter_operator,
+            limit,
+            retired_only,
+            page,
+            include_archived_projects,
+            additional_filter_presets,
+            keyset_paging,
+        )
+
+        field_names = ["id"] + [f for f in params["return_fields"] if f != "id"]
+        columns: Dict[str, Any] = dict.fromkeys(field_names)
+        for entities in self._read_pages(params, limit, page, keyset_paging):
+            if not entities:
+                continue
+            for field_name in field_names:
+                columns[field_name] = _extend_column(
+                    columns[field_name], [e.get(field_name) for e in entities]
+                )
+
+        return {k: [] if v is None else v for k, v in columns.items()}
+
+    def _prepare_find(
+        self,
+        entity_type: str,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        fields: Optional[List[str]],
+        order: Optional[List[OrderItem]],
+        filter_operator: Optional[str],
+        limit: int,
+        retired_only: bool,
+        page: int,
+        include_archived_projects: bool,
+        additional_filter_presets: Optional[List[Dict[str, Any]]],
+        keyset_paging: bool = False,
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Validate the arguments of a find() call and build the read parameters.
+
+        :returns: Tuple of the read parameters and the page to read, ``0`` meaning
+            that all pages should be read.
+        """
+        filters = self._check_find_arguments(
+            filters, filter_operator, limit, page, order, keyset_paging
+        )
+        if keyset_paging:
+            order = [{"field_name": "id", "direction": "asc"}]
+
+        if not include_archived_projects:
+            # This defaults to True on the server (no argument is sent)
+            # So we only need to check the server version if it is False
+            self.server_caps.ensure_include_archived_projects()
+
+        if additional_filter_presets:
+            self.server_caps.ensure_support_for_additional_filter_presets()
+
+        params = self._construct_read_parameters(
+            entity_type,
+            fields,
+            filters,
+            retired_only,
+            order,
+            include_archived_projects,
             additional_filter_presets,
         )
 
         if self.server_caps.ensure_return_image_urls_support():
             params["api_return_image_urls"] = True
 
-        if self.server_caps.ensure_paging_info_without_counts_support():
-            paging_info_param = "return_paging_info_without_counts"
-        else:
-            paging_info_param = "return_paging_info"
-
-        params[paging_info_param] = False
+        params[self._paging_info_param()] = False
 
         if limit and limit <= self.config.records_per_page:
             params["paging"]["entities_per_page"] = limit
@@ -1094,42 +2099,240 @@ class Shotgun(object):
             if page == 0:
                 page = 1
 
+        return params, page
+
+    def _check_find_arguments(
+        self,
+        filters: Union[List, Tuple, Dict[str, Any]],
+        filter_operator: Optional[str],
+        limit: int,
+        page: int,
+        order: Optional[List[OrderItem]],
+        keyset_paging: bool,
+    ) -> Dict[str, Any]:
+        """
+        Validate the arguments of a find() call which don't depend on the server.
+
+        :returns: The filters, translated to the format of the read parameters.
+        """
+        if not isinstance(limit, int) or limit < 0:
+            raise ValueError("limit parameter must be a positive integer")
+
+        if not isinstance(page, int) or page < 0:
+            raise ValueError("page parameter must be a positive integer")
+
+        if keyset_paging:
+            if page:
+                raise ValueError("page parameter can't be used with keyset_paging")
+            if order:
+                raise ValueError("order parameter can't be used with keyset_paging")
+
+        if isinstance(filters, (list, tuple)):
+            filters = _translate_filters(filters, filter_operator)
+        elif filter_operator:
+            # TODO: Not sure if this test is correct, replicated from prev api
+            raise ShotgunError(
+                "Deprecated: Use of filter_operator for find() is not valid any more."
+                " See the documentation on find()"
+            )
+        return filters
+
+    def _paging_info_param(self) -> str:
+        """
+        Return the name of the read parameter used to request paging information.
+        """
+        if self.server_caps.ensure_paging_info_without_counts_support():
+            return "return_paging_info_without_counts"
+        return "return_paging_info"
+
+    def _read_pages(
+        self,
+        params: Dict[str, Any],
+        limit: int,
+        page: int,
+        keyset_paging: bool = False,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read the pages of a find() query from the server, one after the other.
+
+        :param dict params: Read parameters built by :meth:`_prepare_find`.
+        :param int limit: Maximum number of records to read, ``0`` for no limit.
+        :param int page: Page to read, ``0`` to read all the pages.
+        :param bool keyset_paging: Whether pages are read from the id of the last
+            record read rather than from the page number.
+        :returns: Generator of the entity lists of each page, processed by
+            :meth:`_read_inbound_transform`. The last list is truncated so that no more
+            than ``limit`` records are returned in total.
+        """
+        inbound = self._read_inbound_transform(params)
+
         # if page is specified, then only return the page of records requested
         if page != 0:
             params["paging"]["current_page"] = page
-            records = self._call_rpc("read", params).get("entities", [])
-            return self._parse_records(records)
+            yield self._call_rpc("read", params, inbound=inbound).get("entities", [])
+            return
+
+        if keyset_paging:
+            for entities in self._read_pages_by_keyset(params, limit, inbound):
+                yield entities
+            return
 
+        if self.config.read_page_workers > 1:
+            for entities in self._read_pages_concurrently(params, limit, inbound):
+                yield entities
+            return
+
+        paging_info_param = self._paging_info_param()
         params[paging_info_param] = True
-        records = []
+        count = 0
 
-        if self.server_caps.ensure_paging_info_without_counts_support():
+        if paging_info_param == "return_paging_info_without_counts":
             has_next_page = True
             while has_next_page:
-                result = self._call_rpc("read", params)
-                records.extend(result.get("entities"))
+                result = self._call_rpc("read", params, inbound=inbound)
+                entities = result.get("entities")
+                count += len(entities)
 
-                if limit and len(records) >= limit:
-                    records = records[:limit]
-                    break
+                if limit and count >= limit:
+                    yield entities[: len(entities) - (count - limit)]
+                    return
+                yield entities
 
                 has_next_page = result["paging_info"]["has_next_page"]
                 params["paging"]["current_page"] += 1
         else:
-            result = self._call_rpc("read", params)
+            result = self._call_rpc("read", params, inbound=inbound)
             while result.get("entities"):
-                records.extend(result.get("entities"))
+                entities = result.get("entities")
+                count += len(entities)
 
-                if limit and len(records) >= limit:
-                    records = records[:limit]
-                    break
-                if len(records) == result["paging_info"]["entity_count"]:
-                    break
+                if limit and count >= limit:
+                    yield entities[: len(entities) - (count - limit)]
+                    return
+                yield entities
+
+                if count == result["paging_info"]["entity_count"]:
+                    return
 
                 params["paging"]["current_page"] += 1
-                result = self._call_rpc("read", params)
+                result = self._call_rpc("read", params, inbound=inbound)
+
+    def _read_pages_by_keyset(
+        self,
+        params: Dict[str, Any],
+        limit: int,
+        inbound: Optional[Callable[[Any], Any]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read the pages of a find() query ordered by id, using the id of the last
+        record read to request the next page.
+
+        Every request reads the first page of the query, restricted to the entities
+        with an id greater than the last one read. No paging information is needed:
+        a page with fewer entities than requested is the last one.
+
+        :param dict params: Read parameters built by :meth:`_prepare_find`.
+        :param int limit: Maximum number of records to read, ``0`` for no limit.
+        :param callable inbound: Optional function transforming the responses.
+        :returns: Generator of the raw entity lists of each page, in id order.
+        """
+        filters = params["filters"]
+        entities_per_page = params["paging"]["entities_per_page"]
+        count = 0
+
+        while True:
+            entities = (
+                self._call_rpc("read", params, inbound=inbound).get("entities") or []
+            )
+            count += len(entities)
+
+            if limit and count >= limit:
+                yield entities[: len(entities) - (count - limit)]
+                return
+            if entities:
+                yield entities
+
+            if len(entities) < entities_per_page:
+                return
+
+            params["filters"] = _keyset_filters(filters, entities[-1]["id"])
+
+    def _read_pages_concurrently(
+        self,
+        params: Dict[str, Any],
+        limit: int,
+        inbound: Optional[Callable[[Any], Any]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Read the pages of a find() query using a pool of worker threads.
+
+        The first page is read on its own. When the server returns the entity count, only
+        the pages needed to reach it are requested. Otherwise pages are requested
+        speculatively ahead of the current one for as long as ``has_next_page`` is set.
+        At most ``config.read_page_workers`` pages are in flight at any time.
+
+        :param dict params: Read parameters built by :meth:`_prepare_find`.
+        :param int limit: Maximum number of records to read, ``0`` for no limit.
+        :param callable inbound: Optional function transforming the responses.
+        :returns: Generator of the raw entity lists of each page, in page order.
+        """
+        paging_info_param = self._paging_info_param()
+        params[paging_info_param] = True
+        with_counts = paging_info_param == "return_paging_info"
+        entities_per_page = params["paging"]["entities_per_page"]
+
+        def read_page(page_number):
+            page_params = dict(params)
+            page_params["paging"] = dict(params["paging"], current_page=page_number)
+            return self._call_rpc("read", page_params, inbound=inbound)
+
+        result = read_page(1)
+
+        # The last page which needs to be read, None if it is not known upfront.
+        last_page = None
+        if with_counts:
+            total = result["paging_info"]["entity_count"]
+            if limit:
+                total = min(total, limit)
+            last_page = -(-total // entities_per_page)
+        elif limit:
+            last_page = -(-limit // entities_per_page)
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.read_page_workers
+        )
+        pending = collections.deque()
+        next_page = 2
+        count = 0
+        try:
+            while True:
+                entities = result.get("entities") or []
+                count += len(entities)
+
+                if limit and count >= limit:
+                    yield entities[: len(entities) - (count - limit)]
+                    return
+                if entities:
+                    yield entities
+
+                if with_counts:
+                    if not entities or count >= result["paging_info"]["entity_count"]:
+                        return
+                elif not result["paging_info"]["has_next_page"]:
+                    return
+
+                while len(pending) < self.config.read_page_workers and (
+                    last_page is None or next_page <= last_page
+                ):
+                    pending.append(executor.submit(read_page, next_page))
+                    next_page += 1
 
-        return self._parse_records(records)
+                if not pending:
+                    return
+                result = pending.popleft().result()
+        finally:
+            # Speculative reads which are not needed anymore are dropped.
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def _construct_read_parameters(
         self,
@@ -1390,6 +2593,27 @@ class Shotgun(object):
         :rtype: dict
         """
 
+        params = self._construct_summarize_parameters(
+            entity_type,
+            filters,
+            summary_fields,
+            filter_operator,
+            grouping,
+            include_archived_projects,
+        )
+
+        records = self._call_rpc("summarize", params)
+        return records
+
+    def _construct_summarize_parameters(
+        self,
+        entity_type: str,
+        filters: Union[List, Dict[str, Any]],
+        summary_fields: List[Dict[str, str]],
+        filter_operator: Optional[str],
+        grouping: Optional[List[GroupingItem]],
+        include_archived_projects: bool,
+    ) -> Dict[str, Any]:
         if not isinstance(grouping, list) and grouping is not None:
             msg = "summarize() 'grouping' parameter must be a list or None"
             raise ValueError(msg)
@@ -1411,8 +2635,7 @@ class Shotgun(object):
         if grouping is not None:
             params["grouping"] = grouping
 
-        records = self._call_rpc("summarize", params)
-        return records
+        return params
 
     def create(
         self,
@@ -1629,13 +2852,54 @@ class Shotgun(object):
 
         return self._call_rpc("revive", params)
 
-    def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def bulk_writer(
+        self, max_ops: int = 500, max_latency: Optional[float] = 0.5
+    ) -> BulkWriter:
+        """
+        Return a :class:`~shotgun_api3.BulkWriter` queuing create, update and delete
+        requests and sending them to the server with :meth:`batch`.
+
+        >>> with sg.bulk_writer(max_ops=500, max_latency=0.5) as writer:
+        ...     future = writer.create("Shot", {"code": "New Shot", "project": project})
+        >>> future.result()
+        {'code': 'New Shot', 'type': 'Shot', 'id': 3725, 'project': {...}}
+
+        :param int max_ops: Number of queued requests sent in a single batch request.
+            Defaults to ``500``.
+        :param float max_latency: Maximum number of seconds a request is queued for before
+            being sent, or ``None`` for no limit. Defaults to ``0.5``.
+        :returns: A new :class:`~shotgun_api3.BulkWriter`, which sends its queued requests
+            when it is closed.
+        :rtype: :class:`~shotgun_api3.BulkWriter`
+        """
+        return BulkWriter(self, max_ops, max_latency)
+
+    def batch(
+        self,
+        requests: List[Dict[str, Any]],
+        chunk_size: int = 0,
+        chunk_bytes: int = 0,
+        sequential: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
         Make a batch request of several :meth:`~shotgun_api3.Shotgun.create`,
         :meth:`~shotgun_api3.Shotgun.update`, and :meth:`~shotgun_api3.Shotgun.delete` calls.
 
         All requests are performed within a transaction, so either all will complete or none will.
 
+        Large batches can be split into chunks with ``chunk_size`` and ``chunk_bytes``. Each
+        chunk is then sent as a batch of its own and performed within its own transaction:
+        a chunked batch is **not** atomic, chunks which completed are not rolled back when a
+        later chunk fails, whatever the value of ``sequential``. Results are always
+        returned in the order of the requests. If a chunk fails, for any reason, a
+        :class:`~shotgun_api3.ShotgunBatchError` is raised, holding the results of the chunks
+        which completed and the error of each chunk which failed.
+
+        Ex. Create many shots, 500 at a time, sending up to ``sg.config.batch_workers``
+        chunks at the same time::
+
+            sg.batch(batch_data, chunk_size=500, sequential=False)
+
         Ex. Make a bunch of shots::
 
             batch_data = []
@@ -1684,9 +2948,21 @@ class Shotgun(object):
             - update: ``entity_type``, ``entity_id``, data dict of fields to set,
                       and optionally ``multi_entity_update_modes``
             - delete: ``entity_type`` and entity_id
+        :param int chunk_size: Optional maximum number of requests sent to the server at once.
+            Defaults to ``0``, no limit.
+        :param int chunk_bytes: Optional maximum size in bytes of the requests sent to the
+            server at once. A request larger than this size is sent on its own. Defaults to
+            ``0``, no limit.
+        :param bool sequential: Only applies to chunked batches. When ``True`` (default),
+            chunks are sent one after the other and no chunk is sent after one failed, but
+            the chunks sent before are kept: this does not make the batch atomic. When
+            ``False``, chunks are sent concurrently and all of them are sent whatever the
+            errors.
         :returns: A list of values for each operation. Create and update requests return a dict of
             the fields updated. Delete requests return ``True`` if the entity was deleted.
         :rtype: list
+        :raises ShotgunBatchError: If the requests were split into several chunks and some
+            of them failed.
         """
 
         if not isinstance(requests, list):
@@ -1699,6 +2975,62 @@ class Shotgun(object):
         if len(requests) == 0:
             return []
 
+        if chunk_size < 0 or chunk_bytes < 0:
+            raise ValueError("batch() 'chunk_size' and 'chunk_bytes' cannot be negative")
+
+        calls = self._translate_batch_requests(requests)
+        chunks = _batch_chunks(calls, chunk_size, chunk_bytes)
+
+        def send_chunk(chunk):
+            start, stop = chunk
+            records = self._call_rpc("batch", calls[start:stop])
+            return self._parse_records(records)
+
+        # A single chunk keeps the behavior of an unchunked batch, its errors
+        # are raised as they are.
+        if len(chunks) == 1:
+            return send_chunk(chunks[0])
+
+        results = [None] * len(calls)
+        errors = []
+        if sequential:
+            for start, stop in chunks:
+                try:
+                    results[start:stop] = send_chunk((start, stop))
+                except Exception as e:
+                    # Connection errors are reported too, so that the results of
+                    # the chunks which completed are not lost.
+                    errors.append((start, stop, e))
+                    break
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.config.batch_workers
+            ) as executor:
+                futures = [executor.submit(send_chunk, chunk) for chunk in chunks]
+                for (start, stop), future in zip(chunks, futures):
+                    try:
+                        results[start:stop] = future.result()
+                    except Exception as e:
+                        errors.append((start, stop, e))
+
+        if errors:
+            start, stop, error = errors[0]
+            raise ShotgunBatchError(
+                "%d of %d batch chunks failed, first error for requests %d to %d: %s"
+                % (len(errors), len(chunks), start, stop - 1, error),
+                results,
+                errors,
+            )
+        return results
+
+    def _translate_batch_requests(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate the requests given to batch() into the calls expected by the rpc endpoint.
+
+        :raises ShotgunError: If a request is invalid.
+        """
         calls = []
 
         def _required_keys(message, required_keys, data):
@@ -1741,8 +3073,7 @@ class Shotgun(object):
                     "Invalid request_type '%s' for batch" % (req["request_type"])
                 )
             calls.append(request_params)
-        records = self._call_rpc("batch", calls)
-        return self._parse_records(records)
+        return calls
 
     def work_schedule_read(
         self,
@@ -2069,10 +3400,7 @@ class Shotgun(object):
 
         params = self._add_project_param(params, project_entity)
 
-        if params:
-            return self._call_rpc("schema_entity_read", params)
-        else:
-            return self._call_rpc("schema_entity_read", None)
+        return self._read_schema("schema_entity_read", params or None)
 
     def schema_read(
         self, project_entity: Optional[BaseEntity] = None
@@ -2137,16 +3465,20 @@ class Shotgun(object):
 
         .. note::
             The returned display names for this method will be localized when the ``localize`` Shotgun config property is set to ``True``. See :ref:`localization` for more information.
+
+        .. note::
+            When ``sg.config.schema_cache_dir`` is set, the schema returned by this method,
+            :meth:`schema_entity_read` and :meth:`schema_field_read` is cached on disk until
+            the server version changes. Entries older than ``sg.config.schema_cache_ttl``
+            seconds are returned while they are read again in the background. The cache of
+            the server is cleared when its schema is modified with this API.
         """
 
         params: Dict[str, Any] = {}
 
         params = self._add_project_param(params, project_entity)
 
-        if params:
-            return self._call_rpc("schema_read", params)
-        else:
-            return self._call_rpc("schema_read", None)
+        return self._read_schema("schema_read", params or None)
 
     def schema_field_read(
         self,
@@ -2215,7 +3547,7 @@ class Shotgun(object):
 
         params = self._add_project_param(params, project_entity)
 
-        return self._call_rpc("schema_field_read", params)
+        return self._read_schema("schema_field_read", params)
 
     def schema_field_create(
         self,
@@ -2258,7 +3590,9 @@ class Shotgun(object):
             self._dict_to_list(properties, key_name="property_name", value_name="value")
         )
 
-        return self._call_rpc("schema_field_create", params)
+        result = self._call_rpc("schema_field_create", params)
+        self._clear_schema_cache()
+        return result
 
     def schema_field_update(
         self,
@@ -2305,7 +3639,9 @@ class Shotgun(object):
             ],
         }
         params = self._add_project_param(params, project_entity)
-        return self._call_rpc("schema_field_update", params)
+        result = self._call_rpc("schema_field_update", params)
+        self._clear_schema_cache()
+        return result
 
     def schema_field_delete(self, entity_type: str, field_name: str) -> bool:
         """
@@ -2322,7 +3658,81 @@ class Shotgun(object):
 
         params = {"type": entity_type, "field_name": field_name}
 
-        return self._call_rpc("schema_field_delete", params)
+        result = self._call_rpc("schema_field_delete", params)
+        self._clear_schema_cache()
+        return result
+
+    def _get_schema_cache(self) -> Optional[_SchemaCache]:
+        """
+        Return the schema cache for ``config.schema_cache_dir`` and the current server,
+        if set.
+        """
+        cache_dir = self.config.schema_cache_dir
+        if not cache_dir:
+            return None
+        cache = self._schema_cache
+        if (
+            cache is None
+            or cache.path != cache_dir
+            or cache.server != self.config.server
+        ):
+            cache = self._schema_cache = _SchemaCache(cache_dir, self.config.server)
+        return cache
+
+    def _read_schema(self, method: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Call a schema read method, through the schema cache if it is enabled.
+        """
+        cache = self._get_schema_cache()
+        if cache is None:
+            return self._call_rpc(method, params)
+
+        # The schema depends on the user reading it, the language it is localized in
+        # and the project. Sessions are only known by their token, which is hashed
+        # so that it is not written to disk.
+        user = self.config.script_name or self.config.user_login
+        if user is None and self.config.session_token:
+            user = hashlib.sha256(self.config.session_token.encode("utf-8")).hexdigest()
+        key_params = dict(params or {})
+        if key_params.get("project"):
+            key_params["project"] = key_params["project"].get("id")
+        key = json.dumps(
+            [
+                user,
+                self.config.sudo_as_login,
+                self.config.localized,
+                method,
+                key_params,
+            ],
+            sort_keys=True,
+        )
+        server_version = self.server_caps.version
+
+        def _read():
+            value = self._call_rpc(method, params)
+            cache.set(key, server_version, value)
+            return value
+
+        entry = cache.get(key, server_version)
+        if entry is None:
+            return _read()
+
+        ttl = self.config.schema_cache_ttl
+        if ttl is not None and time.time() - entry["time"] > ttl:
+            cache.refresh(key, _read)
+        if entry["datetimes"]:
+            return self._transform_inbound(entry["value"])
+        return entry["value"]
+
+    def _clear_schema_cache(self) -> None:
+        """
+        Remove the cached schema of the current server, after it was modified.
+        """
+        with self._field_types_lock:
+            self._field_types.clear()
+        cache = self._get_schema_cache()
+        if cache is not None:
+            cache.clear()
 
     def add_user_agent(self, agent: str) -> None:
         """
@@ -2622,6 +4032,10 @@ class Shotgun(object):
           Make sure to have retries for file uploads. Failures when uploading will occasionally happen.
           When it does, immediately retrying to upload usually works
 
+        .. note::
+          Uploads of large files to the Cloud storage can be resumed by such a retry, rather than
+          restarted, by setting ``sg.config.upload_state_dir``.
+
         >>> mov_file = '/data/show/ne2/100_110/anim/01.mlk-02b.mov'
         >>> sg.upload("Shot", 423, mov_file, field_name="sg_latest_quicktime",
         ...           display_name="Latest QT")
@@ -2722,25 +4136,105 @@ class Shotgun(object):
 
         is_multipart_upload = os.path.getsize(path) > self._MULTIPART_UPLOAD_CHUNK_SIZE
 
-        upload_info = self._get_attachment_upload_info(
-            is_thumbnail, filename, is_multipart_upload
-        )
+        upload_state = None
+        if is_multipart_upload and self.config.upload_state_dir:
+            upload_state = _UploadState(
+                self.config.upload_state_dir,
+                self.config.server,
+                path,
+                is_thumbnail,
+                self._MULTIPART_UPLOAD_CHUNK_SIZE,
+                self.config.upload_state_ttl,
+            )
 
-        # Step 2: upload the file
-        # We upload large files in multiple parts because it is more robust
-        # (and required when using S3 storage)
-        if is_multipart_upload:
-            self._multipart_upload_file_to_storage(path, upload_info)
+        resumed = upload_state is not None and upload_state.upload_info is not None
+        if resumed:
+            LOG.debug("Resuming multipart upload of %s", path)
+            upload_info = upload_state.upload_info
         else:
-            self._upload_file_to_storage(path, upload_info["upload_url"])
-
-        # Step 3: create the attachment
+            upload_info = self._get_attachment_upload_info(
+                is_thumbnail, filename, is_multipart_upload
+            )
+            if upload_state is not None:
+                upload_state.start(upload_info)
 
-        url = urllib.parse.urlunparse(
-            (
-                self.config.scheme,
-                self.config.server,
-                "/upload/api_link_file",
+        try:
+            return self._send_upload(
+                entity_type,
+                entity_id,
+                path,
+                field_name,
+                display_name,
+                tag_list,
+                is_thumbnail,
+                upload_info,
+                upload_state,
+            )
+        except _UploadNotFoundError as e:
+            if not resumed:
+                raise
+            # The saved upload expired or was aborted, and would fail again on each
+            # retry: start over with a new upload. Other errors keep the saved state,
+            # so that the next call resumes the upload.
+            LOG.debug("Resumed upload of %s failed, starting over: %s", path, e)
+            upload_state.remove()
+            upload_info = self._get_attachment_upload_info(
+                is_thumbnail, filename, is_multipart_upload
+            )
+            upload_state.start(upload_info)
+            return self._send_upload(
+                entity_type,
+                entity_id,
+                path,
+                field_name,
+                display_name,
+                tag_list,
+                is_thumbnail,
+                upload_info,
+                upload_state,
+            )
+
+    def _send_upload(
+        self,
+        entity_type: str,
+        entity_id: int,
+        path: str,
+        field_name: Optional[str],
+        display_name: Optional[str],
+        tag_list: Optional[str],
+        is_thumbnail: bool,
+        upload_info: Dict[str, Any],
+        upload_state: Optional[_UploadState],
+    ) -> int:
+        """
+        Upload a file to the Cloud storage with the given upload_info and link it to the
+        specified entity.
+
+        See :meth:`_upload_to_storage` for the parameters.
+
+        :param dict upload_info: Upload details returned by :meth:`_get_attachment_upload_info`.
+        :param upload_state: Saved state of a multipart upload, if any.
+        :returns: Id of the Attachment entity that was created for the image.
+        :rtype: int
+        """
+        filename = os.path.basename(path)
+
+        # Step 2: upload the file
+        # We upload large files in multiple parts because it is more robust
+        # (and required when using S3 storage)
+        if os.path.getsize(path) > self._MULTIPART_UPLOAD_CHUNK_SIZE:
+            if upload_state is None or not upload_state.completed:
+                self._multipart_upload_file_to_storage(path, upload_info, upload_state)
+        else:
+            self._upload_file_to_storage(path, upload_info["upload_url"])
+
+        # Step 3: create the attachment
+
+        url = urllib.parse.urlunparse(
+            (
+                self.config.scheme,
+                self.config.server,
+                "/upload/api_link_file",
                 None,
                 None,
                 None,
@@ -2777,6 +4271,8 @@ class Shotgun(object):
             )
 
         LOG.debug("Attachment linked to content on Cloud storage")
+        if upload_state is not None:
+            upload_state.remove()
 
         attachment_id = int(result.split(":", 2)[1].split("\n", 1)[0])
         return attachment_id
@@ -2916,6 +4412,7 @@ class Shotgun(object):
         attachment: Union[Dict[str, Any], bool] = False,
         file_path: Optional[str] = None,
         attachment_id: Optional[int] = None,
+        resume: bool = False,
     ) -> Union[str, bytes, None]:
         """
         Download the file associated with a Shotgun Attachment.
@@ -2947,9 +4444,28 @@ class Shotgun(object):
             .. note:
                 This parameter exists only for backwards compatibility for scripts specifying
                 the parameter with keywords.
+        :param bool resume: Optional, when ``True`` a partial ``file_path`` left by a failed
+            download in parts is completed instead of being downloaded again, if its size and
+            ETag or Last-Modified header did not change on the server. Other files are
+            downloaded again. Requires ``file_path``.
         :returns: If ``file_path`` is provided, returns the path to the file on disk.  If
             ``file_path`` is ``None``, returns the actual data of the file, as bytes.
         :rtype: str | bytes
+
+        .. note::
+            When ``sg.config.download_part_workers`` is greater than 1, a file written to
+            ``file_path`` is downloaded in parts, with concurrent HTTP Range requests. Files
+            from servers which don't support Range requests are downloaded in a single
+            stream. The progress of a download in parts is saved next to ``file_path``, in
+            a ``.download`` file removed once the download completes.
+
+        .. note::
+            When ``sg.config.attachment_cache_dir`` is set, downloaded files are kept in a
+            local cache, see :meth:`attachment_cache_stats`. Uploaded attachments are then
+            served from the cache without any request, and other urls are revalidated with
+            a conditional request. Files written to ``file_path`` are copies of the cached
+            files, or hard links to them when ``sg.config.attachment_cache_hard_links`` is
+            set. Downloads which miss the cache are not resumed.
         """
         # backwards compatibility when passed via keyword argument
         if attachment is False:
@@ -2961,76 +4477,510 @@ class Shotgun(object):
                     "dict, int, NoneType value or"
                     "an int for parameter attachment_id"
                 )
-        # write to disk
-        if file_path:
-            try:
-                fp = open(file_path, "wb")
-            except IOError as e:
-                raise IOError(
-                    "Unable to write Attachment to disk using " "file_path. %s" % e
-                )
+        if resume and not file_path:
+            raise ValueError("download_attachment() 'resume' requires a 'file_path'")
 
         url = self.get_attachment_download_url(attachment)
         if url is None:
             return None
 
+        opener = self._build_download_opener(url)
+        return self._download_attachment_url(attachment, url, file_path, resume, opener)
+
+    def download_attachments(
+        self,
+        items: List[Tuple[Union[Dict[str, Any], int, None], Optional[str]]],
+        max_workers: int = 4,
+        resume: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Download the files associated with several Attachments concurrently.
+
+        The authentication cookie and the openers are shared by all the downloads.
+        A download which fails doesn't stop the others, its error is reported in its
+        result instead.
+
+            >>> versions = sg.find("Version", [["playlists", "is", playlist]], ["sg_uploaded_movie"])
+            >>> report = sg.download_attachments(
+            ...     [(v["sg_uploaded_movie"], "/var/tmp/%s.mov" % v["id"]) for v in versions],
+            ...     max_workers=8,
+            ... )
+            >>> report["bytes_per_second"]
+            58124350.3
+
+        :param list items: List of ``(attachment, file_path)`` tuples, accepting the same values
+            as the ``attachment`` and ``file_path`` parameters of :meth:`download_attachment`.
+        :param int max_workers: Optional maximum number of files downloaded at the same time.
+            Defaults to ``4``.
+        :param bool resume: Optional, when ``True`` partial files left by failed downloads are
+            completed instead of being downloaded again. All items must then have a
+            ``file_path``.
+        :returns: dict with the following keys:
+
+            - ``results``: list of dicts, one for each item in the same order, with the
+              ``attachment`` and ``file_path`` of the item, the ``result`` of the download as
+              returned by :meth:`download_attachment`, the ``size`` in bytes of the file,
+              the ``seconds`` spent downloading it and the ``error`` raised by the download,
+              or ``None``.
+            - ``size``: number of bytes downloaded.
+            - ``seconds``: duration of all the downloads.
+            - ``bytes_per_second``: aggregate download speed.
+            - ``errors``: number of items which failed.
+        :rtype: dict
+        """
+        if max_workers < 1:
+            raise ValueError("download_attachments() 'max_workers' must be at least 1")
+        if resume and not all(file_path for _, file_path in items):
+            raise ValueError("download_attachments() 'resume' requires a 'file_path'")
+
+        openers = {}
+        openers_lock = threading.Lock()
+
+        def get_opener(url):
+            # Urls of the server need the authentication cookie, external ones don't.
+            key = "server" if self.config.server in url else "external"
+            with openers_lock:
+                if key not in openers:
+                    openers[key] = self._build_download_opener(url)
+                return openers[key]
+
+        def download(item):
+            attachment, file_path = item
+            result = {
+                "attachment": attachment,
+                "file_path": file_path,
+                "result": None,
+                "size": 0,
+                "seconds": 0.0,
+                "error": None,
+            }
+            start = time.time()
+            try:
+                url = self.get_attachment_download_url(attachment)
+                if url is not None:
+                    result["result"] = self._download_attachment_url(
+                        attachment, url, file_path, resume, get_opener(url)
+                    )
+                    if file_path:
+                        result["size"] = os.path.getsize(file_path)
+                    else:
+                        result["size"] = len(result["result"])
+            except Exception as e:
+                # Any error, including an invalid item, is reported in the result of
+                # its item so that it doesn't stop the other downloads.
+                LOG.debug("Failed to download %s: %s" % (attachment, e))
+                result["error"] = e
+            result["seconds"] = time.time() - start
+            return result
+
+        start = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(download, items))
+        seconds = time.time() - start
+
+        size = sum(result["size"] for result in results)
+        return {
+            "results": results,
+            "size": size,
+            "seconds": seconds,
+            "bytes_per_second": size / seconds if seconds else 0.0,
+            "errors": sum(1 for result in results if result["error"] is not None),
+        }
+
+    def attachment_cache_stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the local attachment cache.
+
+        The cache is enabled by setting ``sg.config.attachment_cache_dir``. Attachments
+        downloaded with :meth:`download_attachment` and :meth:`download_attachments` are
+        then stored in this directory, up to ``sg.config.attachment_cache_size`` bytes.
+        The least recently used attachments are evicted first.
+
+        >>> sg.attachment_cache_stats()
+        {'hits': 12, 'misses': 3, 'evictions': 0, 'entries': 3, 'size': 57024}
+
+        :returns: dict with the number of cache ``hits``, ``misses`` and ``evictions`` by
+            this client, and the number of ``entries`` and total ``size`` in bytes of the
+            cache directory. All values are ``0`` when the cache is disabled.
+        :rtype: dict
+        """
+        cache = self._get_attachment_cache()
+        if cache is None:
+            return {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "size": 0}
+        return cache.stats()
+
+    def _get_attachment_cache(self) -> Optional[_AttachmentCache]:
+        """
+        Return the attachment cache for ``config.attachment_cache_dir``, if set.
+        """
+        cache_dir = self.config.attachment_cache_dir
+        if not cache_dir:
+            return None
+        with self._attachment_cache_lock:
+            if self._attachment_cache is None or self._attachment_cache.path != cache_dir:
+                self._attachment_cache = _AttachmentCache(cache_dir)
+            return self._attachment_cache
+
+    def _download_attachment_url(
+        self,
+        attachment: Union[Dict[str, Any], int],
+        url: str,
+        file_path: Optional[str],
+        resume: bool,
+        opener: urllib.request.OpenerDirector,
+    ) -> Union[str, bytes]:
+        """
+        Download an attachment from the given url, through the attachment cache if
+        it is enabled.
+
+        Attachments uploaded to the server never change: they are served from the cache
+        without any request. Other urls are revalidated with a conditional request,
+        using the ETag or Last-Modified header of the cached response.
+        """
+        cache = self._get_attachment_cache()
+        if cache is None:
+            return self._download_url(url, file_path, resume, opener)
+
+        attachment_id = None
+        if isinstance(attachment, int):
+            attachment_id = attachment
+        elif (
+            attachment.get("type") == "Attachment"
+            and attachment.get("link_type", "upload") == "upload"
+        ):
+            attachment_id = attachment.get("id")
+        if attachment_id:
+            key = "attachment:%s:%s" % (self.config.server, attachment_id)
+        else:
+            key = "url:%s" % url
+
+        hard_link = self.config.attachment_cache_hard_links
+        entry = cache.lookup(key)
+        tmp_path = cache.temp_path()
+        try:
+            if entry is not None and attachment_id:
+                return cache.hit(entry, file_path, hard_link)
+
+            response_headers = {}
+            if entry is not None and entry["validator"]:
+                request = urllib.request.Request(url)
+                request.add_header("user-agent", "; ".join(self._user_agents))
+                if entry["validator"].startswith(("W/", '"')):
+                    request.add_header("If-None-Match", entry["validator"])
+                else:
+                    request.add_header("If-Modified-Since", entry["validator"])
+                try:
+                    response = opener.open(request)
+                except urllib.error.HTTPError as e:
+                    if e.code != 304:
+                        raise self._download_error(url, e)
+                    e.close()
+                    return cache.hit(entry, file_path, hard_link)
+                except urllib.error.URLError as e:
+                    raise self._download_error(url, e)
+                # The file changed, its new version is being sent.
+                response_headers.update(response.headers.items())
+                with response, open(tmp_path, "wb") as fp:
+                    shutil.copyfileobj(response, fp)
+            else:
+                self._download_url(url, tmp_path, False, opener, response_headers)
+
+            validator = None
+            for name, value in response_headers.items():
+                if name.lower() == "etag":
+                    validator = value
+                    break
+                elif name.lower() == "last-modified":
+                    validator = value
+            entry = cache.store(
+                key, tmp_path, validator, self.config.attachment_cache_size
+            )
+            return cache.miss(entry, file_path, hard_link)
+        finally:
+            # Cached downloads are never resumed, the state file of a failed
+            # download in parts is removed with its partial file.
+            for path in (tmp_path, "%s.download" % tmp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _build_download_opener(self, url: str) -> urllib.request.OpenerDirector:
+        """
+        Return an opener to download files from the given url.
+        """
         cookie_handler = None
         if self.config.server in url:
             # We only need to set the auth cookie for downloads from Shotgun server
             cookie_handler = self.get_auth_cookie_handler()
 
-        opener = self._build_opener(cookie_handler)
+        return self._build_opener(cookie_handler)
+
+    def _download_url(
+        self,
+        url: str,
+        file_path: Optional[str],
+        resume: bool,
+        opener: urllib.request.OpenerDirector,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> Union[str, bytes]:
+        """
+        Download the file at the given url, see :meth:`download_attachment`.
+
+        :param dict response_headers: Optional dict updated with the headers of the
+            first response of the server.
+        """
+        ranged = bool(file_path) and (
+            resume or self.config.download_part_workers > 1
+        )
+
+        # write to disk
+        fp = None
+        if file_path and not ranged:
+            try:
+                fp = open(file_path, "wb")
+            except IOError as e:
+                raise IOError(
+                    "Unable to write Attachment to disk using " "file_path. %s" % e
+                )
+
         try:
+            if ranged:
+                return self._download_file_in_parts(
+                    opener, url, file_path, resume, response_headers
+                )
+
             request = urllib.request.Request(url)
             request.add_header("user-agent", "; ".join(self._user_agents))
             req = opener.open(request)
+            if response_headers is not None:
+                response_headers.update(req.headers.items())
             if file_path:
                 shutil.copyfileobj(req, fp)
             else:
-                attachment = req.read()
+                data = req.read()
         # 400 [sg] Attachment id doesn't exist or is a local file
         # 403 [s3] link is invalid
         except urllib.error.URLError as e:
-            if file_path:
+            if fp is not None:
                 fp.close()
-            err = "Failed to open %s\n%s" % (url, e)
-            if hasattr(e, "code"):
-                if e.code == 400:
-                    err += "\nAttachment may not exist or is a local file?"
-                elif e.code == 403:
-                    # Only parse the body if it is an Amazon S3 url.
-                    if (
-                        url.find("s3.amazonaws.com") != -1
-                        and e.headers["content-type"] == "application/xml"
-                    ):
-                        body = [
-                            line.decode("utf-8") if isinstance(line, bytes) else line
-                            for line in e.readlines()
-                        ]
-
-                        if body:
-                            try:
-                                root = xml.etree.ElementTree.fromstring("".join(body))
-                                message_elem = root.find(".//Message")
-                                if message_elem is not None and message_elem.text:
-                                    err = f"{err} - {message_elem.text}"
-                            except xml.etree.ElementTree.ParseError:
-                                err = f"{err}\n{''.join(body)}\n"
-                elif e.code == 409 or e.code == 410:
-                    # we may be dealing with a file that is pending/failed a malware scan, e.g:
-                    # 409: This file is undergoing a malware scan, please try again in a few minutes
-                    # 410: File scanning has detected malware and the file has been quarantined
-                    lines = e.readlines()
-                    if lines:
-                        err += "\n%s\n" % "".join(lines)
-            raise ShotgunFileDownloadError(err)
+            raise self._download_error(url, e)
         else:
             if file_path:
                 if not fp.closed:
                     fp.close()
                 return file_path
             else:
-                return attachment
+                return data
+
+    def _download_error(
+        self, url: str, e: urllib.error.URLError
+    ) -> ShotgunFileDownloadError:
+        """
+        Return the error raised when a download failed with the given error.
+        """
+        err = "Failed to open %s\n%s" % (url, e)
+        if hasattr(e, "code"):
+            if e.code == 400:
+                err += "\nAttachment may not exist or is a local file?"
+            elif e.code == 403:
+                # Only parse the body if it is an Amazon S3 url.
+                if (
+                    url.find("s3.amazonaws.com") != -1
+                    and e.headers["content-type"] == "application/xml"
+                ):
+                    body = [
+                        line.decode("utf-8") if isinstance(line, bytes) else line
+                        for line in e.readlines()
+                    ]
+
+                    if body:
+                        try:
+                            root = xml.etree.ElementTree.fromstring("".join(body))
+                            message_elem = root.find(".//Message")
+                            if message_elem is not None and message_elem.text:
+                                err = f"{err} - {message_elem.text}"
+                        except xml.etree.ElementTree.ParseError:
+                            err = f"{err}\n{''.join(body)}\n"
+            elif e.code == 409 or e.code == 410:
+                # we may be dealing with a file that is pending/failed a malware scan, e.g:
+                # 409: This file is undergoing a malware scan, please try again in a few minutes
+                # 410: File scanning has detected malware and the file has been quarantined
+                lines = e.readlines()
+                if lines:
+                    err += "\n%s\n" % "".join(lines)
+        if isinstance(e, urllib.error.HTTPError):
+            e.close()
+        return ShotgunFileDownloadError(err)
+
+    def _download_file_in_parts(
+        self,
+        opener: urllib.request.OpenerDirector,
+        url: str,
+        file_path: str,
+        resume: bool,
+        response_headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Download a file to disk with concurrent HTTP Range requests.
+
+        A first request reads the first byte of the file to learn its size and whether
+        the server supports Range requests. If it doesn't, the file is downloaded in a
+        single stream. Otherwise the file is preallocated and its parts are written in
+        place as they are downloaded by ``config.download_part_workers`` threads.
+
+        The parts already downloaded are saved to a state file next to ``file_path``, so
+        that a failed download can be resumed. A download is only resumed from a state
+        file matching the size and the ETag or Last-Modified header of the file on the
+        server, otherwise ``file_path`` is truncated and downloaded again.
+
+        :param opener: Opener used for all the requests.
+        :param str url: Download url of the file.
+        :param str file_path: Path to write the file to.
+        :param bool resume: Whether to keep the parts of ``file_path`` already downloaded.
+        :param dict response_headers: Optional dict updated with the headers of the
+            first response of the server.
+        :returns: ``file_path``
+        """
+        request = urllib.request.Request(url)
+        request.add_header("user-agent", "; ".join(self._user_agents))
+        request.add_header("Range", "bytes=0-0")
+        try:
+            response = opener.open(request)
+        except urllib.error.HTTPError as e:
+            if e.code != 416:
+                raise
+            e.close()
+            # An empty file has no range to request.
+            request.remove_header("Range")
+            response = opener.open(request)
+        if response_headers is not None:
+            response_headers.update(response.headers.items())
+
+        content_range = response.headers.get("Content-Range") or ""
+        if response.status != 206 or not content_range.startswith("bytes 0-0/"):
+            # Ranges are not supported, the whole file is being sent.
+            LOG.debug("Ranges not supported, downloading %s in a single stream" % url)
+            with response, open(file_path, "wb") as fp:
+                shutil.copyfileobj(response, fp)
+            return file_path
+        response.close()
+
+        # Parts are requested from the final url, after redirections, and only
+        # if the file did not change since the first request.
+        url = response.geturl()
+        total = int(content_range.split("/", 1)[1])
+        validator = response.headers.get("ETag") or response.headers.get(
+            "Last-Modified"
+        )
+        part_size = self._DOWNLOAD_PART_SIZE
+        parts = [
+            (start, min(start + part_size, total) - 1)
+            for start in range(0, total, part_size)
+        ]
+
+        state_path = "%s.download" % file_path
+        state = {"size": total, "validator": validator, "part_size": part_size}
+        done = set()
+        # Without a validator, the parts already downloaded can't be trusted.
+        if resume and validator and os.path.exists(file_path):
+            try:
+                with open(state_path, "r") as fh:
+                    saved = json.load(fh)
+            except (OSError, ValueError):
+                saved = None
+            if (
+                isinstance(saved, dict)
+                and dict(saved, done=None) == dict(state, done=None)
+                and os.path.getsize(file_path) == total
+            ):
+                done = set(saved["done"])
+            else:
+                LOG.debug("No matching partial download of %s, restarting it" % url)
+
+        state_lock = threading.Lock()
+
+        def save_state():
+            _atomic_write_json(state_path, dict(state, done=sorted(done)))
+
+        fd = os.open(file_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+        try:
+            if not done:
+                # Don't keep any byte of a previous file.
+                os.ftruncate(fd, 0)
+            os.ftruncate(fd, total)
+            save_state()
+
+            def download_part(part):
+                self._download_range(opener, url, fd, part[0], part[1], validator)
+                with state_lock:
+                    done.add(part[0])
+                    save_state()
+
+            remaining = [part for part in parts if part[0] not in done]
+            workers = min(self.config.download_part_workers, len(remaining))
+            if workers > 1:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+                try:
+                    futures = [executor.submit(download_part, p) for p in remaining]
+                    for future in futures:
+                        future.result()
+                finally:
+                    # Parts not started yet are dropped if another one failed.
+                    executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                for part in remaining:
+                    download_part(part)
+        finally:
+            os.close(fd)
+
+        os.remove(state_path)
+        return file_path
+
+    def _download_range(
+        self,
+        opener: urllib.request.OpenerDirector,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        validator: Optional[str],
+    ) -> None:
+        """
+        Download the bytes ``start`` to ``end`` included of a file and write them at the
+        same position in the file descriptor ``fd``.
+
+        Connection errors are retried.
+
+        :raises ShotgunFileDownloadError: If the file changed on the server.
+        """
+        attempt = 1
+        while True:
+            request = urllib.request.Request(url)
+            request.add_header("user-agent", "; ".join(self._user_agents))
+            request.add_header("Range", "bytes=%d-%d" % (start, end))
+            if validator:
+                request.add_header("If-Range", validator)
+            try:
+                with opener.open(request) as response:
+                    if response.status != 206:
+                        raise ShotgunFileDownloadError(
+                            "Failed to download %s, the file changed on the server" % url
+                        )
+                    offset = start
+                    while offset <= end:
+                        data = response.read(min(1024 * 1024, end + 1 - offset))
+                        if not data:
+                            raise ConnectionResetError("Incomplete part")
+                        _pwrite(fd, data, offset)
+                        offset += len(data)
+                return
+            except urllib.error.HTTPError:
+                raise
+            except (urllib.error.URLError, ConnectionError) as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                LOG.debug("Got a '%s' error. Waiting and retrying..." % e)
+                time.sleep(float(attempt) * self.BACKOFF)
+                attempt += 1
 
     def get_auth_cookie_handler(self) -> urllib.request.HTTPCookieProcessor:
         """
@@ -3749,26 +5699,20 @@ class Shotgun(object):
         params: Any,
         include_auth_params: bool = True,
         first: bool = False,
+        inbound: Optional[Callable[[Any], Any]] = None,
     ) -> Any:
         """
         Call the specified method on the Shotgun Server sending the supplied payload.
+
+        :param callable inbound: Optional function transforming the decoded response
+            instead of :meth:`_transform_inbound`.
         """
 
         LOG.debug("Starting rpc call to %s with params %s" % (method, params))
 
-        params = self._transform_outbound(params)
-        payload = self._build_payload(
-            method, params, include_auth_params=include_auth_params
+        encoded_payload, req_headers = self._prepare_rpc(
+            method, params, include_auth_params
         )
-        encoded_payload = self._encode_payload(payload)
-
-        req_headers = {
-            "content-type": "application/json; charset=utf-8",
-            "connection": "keep-alive",
-        }
-
-        if self.config.localized is True:
-            req_headers["locale"] = "auto"
 
         attempt = 1
         while attempt <= self.MAX_ATTEMPTS:
@@ -3801,9 +5745,47 @@ class Shotgun(object):
             else:
                 break
 
+        return self._process_rpc_response(resp_headers, body, first, inbound)
+
+    def _prepare_rpc(
+        self, method: str, params: Any, include_auth_params: bool = True
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Build the encoded payload and the headers of a request to the rpc endpoint.
+
+        :returns: Tuple of the encoded payload and the request headers.
+        """
+        params = self._transform_outbound(params)
+        payload = self._build_payload(
+            method, params, include_auth_params=include_auth_params
+        )
+        encoded_payload = self._encode_payload(payload)
+
+        req_headers = {
+            "content-type": "application/json; charset=utf-8",
+            "connection": "keep-alive",
+        }
+
+        if self.config.localized is True:
+            req_headers["locale"] = "auto"
+
+        return encoded_payload, req_headers
+
+    def _process_rpc_response(
+        self,
+        resp_headers: Dict[str, Any],
+        body: Any,
+        first: bool = False,
+        inbound: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Decode the response of the rpc endpoint and return its results.
+
+        :raises ShotgunError: If the server response contains an exception.
+        """
         response = self._decode_response(resp_headers, body)
         self._response_errors(response)
-        response = self._transform_inbound(response)
+        response = (inbound or self._transform_inbound)(response)
 
         if not isinstance(response, dict) or "results" not in response:
             return response
@@ -3920,12 +5902,7 @@ class Shotgun(object):
         """
 
         attempt = 0
-        req_headers = {}
-        req_headers["user-agent"] = "; ".join(self._user_agents)
-        if self.config.authorization:
-            req_headers["Authorization"] = self.config.authorization
-
-        req_headers.update(headers or {})
+        req_headers = self._build_request_headers(headers)
         body = body or None
 
         max_rpc_attempts = self.config.max_rpc_attempts
@@ -3962,6 +5939,20 @@ class Shotgun(object):
             )
             time.sleep(rpc_attempt_interval)
 
+    def _build_request_headers(
+        self, headers: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Return the headers of an HTTP call, including the user agent and authorization.
+        """
+        req_headers = {}
+        req_headers["user-agent"] = "; ".join(self._user_agents)
+        if self.config.authorization:
+            req_headers["Authorization"] = self.config.authorization
+
+        req_headers.update(headers or {})
+        return req_headers
+
     def _http_request(
         self, verb: str, path: str, body, headers: Dict[str, Any]
     ) -> Tuple[Tuple[int, str], Dict[str, Any], str]:
@@ -3975,8 +5966,18 @@ class Shotgun(object):
         LOG.debug("Request headers are %s" % headers)
         LOG.debug("Request body is %s" % body)
 
+        # A connection checked out explicitly, by connect() for example, is kept
+        # by the thread. Otherwise it goes back to the pool once the response is
+        # read. On failure, it is closed since it may be in an unknown state.
+        release = self._connection is None
         conn = self._get_connection()
-        resp, content = conn.request(url, method=verb, body=body, headers=headers)
+        try:
+            resp, content = conn.request(url, method=verb, body=body, headers=headers)
+        except BaseException:
+            self._close_connection()
+            raise
+        if release:
+            self._release_connection()
         # http response code is handled else where
         http_status = (resp.status, resp.reason)
         resp_headers = dict((k.lower(), v) for k, v in resp.items())
@@ -4118,6 +6119,10 @@ class Shotgun(object):
 
         - changes timezones
         - converts dates and times to strings
+
+        The data is not modified. Lists, tuples and dicts holding no date or time, at
+        any depth, are returned as is: only the containers of the converted values are
+        copied.
         """
 
         if self.config.convert_datetimes_to_utc:
@@ -4157,12 +6162,57 @@ class Shotgun(object):
 
             return value
 
-        return self._visit_data(data, _outbound_visitor)
+        # Values which are never converted, checked by exact type as a shortcut.
+        scalar_types = (str, int, float, bool, type(None))
+
+        def _transform(value):
+            if type(value) in scalar_types:
+                return value
+
+            if isinstance(value, (list, tuple)):
+                result = None
+                for i, item in enumerate(value):
+                    if type(item) in scalar_types:
+                        continue
+                    new_item = _transform(item)
+                    if new_item is not item:
+                        if result is None:
+                            result = list(value)
+                        result[i] = new_item
+                if result is None:
+                    return value
+                return result if isinstance(value, list) else tuple(result)
+
+            if isinstance(value, dict):
+                result = None
+                for k, item in value.items():
+                    if type(item) in scalar_types:
+                        continue
+                    new_item = _transform(item)
+                    if new_item is not item:
+                        if result is None:
+                            result = dict(value)
+                        result[k] = new_item
+                return value if result is None else result
+
+            return _outbound_visitor(value)
+
+        return _transform(data)
 
     def _transform_inbound(self, data: T) -> T:
         """
         Transforms data types or values after they are received from the server.
         """
+        return self._visit_data(data, self._inbound_visitor())
+
+    def _inbound_visitor(self, check_pattern: bool = True) -> Callable[[Any], Any]:
+        """
+        Return the visitor converting the dates and times received from the server.
+
+        :param bool check_pattern: Whether strings are converted only when they look
+            like a date and time. When ``False``, any string which can be parsed as
+            a date and time is converted.
+        """
         # NOTE: The time zone is removed from the time after it is transformed
         # to the local time, otherwise it will fail to compare to datetimes
         # that do not have a time zone.
@@ -4176,7 +6226,9 @@ class Shotgun(object):
 
         def _inbound_visitor(value):
             if isinstance(value, str):
-                if len(value) == 20 and self._DATE_TIME_PATTERN.match(value):
+                if not check_pattern or (
+                    len(value) == 20 and self._DATE_TIME_PATTERN.match(value)
+                ):
                     try:
                         value = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
                     except ValueError:
@@ -4187,18 +6239,168 @@ class Shotgun(object):
 
             return value
 
-        return self._visit_data(data, _inbound_visitor)
+        return _inbound_visitor
+
+    def _read_inbound_transform(self, params: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Return the function transforming the responses of a read request.
+
+        The returned entities are processed in place, in a single pass: dates and times
+        are converted as in :meth:`_transform_inbound` and the records are parsed as in
+        :meth:`_parse_records`.
+
+        When ``config.schema_datetime_decoding`` is enabled and the schema of the entity
+        type can be read, only the values of the ``date_time`` fields are converted. The
+        values of the fields missing from the schema are still checked.
+
+        :param dict params: Read parameters built by :meth:`_prepare_find`.
+        """
+        # Fields known to hold dates and times, and to hold other values, when the
+        # schema is used. All the values are checked otherwise.
+        datetime_fields = set()
+        other_fields = set()
+        if (
+            self.config.schema_datetime_decoding
+            and self._get_field_types(params["type"]) is not None
+        ):
+            for field_name in params["return_fields"]:
+                # Deep links are in the form link_field.EntityType.field, possibly
+                # chained.
+                parts = field_name.split(".")
+                if len(parts) >= 3 and len(parts) % 2 == 1:
+                    field_types = self._get_field_types(parts[-2])
+                else:
+                    field_types = self._get_field_types(params["type"])
+                data_type = (field_types or {}).get(parts[-1])
+                if data_type == "date_time":
+                    datetime_fields.add(field_name)
+                elif data_type is not None:
+                    other_fields.add(field_name)
+
+        decode_datetime = self._inbound_visitor(check_pattern=False)
+        visitor = self._inbound_visitor()
+        transform_in_place = self._transform_inbound_in_place
+        local_path_field = self.client_caps.local_path_field
+        # Thumbnail urls are built for older (< 3.3.0) versions of Shotgun.
+        build_thumb_urls = bool(
+            self.server_caps.version and self.server_caps.version < (3, 3, 0)
+        )
+
+        def _transform(response):
+            try:
+                entities = response["results"]["entities"]
+            except (KeyError, TypeError):
+                return self._transform_inbound(response)
+
+            for rec in entities:
+                # skip results that aren't entity dictionaries
+                if not isinstance(rec, dict):
+                    continue
+
+                for k, v in rec.items():
+                    if not v:
+                        continue
+
+                    if k == "image" and build_thumb_urls:
+                        rec["image"] = self._build_thumb_url(rec["type"], rec["id"])
+                    elif isinstance(v, str):
+                        if k in datetime_fields:
+                            value = decode_datetime(v)
+                        elif k not in other_fields:
+                            value = visitor(v)
+                        else:
+                            value = v
+                        if value is not v:
+                            rec[k] = value
+                        elif "&lt;" in v:
+                            # Revert &lt; html entities that may be the result of
+                            # input sanitization mechanisms back to a litteral <.
+                            rec[k] = v.replace("&lt;", "<")
+                    elif isinstance(v, dict):
+                        if k not in other_fields:
+                            transform_in_place(v, visitor)
+                        if v.get("link_type") == "local" and local_path_field in v:
+                            local_path = v[local_path_field]
+                            v["local_path"] = local_path
+                            v["url"] = "file://%s" % (local_path or "",)
+                    elif isinstance(v, list) and k not in other_fields:
+                        transform_in_place(v, visitor)
+
+            return response
+
+        return _transform
+
+    def _transform_inbound_in_place(
+        self, data: Union[Dict[str, Any], List[Any]], visitor: Callable[[Any], Any]
+    ) -> None:
+        """
+        Walk the dicts and lists of the data and replace their values by the result of
+        the visitor, without copying them.
+        """
+        items = data.items() if isinstance(data, dict) else enumerate(data)
+        for k, v in items:
+            if isinstance(v, (dict, list)):
+                if v:
+                    self._transform_inbound_in_place(v, visitor)
+            elif v:
+                value = visitor(v)
+                if value is not v:
+                    data[k] = value
+
+    def _get_field_types(self, entity_type: str) -> Optional[Dict[str, str]]:
+        """
+        Return the data types of the fields of an entity type, by field name.
+
+        The schema of each entity type is read once, through the schema cache if it is
+        enabled.
+
+        :returns: dict of field names to data types, or ``None`` if the schema of the
+            entity type can't be read.
+        """
+        with self._field_types_lock:
+            if entity_type in self._field_types:
+                return self._field_types[entity_type]
+        try:
+            return self._set_field_types(entity_type, self.schema_field_read(entity_type))
+        except Exception as e:
+            LOG.debug("Unable to read the schema of %s: %s", entity_type, e)
+            return self._set_field_types(entity_type, None)
+
+    def _set_field_types(
+        self, entity_type: str, schema: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Store the data types of the fields of an entity type, read from its schema.
+
+        :param dict schema: Schema returned by :meth:`schema_field_read`, or ``None`` if
+            it can't be read.
+        :returns: dict of field names to data types, or ``None``.
+        """
+        field_types = None
+        if schema is not None:
+            field_types = dict(
+                (name, field["data_type"]["value"]) for name, field in schema.items()
+            )
+        with self._field_types_lock:
+            self._field_types[entity_type] = field_types
+        return field_types
 
     # ========================================================================
     # Connection Functions
 
     def _get_connection(self) -> Http:
         """
-        Return the current connection or creates a new connection to the current server.
+        Return the current thread's connection, checking one out of the pool if needed.
+
+        The connection stays checked out by the current thread until it is released
+        or closed.
         """
-        if self._connection is not None:
-            return self._connection
+        return self._connection_pool.checkout(self._create_connection)
 
+    def _create_connection(self) -> Http:
+        """
+        Create a new connection to the current server.
+        """
         if self.config.proxy_server:
             pi = ProxyInfo(
                 socks.PROXY_TYPE_HTTP,
@@ -4207,34 +6409,31 @@ class Shotgun(object):
                 proxy_user=self.config.proxy_user,
                 proxy_pass=self.config.proxy_pass,
             )
-            self._connection = Http(
+            return Http(
                 timeout=self.config.timeout_secs,
                 ca_certs=self.__ca_certs,
                 proxy_info=pi,
             )
         else:
-            self._connection = Http(
+            return Http(
                 timeout=self.config.timeout_secs,
                 ca_certs=self.__ca_certs,
                 proxy_info=None,
             )
 
-        return self._connection
+    def _release_connection(self) -> None:
+        """
+        Return the current thread's connection to the pool so it can be reused.
+        """
+        self._connection_pool.release()
 
     def _close_connection(self) -> None:
         """
-        Close the current connection.
-        """
-        if self._connection is None:
-            return
+        Close the current thread's connection, which can't be reused after an error.
 
-        for conn in self._connection.connections.values():
-            try:
-                conn.close()
-            except Exception:
-                pass
-        self._connection.connections.clear()
-        self._connection = None
+        The other connections of the pool are kept open.
+        """
+        self._connection_pool.discard()
         return
 
     # ========================================================================
@@ -4386,58 +6585,78 @@ class Shotgun(object):
         """
         filename = os.path.basename(path)
 
-        fd = open(path, "rb")
-        try:
-            content_type = mimetypes.guess_type(filename)[0]
-            content_type = content_type or "application/octet-stream"
-            file_size = os.fstat(fd.fileno())[stat.ST_SIZE]
-            self._upload_data_to_storage(fd, content_type, file_size, storage_url)
-        finally:
-            fd.close()
+        content_type = mimetypes.guess_type(filename)[0]
+        content_type = content_type or "application/octet-stream"
+        file_size = os.path.getsize(path)
+        # The file is streamed from disk as it is sent, whatever its size.
+        with _FileRegion(path, 0, file_size) as data:
+            self._upload_data_to_storage(data, content_type, file_size, storage_url)
 
         LOG.debug("File uploaded to Cloud storage: %s", filename)
 
     def _multipart_upload_file_to_storage(
-        self, path: str, upload_info: Dict[str, Any]
+        self,
+        path: str,
+        upload_info: Dict[str, Any],
+        upload_state: Optional[_UploadState] = None,
     ) -> None:
         """
         Internal function to upload a file to the Cloud storage in multiple parts.
 
         :param str path: Full path to an existing non-empty file on disk to upload.
         :param dict upload_info: Contains details received from the server, about the upload.
+        :param upload_state: Optional saved state of the upload. Parts it records as
+            uploaded are skipped, and the parts uploaded are recorded in it.
         """
 
-        fd = open(path, "rb")
-        try:
-            content_type = mimetypes.guess_type(path)[0]
-            content_type = content_type or "application/octet-stream"
-            file_size = os.fstat(fd.fileno())[stat.ST_SIZE]
-            filename = os.path.basename(path)
-
-            etags = []
-            part_number = 1
-            bytes_read = 0
-            chunk_size = self._MULTIPART_UPLOAD_CHUNK_SIZE
-            while bytes_read < file_size:
-                data = fd.read(chunk_size)
-                data_size = len(data)
-                # keep data as a stream so that we don't need to worry how it was
-                # encoded.
-                data = io.BytesIO(data)
-                bytes_read += data_size
-                part_url = self._get_upload_part_link(
-                    upload_info, filename, part_number
-                )
-                etags.append(
-                    self._upload_data_to_storage(
-                        data, content_type, data_size, part_url
-                    )
+        content_type = mimetypes.guess_type(path)[0]
+        content_type = content_type or "application/octet-stream"
+        file_size = os.path.getsize(path)
+        filename = os.path.basename(path)
+
+        chunk_size = self._MULTIPART_UPLOAD_CHUNK_SIZE
+        part_numbers = range(1, -(-file_size // chunk_size) + 1)
+
+        def upload_part(part_number):
+            offset = (part_number - 1) * chunk_size
+            data_size = min(chunk_size, file_size - offset)
+            part_url = self._get_upload_part_link(upload_info, filename, part_number)
+            # Each part is streamed from its own region of the file as it is sent,
+            # so that concurrent parts don't hold their data in memory.
+            with _FileRegion(path, offset, data_size) as data:
+                etag = self._upload_data_to_storage(
+                    data, content_type, data_size, part_url
                 )
-                part_number += 1
+            if upload_state is not None:
+                upload_state.add_part(part_number, etag)
+            return etag
 
-            self._complete_multipart_upload(upload_info, filename, etags)
-        finally:
-            fd.close()
+        uploaded = dict(upload_state.etags) if upload_state is not None else {}
+        remaining = [n for n in part_numbers if n not in uploaded]
+
+        workers = min(self.config.upload_part_workers, len(remaining))
+        if workers > 1:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [
+                    executor.submit(upload_part, part_number)
+                    for part_number in remaining
+                ]
+                for part_number, future in zip(remaining, futures):
+                    uploaded[part_number] = future.result()
+            finally:
+                # Parts not started yet are dropped if another one failed.
+                executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for part_number in remaining:
+                uploaded[part_number] = upload_part(part_number)
+
+        # Etags are sent in part order, whatever the order in which the parts
+        # completed.
+        etags = [uploaded[part_number] for part_number in part_numbers]
+        self._complete_multipart_upload(upload_info, filename, etags)
+        if upload_state is not None:
+            upload_state.complete()
 
         LOG.debug("File uploaded in multiple parts to Cloud storage: %s", path)
 
@@ -4478,7 +6697,7 @@ class Shotgun(object):
         # In case of success, we know we the second line of the response contains the
         # requested URL.
         if not result.startswith("1"):
-            raise ShotgunError("Unable get upload part link: %s" % result)
+            raise _UploadNotFoundError("Unable get upload part link: %s" % result)
 
         LOG.debug("Got next upload link from server for multipart upload.")
         return result.split("\n", 2)[1]
@@ -4498,8 +6717,11 @@ class Shotgun(object):
         """
 
         attempt = 1
+        start = data.tell()
         while attempt <= self.MAX_ATTEMPTS:
             try:
+                # A failed attempt may have consumed part of the stream.
+                data.seek(start)
                 opener = self._build_opener(urllib.request.HTTPHandler)
 
                 request = urllib.request.Request(storage_url, data=data)
@@ -4521,6 +6743,11 @@ class Shotgun(object):
                         "Got a %s response when uploading to %s: %s"
                         % (e.code, storage_url, e)
                     )
+                elif e.code == 404:
+                    # The multipart upload of the part is unknown to the storage.
+                    raise _UploadNotFoundError(
+                        "Upload not found when uploading to %s: %s" % (storage_url, e)
+                    )
                 else:
                     raise ShotgunError(
                         "Unanticipated error occurred uploading to %s: %s"
@@ -4573,7 +6800,7 @@ class Shotgun(object):
 
         # Response is of the form: 1\n or 0\n to indicate success or failure of the call.
         if not result.startswith("1"):
-            raise ShotgunError("Unable get upload part link: %s" % result)
+            raise _UploadNotFoundError("Unable get upload part link: %s" % result)
 
     def _requires_direct_s3_upload(
         self, entity_type: str, field_name: Optional[str]
@@ -4661,6 +6888,225 @@ class Shotgun(object):
             raise ShotgunError("Max attempts limit reached.")
 
 
+class BulkWriter(object):
+    """
+    Queue of create, update and delete requests sent to the server with
+    :meth:`~shotgun_api3.Shotgun.batch`.
+
+    Requests are queued until ``max_ops`` of them are waiting or the oldest one has
+    waited for ``max_latency`` seconds. They are then sent in a single batch request.
+    Each queued request returns a :class:`concurrent.futures.Future` resolved with the
+    result of the request once it has been sent, or with the error of the batch
+    request if it failed.
+
+    Use :meth:`~shotgun_api3.Shotgun.bulk_writer` to create a writer::
+
+        with sg.bulk_writer(max_ops=500, max_latency=0.5) as writer:
+            futures = [
+                writer.create("Shot", {"code": code, "project": project})
+                for code in codes
+            ]
+        ids = [future.result()["id"] for future in futures]
+
+    Queued updates of the same entity are merged into a single request, unless they
+    set ``multi_entity_update_modes`` or the entity was deleted or revived in between.
+    The writer can be shared between threads.
+    """
+
+    def __init__(
+        self, sg: "Shotgun", max_ops: int = 500, max_latency: Optional[float] = 0.5
+    ) -> None:
+        """
+        :param sg: Shotgun connection used to send the requests.
+        :param int max_ops: Number of queued requests triggering a batch request.
+        :param float max_latency: Maximum number of seconds a request is queued for, or
+            ``None`` to only send requests when ``max_ops`` is reached or on
+            :meth:`flush`.
+        """
+        if max_ops < 1:
+            raise ValueError("max_ops must be greater than 0")
+
+        self._sg = sg
+        self._max_ops = max_ops
+        self._max_latency = max_latency
+        self._condition = threading.Condition()
+        # Held while a batch is sent, so that batches are sent in order.
+        self._flush_lock = threading.Lock()
+        # Queued (request, future) tuples and the time the first one was queued.
+        self._queue: List[Tuple[Dict[str, Any], concurrent.futures.Future]] = []
+        self._queued_at = 0.0
+        # Queued updates which can be merged, indexed by (entity type, entity id).
+        self._updates: Dict[Tuple[str, int], int] = {}
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def create(
+        self,
+        entity_type: str,
+        data: Dict[str, Any],
+        return_fields: Optional[List[str]] = None,
+    ) -> concurrent.futures.Future:
+        """
+        Queue the creation of an entity.
+
+        :returns: Future resolved with the created entity, as returned by
+            :meth:`~shotgun_api3.Shotgun.create`.
+        """
+        request = {
+            "request_type": "create",
+            "entity_type": entity_type,
+            "data": dict(data),
+        }
+        if return_fields:
+            request["return_fields"] = return_fields
+        return self._queue_request(request)
+
+    def update(
+        self,
+        entity_type: str,
+        entity_id: int,
+        data: Dict[str, Any],
+        multi_entity_update_modes: Optional[Dict[str, Any]] = None,
+    ) -> concurrent.futures.Future:
+        """
+        Queue the update of an entity.
+
+        :returns: Future resolved with the updated entity, as returned by
+            :meth:`~shotgun_api3.Shotgun.update`. Merged updates share the same future.
+        """
+        request = {
+            "request_type": "update",
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "data": dict(data),
+        }
+        if multi_entity_update_modes:
+            request["multi_entity_update_modes"] = multi_entity_update_modes
+        return self._queue_request(request)
+
+    def delete(self, entity_type: str, entity_id: int) -> concurrent.futures.Future:
+        """
+        Queue the deletion of an entity.
+
+        :returns: Future resolved with ``True`` if the entity was deleted.
+        """
+        return self._queue_request(
+            {
+                "request_type": "delete",
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+            }
+        )
+
+    def flush(self) -> None:
+        """
+        Send the queued requests to the server and wait for the results.
+
+        Errors are not raised but set on the futures of the requests.
+        """
+        with self._flush_lock:
+            with self._condition:
+                queue = self._queue
+                self._queue = []
+                self._updates = {}
+
+            # Cancelled requests are not sent.
+            queue = [
+                (request, future)
+                for request, future in queue
+                if future.set_running_or_notify_cancel()
+            ]
+            if not queue:
+                return
+
+            try:
+                results = self._sg.batch([request for request, _ in queue])
+            except Exception as e:
+                for _, future in queue:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(queue, results):
+                    future.set_result(result)
+
+    def close(self) -> None:
+        """
+        Send the queued requests and stop the writer.
+
+        No request can be queued once the writer is closed.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _queue_request(self, request: Dict[str, Any]) -> concurrent.futures.Future:
+        """
+        Queue a request, merging it with a queued update of the same entity if possible.
+        """
+        key = (request["entity_type"], request.get("entity_id"))
+        with self._condition:
+            if self._closed:
+                raise ShotgunError("Cannot queue a request, the BulkWriter is closed.")
+
+            if request["request_type"] == "update":
+                index = self._updates.get(key)
+                if index is not None and "multi_entity_update_modes" not in request:
+                    queued, future = self._queue[index]
+                    queued["data"].update(request["data"])
+                    return future
+            # A later update cannot be merged with one sent before this request.
+            self._updates.pop(key, None)
+            if (
+                request["request_type"] == "update"
+                and "multi_entity_update_modes" not in request
+            ):
+                self._updates[key] = len(self._queue)
+
+            future = concurrent.futures.Future()
+            if not self._queue:
+                self._queued_at = time.time()
+            self._queue.append((request, future))
+            full = len(self._queue) >= self._max_ops
+
+            if self._max_latency is not None and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._flush_on_latency, name="BulkWriter", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+        if full:
+            self.flush()
+        return future
+
+    def _flush_on_latency(self) -> None:
+        """
+        Send the queued requests once the oldest one has waited for ``max_latency``.
+        """
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        delay = self._queued_at + self._max_latency - time.time()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+            self.flush()
+
+
 # Helpers from the previous API, left as is.
 # Based on http://code.activestate.com/recipes/146306/
 class FormPostHandler(urllib.request.BaseHandler):
@@ -4683,11 +7129,16 @@ class FormPostHandler(urllib.request.BaseHandler):
             if not files:
                 data = urllib.parse.urlencode(params, True).encode("utf-8")
                 # sequencing on
+                request.data = data
             else:
-                boundary, data = self.encode(params, files)
+                # Files are streamed as the request is sent, rather than being
+                # encoded in memory, so the length of the form is given upfront.
+                # It must be set after the data, which resets it.
+                boundary, content_length, data = self.encode_stream(params, files)
+                request.data = data
                 content_type = "multipart/form-data; boundary=%s" % boundary
                 request.add_unredirected_header("Content-Type", content_type)
-            request.data = data
+                request.add_unredirected_header("Content-Length", str(content_length))
 
         return request
 
@@ -4700,6 +7151,37 @@ class FormPostHandler(urllib.request.BaseHandler):
             boundary = uuid.uuid4()
         if buffer is None:
             buffer = io.BytesIO()
+        for segment in self._segments(params, files, boundary):
+            if isinstance(segment, bytes):
+                buffer.write(segment)
+            else:
+                fd = segment[0]
+                fd.seek(0)
+                shutil.copyfileobj(fd, buffer)
+        buffer = buffer.getvalue()
+        return boundary, buffer
+
+    def encode_stream(self, params, files, boundary=None):
+        """
+        Encode the form without reading the files.
+
+        :returns: Tuple of the boundary, the length of the encoded form and an
+            iterable of the encoded form, reading the files as it is consumed.
+        """
+        if boundary is None:
+            boundary = uuid.uuid4()
+        segments = list(self._segments(params, files, boundary))
+        content_length = sum(
+            len(segment) if isinstance(segment, bytes) else segment[1]
+            for segment in segments
+        )
+        return boundary, content_length, _FormBody(segments)
+
+    def _segments(self, params, files, boundary):
+        """
+        Yield the segments of the encoded form: bytes, or (file, size) tuples for the
+        contents of the files.
+        """
         for key, value in params:
             if isinstance(key, bytes):
                 key = key.decode("utf-8")
@@ -4710,11 +7192,9 @@ class FormPostHandler(urllib.request.BaseHandler):
                 # If value is not a string (e.g. int) cast to text
                 value = str(value)
 
-            buffer.write(f"--{boundary}\r\n".encode("utf-8"))
-            buffer.write(
-                f'Content-Disposition: form-data; name="{key}"'.encode("utf-8")
-            )
-            buffer.write(f"\r\n\r\n{value}\r\n".encode("utf-8"))
+            yield f"--{boundary}\r\n".encode("utf-8")
+            yield f'Content-Disposition: form-data; name="{key}"'.encode("utf-8")
+            yield f"\r\n\r\n{value}\r\n".encode("utf-8")
         for key, fd in files:
             # On Windows, it's possible that we were forced to open a file
             # with non-ascii characters as unicode. In that case, we need to
@@ -4731,25 +7211,56 @@ class FormPostHandler(urllib.request.BaseHandler):
             content_type = mimetypes.guess_type(filename)[0]
             content_type = content_type or "application/octet-stream"
             file_size = os.fstat(fd.fileno())[stat.ST_SIZE]
-            buffer.write(f"--{boundary}\r\n".encode("utf-8"))
+            yield f"--{boundary}\r\n".encode("utf-8")
             c_dis = 'Content-Disposition: form-data; name="%s"; filename="%s"%s'
             content_disposition = c_dis % (key, filename, "\r\n")
-            buffer.write(content_disposition.encode("utf-8"))
-            buffer.write(f"Content-Type: {content_type}\r\n".encode("utf-8"))
-            buffer.write(f"Content-Length: {file_size}\r\n".encode("utf-8"))
+            yield content_disposition.encode("utf-8")
+            yield f"Content-Type: {content_type}\r\n".encode("utf-8")
+            yield f"Content-Length: {file_size}\r\n".encode("utf-8")
 
-            buffer.write(b"\r\n")
-            fd.seek(0)
-            shutil.copyfileobj(fd, buffer)
-            buffer.write(b"\r\n")
-        buffer.write(f"--{boundary}--\r\n\r\n".encode("utf-8"))
-        buffer = buffer.getvalue()
-        return boundary, buffer
+            yield b"\r\n"
+            yield (fd, file_size)
+            yield b"\r\n"
+        yield f"--{boundary}--\r\n\r\n".encode("utf-8")
 
     def https_request(self, request):
         return self.http_request(request)
 
 
+class _FormBody(object):
+    """
+    Multipart form body encoded by :meth:`FormPostHandler.encode_stream`.
+
+    Iterating over the body yields its segments, reading the files one chunk at a
+    time. Each iteration starts again from the beginning of the files, so that a
+    request can be sent again.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, segments: List[Union[bytes, Tuple[BinaryIO, int]]]) -> None:
+        """
+        :param list segments: Bytes, or (file, size) tuples for the contents of files.
+        """
+        self._segments = segments
+
+    def __iter__(self) -> Iterator[bytes]:
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                yield segment
+                continue
+
+            fd, size = segment
+            fd.seek(0)
+            while size > 0:
+                chunk = fd.read(min(size, self.CHUNK_SIZE))
+                if not chunk:
+                    # The announced Content-Length can't be honored anymore.
+                    raise ShotgunError("File %s was truncated during upload" % fd.name)
+                size -= len(chunk)
+                yield chunk
+
+
 def _translate_filters(filters: Union[List, Tuple], filter_operator) -> Dict[str, Any]:
     """
     Translate filters params into data structure expected by rpc call.
@@ -4819,6 +7330,143 @@ def _translate_filters_simple(sg_filter):
     return condition
 
 
+def _extend_column(
+    column: Optional[Union[List, "array.array"]], values: List
+) -> Union[List, "array.array"]:
+    """
+    Append the values read from a page to a column built by find_columns().
+
+    Values which are all integers or all floats are stored in an :class:`array.array`.
+    The column is turned into a list as soon as it receives another type of value.
+
+    :param column: Column to extend, ``None`` for a new column.
+    :param list values: Values to append to the column.
+    :returns: The extended column.
+    """
+    value_types = set(map(type, values))
+    chunk = None
+    try:
+        if value_types == {int}:
+            chunk = array.array("q", values)
+        elif value_types == {float}:
+            chunk = array.array("d", values)
+    except OverflowError:
+        # Integers which don't fit in 64 bits are kept in a list.
+        pass
+
+    if column is None:
+        return chunk if chunk is not None else list(values)
+
+    if isinstance(column, array.array):
+        if chunk is not None and chunk.typecode == column.typecode:
+            column.extend(chunk)
+            return column
+        column = column.tolist()
+
+    column.extend(values)
+    return column
+
+
+_pwrite_lock = threading.Lock()
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    """
+    Write data at the given offset of a file descriptor shared between threads.
+    """
+    data = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while data:
+            written = os.pwrite(fd, data, offset)
+            data = data[written:]
+            offset += written
+        return
+
+    # Platforms without pwrite, like Windows, move the shared file position.
+    with _pwrite_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        while data:
+            data = data[os.write(fd, data) :]
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """
+    Write text to a file through a temporary file, so that an interrupted write or a
+    concurrent reader never sees a truncated file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "w") as fh:
+            fh.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _atomic_write_json(path: str, data: Any) -> None:
+    """
+    Write data as JSON to a file with :func:`_atomic_write`.
+    """
+    _atomic_write(path, json.dumps(data))
+
+
+def _batch_chunks(
+    calls: List[Dict[str, Any]], chunk_size: int, chunk_bytes: int
+) -> List[Tuple[int, int]]:
+    """
+    Split the calls of a batch request into chunks.
+
+    :param list calls: Calls built by :meth:`Shotgun._translate_batch_requests`.
+    :param int chunk_size: Maximum number of calls in a chunk, ``0`` for no limit.
+    :param int chunk_bytes: Maximum size in bytes of the JSON encoded calls of a chunk,
+        ``0`` for no limit.
+    :returns: List of ``(start, stop)`` slices of ``calls``.
+    """
+    if not chunk_size and not chunk_bytes:
+        return [(0, len(calls))]
+
+    chunks = []
+    start = 0
+    size = 0
+    for index, call in enumerate(calls):
+        if chunk_bytes:
+            # Values which are not JSON serializable, like dates, are converted
+            # before being sent. Their string form is close enough for an estimate.
+            call_bytes = len(
+                json.dumps(call, ensure_ascii=False, default=str).encode("utf-8")
+            )
+        else:
+            call_bytes = 0
+
+        if index > start and (
+            (chunk_size and index - start >= chunk_size)
+            or (chunk_bytes and size + call_bytes > chunk_bytes)
+        ):
+            chunks.append((start, index))
+            start = index
+            size = 0
+        size += call_bytes
+
+    chunks.append((start, len(calls)))
+    return chunks
+
+
+def _keyset_filters(filters: Dict[str, Any], last_id: int) -> Dict[str, Any]:
+    """
+    Restrict translated filters to the entities with an id greater than ``last_id``.
+    """
+    return {
+        "logical_operator": "and",
+        "conditions": [
+            filters,
+            {"path": "id", "relation": "greater_than", "values": [last_id]},
+        ],
+    }
+
+
 def _version_str(version) -> str:
     """
     Convert a tuple of int's to a '.' separated str.
@@ -12,6 +12,7 @@
 CRUD functions. These tests always use a mock http connection so not not
 need a live server to run against."""
 
+import array
 import configparser
 import base64
 import datetime
@@ -685,6 +686,184 @@ class TestShotgunClient(base.MockTestBase):
         self.assertEqual("/foo/bar.jpg", modified["foo"]["local_path"])
         self.assertEqual("file:///foo/bar.jpg", modified["foo"]["url"])
 
+    def _mock_read_pages(self, pages, with_counts=True):
+        """Setup mock responses from the PTR server for a paged read.
+
+        :param list pages: List of the entity lists returned for each page.
+        :param bool with_counts: Whether the paging info holds the entity count
+            or only a has_next_page flag.
+        """
+        entity_count = sum(len(p) for p in pages)
+
+        def read_page(verb, path, body, headers):
+            page = json.loads(body)["params"][1]["paging"]["current_page"]
+            entities = pages[page - 1] if page <= len(pages) else []
+            if with_counts:
+                paging_info = {"entity_count": entity_count}
+            else:
+                paging_info = {"has_next_page": page < len(pages)}
+            body = json.dumps(
+                {"results": {"entities": entities, "paging_info": paging_info}}
+            )
+            return ((200, "OK"), {"content-type": "application/json"}, body)
+
+        # create a new mock to reset call list etc.
+        self._setup_mock()
+        self.sg._http_request.side_effect = read_page
+        if not with_counts:
+            self.sg._server_caps = ServerCapabilities(
+                self.sg.config.server, {"version": [7, 4, 0]}
+            )
+
+    def _read_params(self, call_index):
+        """Return the read params sent for the given _http_request call."""
+        body = json.loads(self.sg._http_request.call_args_list[call_index][0][2])
+        return body["params"][1]
+
+    def test_find_iter(self):
+        """Records are yielded page by page with the same results as find"""
+        self.sg.config._records_per_page = 2
+        pages = [
+            [{"type": "Shot", "id": 1}, {"type": "Shot", "id": 2}],
+            [{"type": "Shot", "id": 3, "code": "a &lt; b"}],
+        ]
+        for with_counts in (True, False):
+            self._mock_read_pages(pages, with_counts)
+            expected = self.sg.find("Shot", [])
+            self.assertEqual(2, self.sg._http_request.call_count)
+            self.assertEqual("a < b", expected[2]["code"])
+
+            self._mock_read_pages(pages, with_counts)
+            result = self.sg.find_iter("Shot", [])
+            self.assertEqual(0, self.sg._http_request.call_count)
+            self.assertEqual(expected[0], next(result))
+            self.assertEqual(1, self.sg._http_request.call_count)
+            self.assertEqual(expected[1:], list(result))
+            self.assertEqual(2, self.sg._http_request.call_count)
+            self.assertEqual(2, self._read_params(1)["paging"]["current_page"])
+
+    def test_find_iter_limit(self):
+        """find_iter stops reading pages once the limit is reached"""
+        self.sg.config._records_per_page = 2
+        pages = [
+            [{"type": "Shot", "id": 1}, {"type": "Shot", "id": 2}],
+            [{"type": "Shot", "id": 3}, {"type": "Shot", "id": 4}],
+            [{"type": "Shot", "id": 5}],
+        ]
+        self._mock_read_pages(pages)
+        result = list(self.sg.find_iter("Shot", [], limit=3))
+        self.assertEqual([1, 2, 3], [r["id"] for r in result])
+        self.assertEqual(2, self.sg._http_request.call_count)
+
+        self._mock_read_pages(pages)
+        result = list(self.sg.find_iter("Shot", [], limit=2, page=2))
+        self.assertEqual([3, 4], [r["id"] for r in result])
+        self.assertEqual(1, self.sg._http_request.call_count)
+        self.assertEqual(2, self._read_params(0)["paging"]["current_page"])
+
+        # Invalid parameters are reported when find_iter() is called.
+        self.assertRaises(ValueError, self.sg.find_iter, "Shot", [], limit=-1)
+        self.assertRaises(ValueError, self.sg.find_iter, "Shot", [], page="2")
+
+    def test_find_keyset_paging(self):
+        """Pages are read from the id of the last record read"""
+        self.sg.config._records_per_page = 2
+        records = [{"type": "Shot", "id": i} for i in (3, 5, 8, 13, 21)]
+
+        def read_page(verb, path, body, headers):
+            params = json.loads(body)["params"][1]
+            last_id = 0
+            conditions = params["filters"]["conditions"]
+            if conditions and conditions[-1].get("path") == "id":
+                self.assertEqual("greater_than", conditions[-1]["relation"])
+                last_id = conditions[-1]["values"][0]
+            self.assertEqual(1, params["paging"]["current_page"])
+            self.assertEqual([{"field_name": "id", "direction": "asc"}], params["sorts"])
+            entities = [r for r in records if r["id"] > last_id][:2]
+            body = json.dumps({"results": {"entities": entities}})
+            return ((200, "OK"), {"content-type": "application/json"}, body)
+
+        self.sg._http_request.side_effect = read_page
+        result = self.sg.find("Shot", [["code", "is", "foo"]], keyset_paging=True)
+        self.assertEqual(records, result)
+        self.assertEqual(3, self.sg._http_request.call_count)
+        filters = self._read_params(2)["filters"]
+        self.assertEqual(
+            [{"path": "code", "relation": "is", "values": ["foo"]}],
+            filters["conditions"][0]["conditions"],
+        )
+        self.assertEqual([13], filters["conditions"][1]["values"])
+
+        self._setup_mock()
+        self.sg._http_request.side_effect = read_page
+        result = list(self.sg.find_iter("Shot", [], limit=3, keyset_paging=True))
+        self.assertEqual(records[:3], result)
+        self.assertEqual(2, self.sg._http_request.call_count)
+
+        self.assertRaises(
+            ValueError, self.sg.find, "Shot", [], page=2, keyset_paging=True
+        )
+        self.assertRaises(
+            ValueError,
+            self.sg.find,
+            "Shot",
+            [],
+            order=[{"field_name": "code"}],
+            keyset_paging=True,
+        )
+
+    def test_find_columns(self):
+        """Values are returned by field, in arrays for numeric fields"""
+        self.sg.config._records_per_page = 2
+        pages = [
+            [
+                {"type": "Shot", "id": 1, "code": "a &lt; b", "cut_in": 10},
+                {"type": "Shot", "id": 2, "code": "b", "cut_in": 20},
+            ],
+            [{"type": "Shot", "id": 3, "cut_in": None}],
+        ]
+        self._mock_read_pages(pages)
+        result = self.sg.find_columns("Shot", [], ["code", "cut_in", "sg_ratio"])
+        self.assertEqual(["id", "code", "cut_in", "sg_ratio"], list(result))
+        self.assertEqual(array.array("q", [1, 2, 3]), result["id"])
+        self.assertEqual(["a < b", "b", None], result["code"])
+        self.assertEqual([10, 20, None], result["cut_in"])
+        self.assertIsInstance(result["cut_in"], list)
+        self.assertEqual([None, None, None], result["sg_ratio"])
+
+        self._mock_read_pages([])
+        result = self.sg.find_columns("Shot", [], ["code"])
+        self.assertEqual({"id": [], "code": []}, result)
+
+    def test_find_concurrent_pages(self):
+        """Pages are read concurrently and returned in order"""
+        self.sg.config._records_per_page = 2
+        self.sg.config.read_page_workers = 3
+        pages = [
+            [{"type": "Shot", "id": i}, {"type": "Shot", "id": i + 1}]
+            for i in range(1, 20, 2)
+        ] + [[{"type": "Shot", "id": 21}]]
+        for with_counts in (True, False):
+            self._mock_read_pages(pages, with_counts)
+            result = self.sg.find("Shot", [])
+            self.assertEqual(list(range(1, 22)), [r["id"] for r in result])
+            if with_counts:
+                self.assertEqual(len(pages), self.sg._http_request.call_count)
+            else:
+                # pages past the last one may have been requested speculatively
+                self.assertLessEqual(
+                    len(pages), self.sg._http_request.call_count
+                )
+
+            self._mock_read_pages(pages, with_counts)
+            result = list(self.sg.find_iter("Shot", [], limit=5))
+            self.assertEqual([1, 2, 3, 4, 5], [r["id"] for r in result])
+            requested = set(
+                self._read_params(i)["paging"]["current_page"]
+                for i in range(self.sg._http_request.call_count)
+            )
+            self.assertEqual({1, 2, 3}, requested)
+
     def test_thumb_url(self):
         """Thumbnail endpoint used to get thumbnail url"""
 
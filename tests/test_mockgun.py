@@ -38,8 +38,12 @@ and can be run on their own by typing "python test_mockgun.py".
 import datetime
 import re
 import os
+import tempfile
+import threading
 import unittest
-from shotgun_api3.lib.mockgun import Shotgun as Mockgun
+from unittest import mock
+from shotgun_api3.lib.mockgun import Shotgun as Mockgun, MockgunError, SQLiteStorage
+from shotgun_api3.lib.mockgun.index import HashIndex, SortedIndex
 from shotgun_api3 import ShotgunError
 
 mockgun_schema_folder = os.path.join(os.path.dirname(__file__), "mockgun")
@@ -731,6 +735,535 @@ class TestFilterOperator(unittest.TestCase):
         )
 
 
+class MockgunTestBase(unittest.TestCase):
+    """
+    Base class for the tests which compare or seed Mockgun instances.
+    """
+
+    def setUp(self):
+        """
+        Defines the project linked to some of the shots created by _create_shots().
+        """
+        super().setUp()
+        self._project = {"type": "Project", "id": 2}
+
+    def _create_mockgun(self, storage=None):
+        """
+        Creates a Mockgun instance, stored in memory by default.
+        """
+        return Mockgun(
+            "https://test.shotgunstudio.com",
+            login="user",
+            password="1234",
+            storage=storage,
+        )
+
+    def _create_shots(self, mockgun, empty_codes=False):
+        """
+        Creates 3 projects and 30 shots, with some empty projects and a retired shot.
+
+        :param bool empty_codes: Whether some of the shots have no code.
+        """
+        projects = [mockgun.create("Project", {"name": "prj%d" % i}) for i in range(3)]
+        for i in range(30):
+            mockgun.create(
+                "Shot",
+                {
+                    "code": "Shot%d" % (i % 10) if i % 11 or not empty_codes else None,
+                    "project": projects[i % 3] if i % 4 else None,
+                    "sg_cut_order": i % 7,
+                },
+            )
+        mockgun.delete("Shot", 3)
+
+
+class TestIndexes(MockgunTestBase):
+    """
+    Checks that indexed queries return the same results as full scans.
+    """
+
+    def setUp(self):
+        """
+        Creates the same test data in an indexed and a plain Mockgun.
+        """
+        super().setUp()
+        self._indexed = self._create_mockgun()
+        self._indexed.create_index("Shot", "code")
+        self._indexed.create_index("Shot", "project")
+        self._indexed.create_index("Shot", "sg_cut_order", "sorted")
+        self._plain = self._create_mockgun()
+        for mockgun in (self._indexed, self._plain):
+            self._create_shots(mockgun)
+
+    def _assert_same(self, filters, **kwargs):
+        fields = ["code", "sg_cut_order"]
+        self.assertEqual(
+            self._plain.find("Shot", filters, fields, **kwargs),
+            self._indexed.find("Shot", filters, fields, **kwargs),
+        )
+
+    def test_queries(self):
+        """
+        Tests the operators using the indexes.
+        """
+        self._assert_same([["code", "is", "shot4"]])
+        self._assert_same([["code", "in", ["shot1", "SHOT2", None]]])
+        self._assert_same([["code", "in", "shot1", "shot2"]])
+        self._assert_same([["project", "is", self._project]])
+        self._assert_same([["project", "is", None]])
+        self._assert_same([["code", "is", "shot1"], ["project", "is", self._project]])
+        self._assert_same([["sg_cut_order", "between", [2, 4]], ["code", "is", "shot3"]])
+        self._assert_same([["code", "is", "shot1"]], retired_only=True)
+        self._assert_same([], order=[{"field_name": "sg_cut_order", "direction": "asc"}])
+        self._assert_same([], order=[{"field_name": "sg_cut_order", "direction": "desc"}])
+        self._assert_same(
+            [{"filter_operator": "any", "filters": [["code", "is", "shot1"]]}]
+        )
+
+        # Only the candidate rows are checked.
+        checked = []
+        compile_filters = self._indexed._compile_filters
+
+        def record_checked_rows(*args):
+            matches = compile_filters(*args)
+
+            def record(row):
+                checked.append(row["id"])
+                return matches(row)
+
+            return record
+
+        self._indexed._compile_filters = record_checked_rows
+        self._indexed.find(
+            "Shot", [["code", "is", "shot4"], ["sg_cut_order", "less_than", 3]]
+        )
+        self.assertEqual([15], checked)
+
+    def test_updates(self):
+        """
+        Tests that the indexes are kept up to date.
+        """
+        for mockgun in (self._indexed, self._plain):
+            mockgun.update("Shot", 5, {"code": "renamed", "sg_cut_order": 100})
+            mockgun.update("Shot", 6, {"project": None})
+            mockgun.revive("Shot", 3)
+        self._assert_same([["code", "is", "renamed"]])
+        self._assert_same([["code", "is", "shot4"]])
+        self._assert_same([["project", "is", None]])
+        self._assert_same([["sg_cut_order", "greater_than", 50]])
+        self._assert_same([["code", "is", "shot2"]])
+
+        # Direct edits of the database need the indexes to be rebuilt.
+        for mockgun in (self._indexed, self._plain):
+            mockgun._db["Shot"][7]["code"] = "edited"
+        self._indexed.rebuild_indexes()
+        self._assert_same([["code", "is", "edited"]])
+
+    def test_build(self):
+        """
+        Tests that indexes built over existing rows match the ones updated row by row.
+        """
+        for field_name, index_type, attribute in [
+            ("code", "hash", "_rows"),
+            ("sg_cut_order", "sorted", "_entries"),
+        ]:
+            self._plain.create_index("Shot", field_name, index_type)
+            built = self._plain._indexes["Shot"][field_name][index_type]
+            updated = self._indexed._indexes["Shot"][field_name][index_type]
+            self.assertEqual(getattr(updated, attribute), getattr(built, attribute))
+
+    def test_auto_index(self):
+        """
+        Tests that indexes are created when fields are queried.
+        """
+        self._plain.auto_index = True
+        self._plain.find("Shot", [["sg_status_list", "is", "ip"]])
+        self._plain.find("Shot", [["description", "contains", "a"]])
+        self.assertEqual(["sg_status_list"], list(self._plain._indexes["Shot"]))
+        self.assertRaises(MockgunError, self._plain.create_index, "Shot", "shots")
+
+
+class TestCompiledFilters(MockgunTestBase):
+    """
+    Checks that filters are compiled once per find() call.
+    """
+
+    def setUp(self):
+        """
+        Creates test data.
+        """
+        super().setUp()
+        self._mockgun = self._create_mockgun()
+        self._sequence = self._mockgun.create("Sequence", {"code": "seq"})
+        for i in range(5):
+            self._mockgun.create(
+                "Shot", {"code": "shot%d" % i, "sg_sequence": self._sequence}
+            )
+
+    def test_compiled_once(self):
+        """
+        Tests that field types are resolved once and not for every row.
+        """
+        filters = [
+            ["sg_sequence.Sequence.code", "is", "seq"],
+            ["code", "in", ["shot1", "shot3"]],
+        ]
+        call_counts = []
+        for _ in range(2):
+            with mock.patch.object(
+                self._mockgun, "_get_field_type", wraps=self._mockgun._get_field_type
+            ) as get_field_type:
+                shots = self._mockgun.find("Shot", filters)
+            self.assertEqual(2, len(shots))
+            call_counts.append(get_field_type.call_count)
+            for i in range(5, 10):
+                self._mockgun.create("Shot", {"code": "shot%d" % i})
+        self.assertEqual(call_counts[0], call_counts[1])
+
+    def test_errors_raised_for_rows(self):
+        """
+        Tests that errors in filters are only raised when rows are evaluated.
+        """
+        filters = [["code", "less_than", "shot1"]]
+        self.assertRaises(ShotgunError, self._mockgun.find, "Shot", filters)
+        self.assertEqual([], self._mockgun.find("Asset", filters))
+        self.assertRaises(
+            ShotgunError,
+            self._mockgun.find,
+            "Shot",
+            [["code", "is", "shot1"]],
+            filter_operator="some",
+        )
+
+
+class TestLimitAndPage(MockgunTestBase):
+    """
+    Checks the limit, page and order parameters of find().
+    """
+
+    def setUp(self):
+        """
+        Creates test data.
+        """
+        super().setUp()
+        self._mockgun = self._create_mockgun()
+        for i in range(20):
+            self._mockgun.create(
+                "Shot", {"code": "shot%02d" % i, "sg_cut_order": i % 3}
+            )
+
+    def _codes(self, *args, **kwargs):
+        shots = self._mockgun.find("Shot", [], ["code"], *args, **kwargs)
+        return [shot["code"] for shot in shots]
+
+    def test_limit_and_page(self):
+        """
+        Tests that limit and page return the same records as the server.
+        """
+        codes = ["shot%02d" % i for i in range(20)]
+        self.assertEqual(codes, self._codes())
+        self.assertEqual(codes[:5], self._codes(limit=5))
+        self.assertEqual(codes[5:10], self._codes(limit=5, page=2))
+        self.assertEqual([], self._codes(limit=5, page=5))
+        self.assertEqual(codes, self._codes(page=1))
+
+        # Pages are never bigger than the server's page size.
+        self._mockgun.server_info["api_max_entities_per_page"] = 8
+        self._mockgun.config._records_per_page = None
+        self.assertEqual(codes[8:16], self._codes(limit=10, page=2))
+        self.assertEqual(codes[:10], self._codes(limit=10))
+
+        self.assertRaises(ValueError, self._codes, limit=-1)
+        self.assertRaises(ValueError, self._codes, page="1")
+
+    def test_order(self):
+        """
+        Tests that the first order clause is the primary sort key.
+        """
+        order = [
+            {"field_name": "sg_cut_order", "direction": "desc"},
+            {"field_name": "code", "direction": "asc"},
+        ]
+        expected = sorted(
+            ("shot%02d" % i for i in range(20)),
+            key=lambda code: (-(int(code[4:]) % 3), code),
+        )
+        self.assertEqual(expected, self._codes(order=order))
+        self.assertEqual(expected[:4], self._codes(order=order, limit=4))
+        self.assertEqual(expected[4:8], self._codes(order=order, limit=4, page=2))
+
+        order = [{"field_name": "sg_cut_order", "direction": "desc"}]
+        self.assertEqual(
+            self._codes(order=order)[:3], self._codes(order=order, limit=3)
+        )
+        self.assertEqual(
+            {"type": "Shot", "id": 20, "code": "shot19"},
+            self._mockgun.find_one(
+                "Shot",
+                [],
+                ["code"],
+                order=[{"field_name": "code", "direction": "desc"}],
+            ),
+        )
+
+
+class TestSQLiteStorage(MockgunTestBase):
+    """
+    Checks that a Mockgun stored in SQLite behaves like one stored in memory.
+    """
+
+    def setUp(self):
+        """
+        Creates the same test data in memory and in a SQLite file.
+        """
+        super().setUp()
+        self._path = os.path.join(tempfile.mkdtemp(), "fixture.sqlite")
+        self._storage = SQLiteStorage(self._path)
+        self._sqlite = self._create_mockgun(self._storage)
+        self._memory = self._create_mockgun()
+        for mockgun in (self._sqlite, self._memory):
+            self._create_shots(mockgun, empty_codes=True)
+
+    def tearDown(self):
+        self._storage.close()
+
+    def _assert_same(self, filters, **kwargs):
+        fields = ["code", "sg_cut_order", "project.Project.name"]
+        self.assertEqual(
+            self._memory.find("Shot", filters, fields, **kwargs),
+            self._sqlite.find("Shot", filters, fields, **kwargs),
+        )
+
+    def test_queries(self):
+        """
+        Tests that the filters evaluated by SQLite return the same entities.
+        """
+        self._assert_same([])
+        self._assert_same([["code", "is", "shot4"]])
+        self._assert_same([["code", "is", None]])
+        self._assert_same([["code", "in", ["shot1", "SHOT2", None]]])
+        self._assert_same([["code", "contains", "1"]])
+        self._assert_same([["project", "is", self._project]])
+        self._assert_same([["project", "is", None]])
+        self._assert_same([["project.Project.name", "is", "prj1"]])
+        self._assert_same([["sg_cut_order", "between", [2, 4]]])
+        self._assert_same([["sg_cut_order", "less_than", 2]], retired_only=True)
+        self._assert_same(
+            [["code", "is", "shot1"], ["sg_cut_order", "greater_than", 3]],
+            filter_operator="any",
+        )
+        self._assert_same(
+            [
+                ["project", "is", self._project],
+                {
+                    "filter_operator": "any",
+                    "filters": [["code", "is", "shot1"], ["code", "is", "shot2"]],
+                },
+            ]
+        )
+        self._assert_same(
+            [], order=[{"field_name": "code", "direction": "desc"}], limit=5, page=2
+        )
+
+    def test_updates(self):
+        """
+        Tests that changes are saved to the file.
+        """
+        for mockgun in (self._sqlite, self._memory):
+            mockgun.update("Shot", 5, {"code": "renamed", "sg_cut_order": 100})
+            # Values which can't be evaluated by SQLite.
+            row = mockgun._db["Shot"][6]
+            row["sg_cut_order"] = "7"
+            mockgun._db["Shot"][6] = row
+            mockgun.revive("Shot", 3)
+        self._assert_same([["code", "is", "renamed"]])
+        self._assert_same([["sg_cut_order", "is", 100]])
+        self._assert_same([["sg_cut_order", "in", [0, "7"]]])
+        self._assert_same([["id", "is", 3]])
+
+        self._storage.commit()
+        storage = SQLiteStorage(self._path, read_only=True)
+        try:
+            mockgun = self._create_mockgun(storage)
+            self.assertEqual(
+                [{"type": "Shot", "id": 5, "code": "renamed"}],
+                mockgun.find("Shot", [["sg_cut_order", "is", 100]], ["code"]),
+            )
+            self.assertEqual(1, len(mockgun.find("EventLogEntry", [])))
+            self.assertRaises(MockgunError, mockgun.create, "Shot", {"code": "new"})
+        finally:
+            storage.close()
+
+    def test_threads(self):
+        """
+        Tests that the storage can be used from several threads.
+        """
+        results = []
+        errors = []
+
+        def find():
+            try:
+                for _ in range(20):
+                    results.append(self._sqlite.find("Shot", [], ["code"]))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=find) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(20):
+            self._sqlite.update("Shot", 5, {"sg_cut_order": 100})
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        expected = self._memory.find("Shot", [], ["code"])
+        self.assertEqual(80, len(results))
+        for result in results:
+            self.assertEqual(expected, result)
+
+
+class TestSnapshots(MockgunTestBase):
+    """
+    Checks that snapshots restore the state of the database.
+    """
+
+    def _create_fixture(self, mockgun):
+        self._sequence = mockgun.create("Sequence", {"code": "seq"})
+        for i in range(10):
+            mockgun.create(
+                "Shot",
+                {"code": "shot%d" % i, "sg_sequence": self._sequence, "assets": []},
+            )
+
+    def _change(self, mockgun):
+        asset = mockgun.create("Asset", {"code": "asset"})
+        mockgun.update("Shot", 1, {"code": "renamed"})
+        mockgun.update(
+            "Shot", 2, {"assets": [asset]}, multi_entity_update_modes={"assets": "add"}
+        )
+        mockgun.delete("Shot", 3)
+        mockgun.create("Shot", {"code": "new"})
+
+    def _state(self, mockgun):
+        return [
+            mockgun.find(entity_type, [], ["code", "assets"], retired_only=retired)
+            for entity_type in ("Shot", "Asset")
+            for retired in (False, True)
+        ]
+
+    def _test_snapshots(self, mockgun):
+        self._create_fixture(mockgun)
+        mockgun.create_index("Shot", "code")
+        baseline = mockgun.snapshot()
+        state = self._state(mockgun)
+
+        self._change(mockgun)
+        changed = self._state(mockgun)
+        self.assertNotEqual(state, changed)
+        changed_snapshot = mockgun.snapshot()
+
+        mockgun.restore(baseline)
+        self.assertEqual(state, self._state(mockgun))
+        self.assertEqual([], mockgun.find("Shot", [["code", "is", "new"]]))
+
+        # Snapshots can be restored several times.
+        self._change(mockgun)
+        mockgun.restore(baseline)
+        self.assertEqual(state, self._state(mockgun))
+        return changed_snapshot, changed
+
+    def test_memory(self):
+        """
+        Tests snapshots of the in-memory database.
+        """
+        mockgun = self._create_mockgun()
+        changed_snapshot, changed = self._test_snapshots(mockgun)
+        mockgun.restore(changed_snapshot)
+        self.assertEqual(changed, self._state(mockgun))
+
+        # Snapshots can be shared between instances.
+        other = self._create_mockgun()
+        other.restore(changed_snapshot)
+        self.assertEqual(changed, self._state(other))
+        self.assertRaises(MockgunError, other.restore, "mockgun_snapshot_1")
+
+    def test_returned_values(self):
+        """
+        Tests that changes to the values returned by find() never reach the snapshots.
+        """
+        mockgun = self._create_mockgun()
+        self._create_fixture(mockgun)
+        baseline = mockgun.snapshot()
+        state = self._state(mockgun)
+        link = {"type": "Sequence", "id": self._sequence["id"]}
+
+        # Filters on entity fields compare the names of the links.
+        shot = mockgun.find_one(
+            "Shot", [["sg_sequence", "name_contains", "seq"]], ["sg_sequence", "assets"]
+        )
+        self.assertEqual(link, shot["sg_sequence"])
+        shot["sg_sequence"]["id"] = 42
+        shot["assets"].append(link)
+
+        mockgun.restore(baseline)
+        self.assertEqual(state, self._state(mockgun))
+        self.assertEqual(10, len(mockgun.find("Shot", [["sg_sequence", "is", link]])))
+
+    def test_indexes(self):
+        """
+        Tests that indexes are restored from snapshots rather than rebuilt.
+        """
+        mockgun = self._create_mockgun()
+        self._create_fixture(mockgun)
+        mockgun.create_index("Shot", "code")
+        mockgun.create_index("Shot", "id", "sorted")
+        baseline = mockgun.snapshot()
+        self._change(mockgun)
+        mockgun.create_index("Shot", "sg_sequence")
+
+        with mock.patch.object(HashIndex, "build") as build, mock.patch.object(
+            SortedIndex, "build"
+        ) as build_sorted:
+            mockgun.restore(baseline)
+        build_sorted.assert_not_called()
+        # Only the index created after the snapshot was rebuilt.
+        self.assertEqual(1, build.call_count)
+
+        mockgun.restore(baseline)
+        self.assertEqual(
+            [{"type": "Shot", "id": 2}], mockgun.find("Shot", [["code", "is", "shot1"]])
+        )
+        self.assertEqual([], mockgun.find("Shot", [["code", "is", "renamed"]]))
+        self.assertEqual(10, len(mockgun.find("Shot", [["id", "less_than", 100]])))
+
+        # Changes made after a restore don't reach the snapshot.
+        self._change(mockgun)
+        mockgun.restore(baseline)
+        self.assertEqual([], mockgun.find("Shot", [["code", "is", "new"]]))
+        shots = mockgun.find("Shot", [["sg_sequence", "is", self._sequence]])
+        self.assertEqual(10, len(shots))
+
+    def test_sqlite(self):
+        """
+        Tests snapshots of a SQLite database.
+        """
+        storage = SQLiteStorage(
+            os.path.join(tempfile.mkdtemp(), "fixture.sqlite")
+        )
+        try:
+            mockgun = self._create_mockgun(storage)
+            changed_snapshot, _ = self._test_snapshots(mockgun)
+            # Snapshots taken after the restored one are lost.
+            self.assertRaises(MockgunError, mockgun.restore, changed_snapshot)
+            self.assertRaises(MockgunError, mockgun.restore, {})
+
+            baseline = mockgun.snapshot()
+            storage.commit()
+            self.assertRaises(MockgunError, mockgun.restore, baseline)
+        finally:
+            storage.close()
+
+
 class TestConfig(unittest.TestCase):
     """
     Tests the shotgun._Config class
@@ -10,8 +10,17 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
+import asyncio
+import datetime
+import http.server
+import io
+import json
 import os
+import shutil
 import ssl
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 import urllib.request
@@ -240,6 +249,1141 @@ class TestShotgunBatch(unittest.TestCase):
         del req["entity_id"]
         self.assertRaises(api.ShotgunError, self.sg.batch, [req])
 
+    def _delete_requests(self, count):
+        return [
+            {"request_type": "delete", "entity_type": "Shot", "entity_id": i}
+            for i in range(count)
+        ]
+
+    def _call_rpc(self, method, calls):
+        ids = [call["id"] for call in calls]
+        if 3 in ids:
+            raise api.Fault("cannot delete 3")
+        return ids
+
+    def test_chunks(self):
+        self.assertEqual([(0, 5)], api.shotgun._batch_chunks([{}] * 5, 0, 0))
+        self.assertEqual(
+            [(0, 2), (2, 4), (4, 5)], api.shotgun._batch_chunks([{}] * 5, 2, 0)
+        )
+        calls = [{"id": 1}, {"id": 2, "code": "x" * 20}, {"id": 3}, {"id": 4}]
+        # The second call is larger than the budget and is sent on its own.
+        self.assertEqual(
+            [(0, 1), (1, 2), (2, 4)], api.shotgun._batch_chunks(calls, 0, 25)
+        )
+        self.assertEqual(
+            [(0, 1), (1, 2), (2, 3), (3, 4)], api.shotgun._batch_chunks(calls, 1, 25)
+        )
+
+    def test_chunked_batch(self):
+        self.sg._call_rpc = mock.Mock(side_effect=self._call_rpc)
+        result = self.sg.batch(self._delete_requests(3), chunk_size=2)
+        self.assertEqual([0, 1, 2], result)
+        self.assertEqual(2, self.sg._call_rpc.call_count)
+        self.assertRaises(ValueError, self.sg.batch, [{}], chunk_size=-1)
+
+    def test_chunked_batch_errors(self):
+        self.sg._call_rpc = mock.Mock(side_effect=self._call_rpc)
+        with self.assertRaises(api.ShotgunBatchError) as cm:
+            self.sg.batch(self._delete_requests(7), chunk_size=2)
+        # Chunks are not sent after the first failure.
+        self.assertEqual([0, 1, None, None, None, None, None], cm.exception.results)
+        self.assertEqual([(2, 4)], [e[:2] for e in cm.exception.errors])
+        self.assertIsInstance(cm.exception.errors[0][2], api.Fault)
+        self.assertEqual(2, self.sg._call_rpc.call_count)
+
+        self.sg._call_rpc.reset_mock()
+        with self.assertRaises(api.ShotgunBatchError) as cm:
+            self.sg.batch(self._delete_requests(7), chunk_size=2, sequential=False)
+        self.assertEqual([0, 1, None, None, 4, 5, 6], cm.exception.results)
+        self.assertEqual([(2, 4)], [e[:2] for e in cm.exception.errors])
+        self.assertEqual(4, self.sg._call_rpc.call_count)
+
+        # Without chunks, errors are raised unchanged.
+        self.assertRaises(api.Fault, self.sg.batch, self._delete_requests(7))
+
+    def test_chunked_batch_connection_errors(self):
+        def call_rpc(method, calls):
+            if calls[0]["id"] == 2:
+                raise OSError("connection reset")
+            return [call["id"] for call in calls]
+
+        self.sg._call_rpc = mock.Mock(side_effect=call_rpc)
+        for sequential in (True, False):
+            with self.assertRaises(api.ShotgunBatchError) as cm:
+                self.sg.batch(
+                    self._delete_requests(6), chunk_size=2, sequential=sequential
+                )
+            self.assertEqual([0, 1], cm.exception.results[:2])
+            self.assertIsInstance(cm.exception.errors[0][2], OSError)
+
+
+class TestBulkWriter(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg.batch = mock.Mock(side_effect=self._batch)
+        self.next_id = 100
+
+    def _batch(self, requests):
+        results = []
+        for request in requests:
+            if request["request_type"] == "create":
+                self.next_id += 1
+                results.append(dict(request["data"], id=self.next_id))
+            elif request["request_type"] == "update":
+                results.append(dict(request["data"], id=request["entity_id"]))
+            else:
+                results.append(True)
+        return results
+
+    def test_max_ops(self):
+        with self.sg.bulk_writer(max_ops=2, max_latency=None) as writer:
+            first = writer.create("Shot", {"code": "a"})
+            second = writer.create("Shot", {"code": "b"})
+            self.assertEqual({"code": "a", "id": 101}, first.result(timeout=0))
+            self.assertEqual(102, second.result(timeout=0)["id"])
+            third = writer.delete("Shot", 101)
+            self.assertFalse(third.done())
+        self.assertTrue(third.result(timeout=0))
+        self.assertEqual(2, self.sg.batch.call_count)
+        self.assertRaises(api.ShotgunError, writer.delete, "Shot", 102)
+
+    def test_max_latency(self):
+        with self.sg.bulk_writer(max_ops=100, max_latency=0.05) as writer:
+            future = writer.create("Shot", {"code": "a"})
+            self.assertEqual(101, future.result(timeout=5)["id"])
+        self.assertEqual(1, self.sg.batch.call_count)
+
+    def test_merge_updates(self):
+        with self.sg.bulk_writer(max_latency=None) as writer:
+            first = writer.update("Shot", 1, {"code": "a", "description": "x"})
+            writer.update("Shot", 2, {"code": "b"})
+            second = writer.update("Shot", 1, {"code": "c"})
+            writer.delete("Shot", 1)
+            writer.update("Shot", 1, {"code": "d"})
+            writer.update("Shot", 2, {"tags": []}, {"tags": "add"})
+            writer.update("Shot", 2, {"code": "e"})
+        self.assertIs(first, second)
+        self.assertEqual(
+            {"code": "c", "description": "x", "id": 1}, first.result(timeout=0)
+        )
+        requests = self.sg.batch.call_args[0][0]
+        self.assertEqual(
+            [
+                ("update", 1, {"code": "c", "description": "x"}),
+                ("update", 2, {"code": "b"}),
+                ("delete", 1, None),
+                ("update", 1, {"code": "d"}),
+                ("update", 2, {"tags": []}),
+                ("update", 2, {"code": "e"}),
+            ],
+            [(r["request_type"], r["entity_id"], r.get("data")) for r in requests],
+        )
+
+    def test_errors(self):
+        self.sg.batch.side_effect = api.Fault("failed")
+        with self.sg.bulk_writer(max_latency=None) as writer:
+            future = writer.create("Shot", {"code": "a"})
+            cancelled = writer.create("Shot", {"code": "b"})
+            self.assertTrue(cancelled.cancel())
+        self.assertIsInstance(future.exception(timeout=0), api.Fault)
+        self.assertEqual(1, len(self.sg.batch.call_args[0][0]))
+
+
+class TestMultipartUpload(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg._MULTIPART_UPLOAD_CHUNK_SIZE = 4
+        self.sg._get_upload_part_link = mock.Mock(
+            side_effect=lambda info, filename, part_number: "url/%d" % part_number
+        )
+        self.sg._complete_multipart_upload = mock.Mock()
+        self.upload_info = {"upload_type": "Attachment"}
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, b"abcdefghijklmnopqrstuvwxyz")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def _upload_data(self, data, content_type, size, storage_url):
+        part_number = int(storage_url.split("/")[1])
+        # Complete the parts in reverse order.
+        time.sleep(0.01 * (7 - part_number))
+        return "%s:%s" % (part_number, data.read().decode("ascii"))
+
+    def test_parallel_parts(self):
+        self.sg.config.upload_part_workers = 4
+        self.sg._upload_data_to_storage = mock.Mock(side_effect=self._upload_data)
+        self.sg._multipart_upload_file_to_storage(self.path, self.upload_info)
+        etags = self.sg._complete_multipart_upload.call_args[0][2]
+        self.assertEqual(
+            ["1:abcd", "2:efgh", "3:ijkl", "4:mnop", "5:qrst", "6:uvwx", "7:yz"],
+            etags,
+        )
+
+    def test_serial_parts(self):
+        self.sg.config.upload_part_workers = 1
+        self.sg._upload_data_to_storage = mock.Mock(side_effect=self._upload_data)
+        self.sg._multipart_upload_file_to_storage(self.path, self.upload_info)
+        self.assertEqual(7, len(self.sg._complete_multipart_upload.call_args[0][2]))
+
+    def test_failed_part(self):
+        def upload_data(data, content_type, size, storage_url):
+            if storage_url == "url/2":
+                raise api.ShotgunError("Max attempts limit reached.")
+            return "etag"
+
+        self.sg.config.upload_part_workers = 4
+        self.sg._upload_data_to_storage = mock.Mock(side_effect=upload_data)
+        self.assertRaises(
+            api.ShotgunError,
+            self.sg._multipart_upload_file_to_storage,
+            self.path,
+            self.upload_info,
+        )
+        self.assertFalse(self.sg._complete_multipart_upload.called)
+
+    def test_resume(self):
+        self.sg.config.upload_state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.sg.config.upload_state_dir)
+        self.sg.config.upload_part_workers = 1
+        self.sg._get_attachment_upload_info = mock.Mock(
+            return_value=dict(self.upload_info, upload_id="id", upload_info="info")
+        )
+        self.sg._send_form = mock.Mock(return_value="1:42\n")
+        self.sg._auth_params = mock.Mock(return_value={})
+        uploaded = []
+
+        def upload_data(data, content_type, size, storage_url):
+            if storage_url == "url/3" and "url/3" not in uploaded:
+                uploaded.append(storage_url)
+                raise api.ShotgunError("Max attempts limit reached.")
+            uploaded.append(storage_url)
+            return storage_url
+
+        self.sg._upload_data_to_storage = mock.Mock(side_effect=upload_data)
+        args = ("Attachment", 1, self.path, None, None, None, False)
+        self.assertRaises(api.ShotgunError, self.sg._upload_to_storage, *args)
+        self.assertEqual(1, len(os.listdir(self.sg.config.upload_state_dir)))
+
+        self.assertEqual(42, self.sg._upload_to_storage(*args))
+        # The upload resumed from the part which failed.
+        self.assertEqual(
+            ["url/1", "url/2", "url/3", "url/3", "url/4", "url/5", "url/6", "url/7"],
+            uploaded,
+        )
+        self.sg._get_attachment_upload_info.assert_called_once()
+        self.assertEqual(
+            ["url/%d" % n for n in range(1, 8)],
+            self.sg._complete_multipart_upload.call_args[0][2],
+        )
+        self.assertEqual([], os.listdir(self.sg.config.upload_state_dir))
+
+    def test_resume_failed(self):
+        self.sg.config.upload_state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.sg.config.upload_state_dir)
+        self.sg.config.upload_part_workers = 1
+        upload_ids = iter(["expired", "new", "newer"])
+        self.sg._get_attachment_upload_info = mock.Mock(
+            side_effect=lambda *args: dict(
+                self.upload_info, upload_id=next(upload_ids), upload_info="info"
+            )
+        )
+        self.sg._send_form = mock.Mock(return_value="1:42\n")
+        self.sg._auth_params = mock.Mock(return_value={})
+        self.sg._upload_data_to_storage = mock.Mock(
+            side_effect=["etag", api.ShotgunError("Max attempts limit reached.")]
+        )
+        args = ("Attachment", 1, self.path, None, None, None, False)
+        self.assertRaises(api.ShotgunError, self.sg._upload_to_storage, *args)
+
+        # Other errors keep the saved upload, which is resumed.
+        self.sg._upload_data_to_storage = mock.Mock(return_value="etag")
+        self.sg._complete_multipart_upload.side_effect = [
+            api.ShotgunError("Connection reset"),
+            api.shotgun._UploadNotFoundError("NoSuchUpload"),
+            None,
+        ]
+        self.assertRaises(api.ShotgunError, self.sg._upload_to_storage, *args)
+        self.assertEqual(6, self.sg._upload_data_to_storage.call_count)
+        self.assertEqual(1, len(os.listdir(self.sg.config.upload_state_dir)))
+
+        # The saved upload is no longer known, so a new one is started.
+        self.assertEqual(42, self.sg._upload_to_storage(*args))
+        self.assertEqual(
+            ["expired", "expired", "new"],
+            [
+                call[0][0]["upload_id"]
+                for call in self.sg._complete_multipart_upload.call_args_list
+            ],
+        )
+        self.assertEqual([], os.listdir(self.sg.config.upload_state_dir))
+
+    def test_resume_expired(self):
+        state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, state_dir)
+        args = (state_dir, "server", self.path, False, 5)
+        state = api.shotgun._UploadState(*args)
+        state.start(self.upload_info)
+        self.assertEqual(self.upload_info, api.shotgun._UploadState(*args).upload_info)
+
+        with mock.patch("time.time", return_value=time.time() + 3601):
+            self.assertIsNone(api.shotgun._UploadState(*args, ttl=3600).upload_info)
+        self.assertEqual([], os.listdir(state_dir))
+
+    def test_file_region(self):
+        with api.shotgun._FileRegion(self.path, 4, 6) as region:
+            self.assertEqual(b"ef", region.read(2))
+            self.assertEqual(2, region.tell())
+            self.assertEqual(b"ghij", region.read())
+            self.assertEqual(b"", region.read(1))
+            self.assertEqual(0, region.seek(0))
+            self.assertEqual(b"efghij", region.read(100))
+        self.assertTrue(region.closed)
+
+        storage_urls = []
+
+        def upload_data(data, content_type, size, storage_url):
+            storage_urls.append(storage_url)
+            self.assertEqual(26, size)
+            self.assertEqual(b"abcdefghijklmnopqrstuvwxyz", data.read())
+
+        self.sg._upload_data_to_storage = mock.Mock(side_effect=upload_data)
+        self.sg._upload_file_to_storage(self.path, "http://storage/file")
+        self.assertEqual(["http://storage/file"], storage_urls)
+
+    def test_retry_rewinds_data(self):
+        response = mock.Mock()
+        response.info.return_value = {"Etag": "etag"}
+        bodies = []
+
+        def make_upload_request(request, opener):
+            bodies.append(request.data.read())
+            if len(bodies) == 1:
+                raise urllib.error.URLError("connection reset")
+            return response
+
+        self.sg.BACKOFF = 0
+        self.sg._make_upload_request = mock.Mock(side_effect=make_upload_request)
+        etag = self.sg._upload_data_to_storage(
+            io.BytesIO(b"data"), "text/plain", 4, "http://storage/part"
+        )
+        self.assertEqual("etag", etag)
+        self.assertEqual([b"data", b"data"], bodies)
+
+
+class TestFormPostHandler(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".png")
+        os.write(fd, b"0123456789" * 100)
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_streamed_form(self):
+        handler = api.shotgun.FormPostHandler()
+        handler_cls = api.shotgun._FormBody
+        with open(self.path, "rb") as fd, mock.patch.object(
+            handler_cls, "CHUNK_SIZE", 64
+        ):
+            request = urllib.request.Request(
+                "http://server_path/upload/upload_file", {"name": "x", "file": fd}
+            )
+            request = handler.http_request(request)
+            boundary = request.get_header("Content-type").split("boundary=")[1]
+            chunks = list(request.data)
+            # The body can be sent again, for a retry.
+            self.assertEqual(chunks, list(request.data))
+            _, expected = handler.encode([("name", "x")], [("file", fd)], boundary)
+
+        self.assertEqual(expected, b"".join(chunks))
+        self.assertEqual(str(len(expected)), request.get_header("Content-length"))
+        # The file is read one chunk at a time.
+        self.assertIn(b"0123456789" * 6 + b"0123", chunks)
+        self.assertIn(b"456789" + b"0123456789" * 5 + b"01234567", chunks)
+
+
+class TestDownloadAttachment(unittest.TestCase):
+    """Test attachment downloads against a local HTTP server."""
+
+    def setUp(self):
+        self.content = os.urandom(1000)
+        self.ranges = True
+        self.requests = []
+        self.fail_ranges = set()
+        test = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                byte_range = self.headers.get("Range")
+                test.requests.append(byte_range)
+                if byte_range in test.fail_ranges:
+                    test.fail_ranges.remove(byte_range)
+                    self.send_error(403)
+                    return
+                if self.headers.get("If-None-Match") == '"etag"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                if test.ranges and byte_range:
+                    start, end = byte_range[len("bytes=") :].split("-")
+                    body = test.content[int(start) : int(end) + 1]
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range",
+                        "bytes %s-%s/%d" % (start, end, len(test.content)),
+                    )
+                    self.send_header("ETag", '"etag"')
+                else:
+                    body = test.content
+                    self.send_response(200)
+                    self.send_header("ETag", '"etag"')
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = "http://127.0.0.1:%d/file" % server.server_port
+
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg._DOWNLOAD_PART_SIZE = 100
+        self.sg.config.download_part_workers = 4
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, "file")
+
+    def _download(self, resume=False):
+        return self.sg.download_attachment(
+            {"url": self.url}, file_path=self.path, resume=resume
+        )
+
+    def _read(self):
+        with open(self.path, "rb") as fh:
+            return fh.read()
+
+    def test_parts(self):
+        self.assertEqual(self.path, self._download())
+        self.assertEqual(self.content, self._read())
+        self.assertEqual(11, len(self.requests))
+        self.assertIn("bytes=900-999", self.requests)
+        self.assertEqual(["file"], os.listdir(self.tmp_dir))
+
+    def test_no_ranges(self):
+        self.ranges = False
+        self._download()
+        self.assertEqual(self.content, self._read())
+        self.assertEqual(["bytes=0-0"], self.requests)
+
+    def test_resume(self):
+        self.sg.config.download_part_workers = 1
+        self.fail_ranges.add("bytes=500-599")
+        self.assertRaises(api.ShotgunFileDownloadError, self._download, True)
+        self.assertTrue(os.path.exists(self.path + ".download"))
+
+        self.requests = []
+        self._download(resume=True)
+        self.assertEqual(self.content, self._read())
+        self.assertEqual(
+            ["bytes=0-0"]
+            + ["bytes=%d-%d" % (n, n + 99) for n in range(500, 1000, 100)],
+            self.requests,
+        )
+        self.assertEqual(["file"], os.listdir(self.tmp_dir))
+
+        # A file without a matching state is downloaded again.
+        with open(self.path, "r+b") as fh:
+            fh.truncate(250)
+        self.requests = []
+        self._download(resume=True)
+        self.assertEqual(self.content, self._read())
+        self.assertEqual(11, len(self.requests))
+
+        self.fail_ranges.add("bytes=500-599")
+        self.assertRaises(api.ShotgunFileDownloadError, self._download, True)
+        # The file changed size on the server.
+        self.content = os.urandom(900)
+        self.requests = []
+        self._download(resume=True)
+        self.assertEqual(self.content, self._read())
+        self.assertEqual(10, len(self.requests))
+
+        self.assertRaises(
+            ValueError, self.sg.download_attachment, {"url": self.url}, resume=True
+        )
+
+    def test_download_attachments(self):
+        self.sg.config.download_part_workers = 1
+        self.sg._build_download_opener = mock.Mock(
+            wraps=self.sg._build_download_opener
+        )
+        self.fail_ranges.add(None)
+        items = [
+            ({"url": self.url}, os.path.join(self.tmp_dir, "file%d" % i))
+            for i in range(5)
+        ]
+        items.append(({"url": self.url}, None))
+        items.append((None, None))
+        # Invalid items are reported like failed downloads.
+        items.append(({"type": "Version", "id": 1}, None))
+        items.append(("bad", None))
+
+        report = self.sg.download_attachments(items, max_workers=3)
+
+        # One of the downloads got a 403 error.
+        self.assertEqual(3, report["errors"])
+        results = report["results"]
+        self.assertEqual(
+            [item[1] for item in items], [r["file_path"] for r in results]
+        )
+        self.assertIsInstance(results[7]["error"], ValueError)
+        self.assertIsInstance(results[8]["error"], TypeError)
+        failed = [r for r in results[:7] if r["error"] is not None][0]
+        self.assertIsInstance(failed["error"], api.ShotgunFileDownloadError)
+        self.assertEqual(0, failed["size"])
+        for result in results[:5]:
+            if result is not failed:
+                self.assertEqual(result["file_path"], result["result"])
+                with open(result["file_path"], "rb") as fh:
+                    self.assertEqual(self.content, fh.read())
+        if results[5] is not failed:
+            self.assertEqual(self.content, results[5]["result"])
+        self.assertIsNone(results[6]["result"])
+        self.assertEqual(0, results[6]["size"])
+        self.assertEqual(5000, report["size"])
+        self.assertGreater(report["bytes_per_second"], 0)
+        # The opener is built once and shared by the downloads.
+        self.sg._build_download_opener.assert_called_once_with(self.url)
+
+    def test_cache(self):
+        self.sg.config.download_part_workers = 1
+        self.sg.config.attachment_cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.sg.get_attachment_download_url = mock.Mock(return_value=self.url)
+
+        # Uploaded attachments are served from the cache without any request.
+        self.sg.download_attachment(42, file_path=self.path)
+        self.assertEqual([None], self.requests)
+        other_path = os.path.join(self.tmp_dir, "other")
+        self.assertEqual(other_path, self.sg.download_attachment(42, other_path))
+        self.assertEqual(self.content, self.sg.download_attachment(42))
+        self.assertEqual([None], self.requests)
+        with open(other_path, "rb") as fh:
+            self.assertEqual(self.content, fh.read())
+        # Downloaded files are writable copies of the cached files.
+        self.assertNotEqual(os.stat(self.path).st_ino, os.stat(other_path).st_ino)
+        with open(other_path, "ab") as fh:
+            fh.write(b"modified")
+        self.assertEqual(self.content, self.sg.download_attachment(42))
+
+        # Urls are revalidated with their ETag.
+        self.sg.download_attachment({"url": self.url}, file_path=self.path)
+        self.sg.download_attachment({"url": self.url}, file_path=self.path)
+        self.assertEqual([None, None, None], self.requests)
+        self.assertEqual(self.content, self._read())
+
+        # Both keys point to the same object.
+        self.assertEqual(
+            {"hits": 4, "misses": 2, "evictions": 0, "entries": 1, "size": 1000},
+            self.sg.attachment_cache_stats(),
+        )
+
+        # The least recently used object is evicted above the size of the cache.
+        self.sg.config.attachment_cache_size = 1500
+        self.content = os.urandom(1000)
+        self.sg.download_attachment(43)
+        stats = self.sg.attachment_cache_stats()
+        self.assertEqual(1, stats["evictions"])
+        self.assertEqual(1, stats["entries"])
+        self.assertEqual(self.content, self.sg.download_attachment(43))
+        self.sg.download_attachment(42)
+        self.assertEqual(4, self.sg.attachment_cache_stats()["misses"])
+
+    def test_cache_hard_links(self):
+        self.sg.config.download_part_workers = 1
+        self.sg.config.attachment_cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.sg.config.attachment_cache_hard_links = True
+        self.sg.get_attachment_download_url = mock.Mock(return_value=self.url)
+        self.sg.download_attachment(42, file_path=self.path)
+        other_path = os.path.join(self.tmp_dir, "other")
+        self.sg.download_attachment(42, file_path=other_path)
+        self.assertEqual(os.stat(self.path).st_ino, os.stat(other_path).st_ino)
+
+    def test_cache_revalidation_error(self):
+        self.sg.config.download_part_workers = 1
+        self.sg.config.attachment_cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.sg.download_attachment({"url": self.url}, file_path=self.path)
+        self.fail_ranges.add(None)
+        with self.assertRaises(api.ShotgunFileDownloadError):
+            self.sg.download_attachment({"url": self.url}, file_path=self.path)
+        self.assertEqual(self.content, self._read())
+
+    def test_cache_failed_parts(self):
+        self.sg.config.download_part_workers = 2
+        self.sg.config.attachment_cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.fail_ranges.add("bytes=500-599")
+        with self.assertRaises(api.ShotgunFileDownloadError):
+            self.sg.download_attachment({"url": self.url}, file_path=self.path)
+        # Neither the partial file nor its download state are left in the cache.
+        self.assertEqual([], os.listdir(self.sg._get_attachment_cache()._tmp_dir))
+
+    def test_cache_disabled(self):
+        self.assertEqual(0, self.sg.attachment_cache_stats()["hits"])
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg._server_caps = api.shotgun.ServerCapabilities(
+            "server_path", {"version": [8, 0, 0]}
+        )
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.sg.config.schema_cache_dir = self.tmp_dir
+        self.schema = {"Shot": {"code": {"data_type": {"value": "text"}}}}
+        self.sg._call_rpc = mock.Mock(side_effect=lambda *args: self.schema)
+
+    def test_cache(self):
+        project = {"type": "Project", "id": 1, "name": "project"}
+        self.assertEqual(self.schema, self.sg.schema_read())
+        self.assertEqual(self.schema, self.sg.schema_read())
+        self.assertEqual(self.schema, self.sg.schema_read(project))
+        self.assertEqual(self.schema, self.sg.schema_read({"type": "Project", "id": 1}))
+        self.assertEqual(self.schema, self.sg.schema_field_read("Shot", "code"))
+        self.assertEqual(self.schema, self.sg.schema_field_read("Shot", "code"))
+        self.assertEqual(
+            [
+                mock.call("schema_read", None),
+                mock.call("schema_read", {"project": project}),
+                mock.call("schema_field_read", {"type": "Shot", "field_name": "code"}),
+            ],
+            self.sg._call_rpc.call_args_list,
+        )
+
+        # Another client of the same server reads the cache from disk.
+        sg = api.Shotgun("http://server_path", "script_name", "api_key", connect=False)
+        sg._server_caps = self.sg._server_caps
+        sg.config.schema_cache_dir = self.tmp_dir
+        sg._call_rpc = mock.Mock()
+        self.assertEqual(self.schema, sg.schema_read())
+        sg._call_rpc.assert_not_called()
+
+        # A new server version invalidates the cache.
+        sg._server_caps = api.shotgun.ServerCapabilities(
+            "server_path", {"version": [8, 1, 0]}
+        )
+        sg._call_rpc = mock.Mock(return_value={})
+        self.assertEqual({}, sg.schema_read())
+        sg._call_rpc.assert_called_once()
+
+        # Schema modifications clear the cache.
+        self.sg.schema_field_delete("Shot", "code")
+        self.sg._call_rpc.reset_mock()
+        self.sg.schema_read()
+        self.sg._call_rpc.assert_called_once_with("schema_read", None)
+
+    def test_background_refresh(self):
+        self.sg.schema_read()
+        self.sg.config.schema_cache_ttl = 0
+        time.sleep(0.01)
+        old_schema = self.schema
+        self.schema = {"Shot": {}}
+        # The expired entry is returned while it is read again.
+        self.assertEqual(old_schema, self.sg.schema_read())
+        for thread in list(self.sg._schema_cache.refreshing.values()):
+            thread.join()
+        self.assertEqual(2, self.sg._call_rpc.call_count)
+        self.sg.config.schema_cache_ttl = None
+        self.assertEqual(self.schema, self.sg.schema_read())
+        self.assertEqual(2, self.sg._call_rpc.call_count)
+
+    def test_users(self):
+        self.sg.schema_read()
+        # Each user has its own schema.
+        for kwargs in [
+            {"script_name": "script_name", "api_key": "api_key", "sudo_as_login": "a"},
+            {"session_token": "token_a"},
+            {"session_token": "token_b"},
+        ]:
+            sg = api.Shotgun("http://server_path", connect=False, **kwargs)
+            sg._server_caps = self.sg._server_caps
+            sg.config.schema_cache_dir = self.tmp_dir
+            sg._call_rpc = mock.Mock(return_value={})
+            self.assertEqual({}, sg.schema_read())
+            self.assertEqual({}, sg.schema_read())
+            sg._call_rpc.assert_called_once()
+
+    def test_datetimes(self):
+        self.schema = {"Shot": {"sg_date": {"default_value": {"value": None}}}}
+        self.schema["Shot"]["sg_date"]["default_value"]["value"] = (
+            self.sg._transform_inbound("2024-01-02T03:04:05Z")
+        )
+        self.sg.schema_read()
+        self.assertEqual(self.schema, self.sg.schema_read())
+        self.assertEqual(1, self.sg._call_rpc.call_count)
+
+
+class TestSchemaDatetimeDecoding(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg._server_caps = api.shotgun.ServerCapabilities(
+            "server_path", {"version": [8, 0, 0]}
+        )
+        self.sg.config.schema_datetime_decoding = True
+        schemas = {
+            "Shot": {
+                "code": "text",
+                "updated_at": "date_time",
+                "sg_sequence": "entity",
+            },
+            "Sequence": {"created_at": "date_time", "code": "text"},
+        }
+
+        def schema_field_read(entity_type):
+            if entity_type not in schemas:
+                raise api.Fault("Unknown entity type")
+            return dict(
+                (name, {"data_type": {"value": data_type}})
+                for name, data_type in schemas[entity_type].items()
+            )
+
+        self.sg.schema_field_read = mock.Mock(side_effect=schema_field_read)
+        self.date = "2024-01-02T03:04:05Z"
+        self.expected = self.sg._transform_inbound(self.date)
+        self.entity = {
+            "type": "Shot",
+            "id": 1,
+            "code": self.date,
+            "updated_at": self.date,
+            "sg_sequence.Sequence.created_at": self.date,
+            "sg_sequence.Sequence.code": self.date,
+            "sg_unknown": [self.date],
+        }
+        body = json.dumps(
+            {
+                "results": {
+                    "entities": [self.entity],
+                    "paging_info": {"has_next_page": False},
+                }
+            }
+        )
+        self.sg._make_call = mock.Mock(
+            return_value=((200, "OK"), {"content-type": "application/json"}, body)
+        )
+
+    def test_find(self):
+        entity = self.sg.find("Shot", [], list(self.entity))[0]
+        self.assertEqual(self.date, entity["code"])
+        self.assertEqual(self.expected, entity["updated_at"])
+        self.assertEqual(self.expected, entity["sg_sequence.Sequence.created_at"])
+        self.assertEqual(self.date, entity["sg_sequence.Sequence.code"])
+        # Fields missing from the schema are still converted.
+        self.assertEqual([self.expected], entity["sg_unknown"])
+
+        # The schema is read once by entity type.
+        self.sg.find("Shot", [], list(self.entity))
+        self.assertEqual(2, self.sg.schema_field_read.call_count)
+
+    def test_no_schema(self):
+        entity = self.sg.find("Asset", [], list(self.entity))[0]
+        self.assertEqual(self.expected, entity["code"])
+        self.assertEqual(self.expected, entity["updated_at"])
+
+
+class TestReadInboundTransform(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg._server_caps = api.shotgun.ServerCapabilities(
+            "server_path", {"version": [8, 0, 0]}
+        )
+        self.transform = self.sg._read_inbound_transform(
+            {"type": "Version", "return_fields": []}
+        )
+
+    def test_records(self):
+        date = "2024-01-02T03:04:05Z"
+        local_path_field = self.sg.client_caps.local_path_field
+        movie = {
+            "link_type": "local",
+            local_path_field: "/movies/a.mov",
+            "created_at": date,
+        }
+        notes = [{"type": "Note", "id": 1, "updated_at": date}]
+        record = {
+            "type": "Version",
+            "id": 1,
+            "code": "a &lt; b",
+            "created_at": date,
+            "sg_movie": movie,
+            "notes": notes,
+            "sg_empty": "",
+        }
+        response = {"results": {"entities": [record]}}
+
+        self.assertIs(response, self.transform(response))
+        expected = self.sg._transform_inbound(date)
+        self.assertEqual(
+            {
+                "type": "Version",
+                "id": 1,
+                "code": "a < b",
+                "created_at": expected,
+                "sg_movie": {
+                    "link_type": "local",
+                    local_path_field: "/movies/a.mov",
+                    "local_path": "/movies/a.mov",
+                    "url": "file:///movies/a.mov",
+                    "created_at": expected,
+                },
+                "notes": [{"type": "Note", "id": 1, "updated_at": expected}],
+                "sg_empty": "",
+            },
+            record,
+        )
+        # Records are processed in place.
+        self.assertIs(movie, record["sg_movie"])
+        self.assertIs(notes, record["notes"])
+
+    def test_other_responses(self):
+        date = "2024-01-02T03:04:05Z"
+        self.assertEqual(
+            {"results": [self.sg._transform_inbound(date)]},
+            self.transform({"results": [date]}),
+        )
+
+
+class TestTransformOutbound(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.sg.config.convert_datetimes_to_utc = False
+
+    def test_unchanged(self):
+        data = {
+            "filters": [["id", "in", list(range(1000))], ("code", "is", "a")],
+            "paging": {"current_page": 1},
+        }
+        self.assertIs(data, self.sg._transform_outbound(data))
+
+    def test_copy_on_write(self):
+        ids = list(range(1000))
+        date = datetime.date(2024, 1, 2)
+        date_filter = ["created_at", "greater_than", date]
+        data = {
+            "filters": [["id", "in", ids], ("sg_date", "is", date)],
+            "data": [date_filter],
+        }
+        result = self.sg._transform_outbound(data)
+        self.assertEqual(
+            {
+                "filters": [["id", "in", ids], ("sg_date", "is", "2024-01-02")],
+                "data": [["created_at", "greater_than", "2024-01-02"]],
+            },
+            result,
+        )
+        # Unchanged values are shared, and the data is not modified.
+        self.assertIs(data["filters"][0], result["filters"][0])
+        self.assertIsInstance(result["filters"][1], tuple)
+        self.assertEqual(date, date_filter[2])
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.sg = api.Shotgun(
+            "http://server_path", "script_name", "api_key", connect=False
+        )
+        self.pool = self.sg._connection_pool
+        self.created = []
+        self.sockets = {}
+
+    def create(self):
+        connection = mock.Mock(spec=Http)
+        self.sockets[id(connection)] = mock.Mock()
+        connection.connections = {"http:server_path": self.sockets[id(connection)]}
+        self.created.append(connection)
+        return connection
+
+    def assert_closed(self, connection, closed=True):
+        self.assertEqual(closed, self.sockets[id(connection)].close.called)
+        self.assertEqual(closed, not connection.connections)
+
+    def run_in_thread(self, func):
+        thread = threading.Thread(target=func, daemon=True)
+        thread.start()
+        return thread
+
+    def release_from_thread(self):
+        """Check a connection out and release it from another thread."""
+        result = []
+
+        def run():
+            result.append(self.pool.checkout(self.create))
+            self.pool.release()
+
+        self.run_in_thread(run).join(10)
+        return result[0]
+
+    def test_checkout_per_thread(self):
+        connection = self.pool.checkout(self.create)
+        self.assertIs(connection, self.pool.checkout(self.create))
+        self.assertIs(connection, self.sg._connection)
+        # another thread can't use the connection checked out by this one.
+        self.assertIsNot(connection, self.release_from_thread())
+        self.assertEqual(2, len(self.created))
+
+    def test_release_reuse(self):
+        connection = self.release_from_thread()
+        self.assertIsNone(self.pool.current())
+        self.assertIs(connection, self.pool.checkout(self.create))
+        self.assertEqual(1, len(self.created))
+        self.assert_closed(connection, False)
+
+    def test_pool_size(self):
+        self.sg.config.connection_pool_size = 0
+        connection = self.release_from_thread()
+        self.assert_closed(connection)
+        self.pool.checkout(self.create)
+        self.assertEqual(2, len(self.created))
+
+    def test_idle_timeout(self):
+        connection = self.release_from_thread()
+        with mock.patch("time.time", return_value=time.time() + 61):
+            self.assertIsNot(connection, self.pool.checkout(self.create))
+        self.assert_closed(connection)
+        self.pool.release()
+
+        self.sg.config.connection_idle_timeout = None
+        connection = self.release_from_thread()
+        with mock.patch("time.time", return_value=time.time() + 3600):
+            self.assertIs(connection, self.pool.checkout(self.create))
+        self.assert_closed(connection, False)
+
+    def test_close_drains_pool(self):
+        current = self.pool.checkout(self.create)
+        checked_out = []
+        checked_out_event = threading.Event()
+        release_event = threading.Event()
+
+        def run():
+            checked_out.append(self.pool.checkout(self.create))
+            checked_out_event.set()
+            release_event.wait(10)
+            self.pool.release()
+
+        thread = self.run_in_thread(run)
+        self.assertTrue(checked_out_event.wait(10))
+        idle = self.release_from_thread()
+
+        self.sg.close()
+        self.assertIsNone(self.sg._connection)
+        self.assert_closed(idle)
+        self.assert_closed(current)
+        self.assert_closed(checked_out[0], False)
+
+        # connections checked out before the pool was drained are closed on release.
+        release_event.set()
+        thread.join(10)
+        self.assert_closed(checked_out[0])
+        self.assertEqual(0, len(self.pool._idle))
+
+    def test_error_closes_current_connection(self):
+        current = self.pool.checkout(self.create)
+        idle = self.release_from_thread()
+        current.request.side_effect = OSError("connection reset")
+        self.sg.config.max_rpc_attempts = 1
+
+        self.assertRaises(OSError, self.sg._make_call, "POST", "/api3/json", b"", {})
+        self.assertIsNone(self.sg._connection)
+        self.assert_closed(current)
+        # the other connections of the pool are kept.
+        self.assert_closed(idle, False)
+        self.assertIs(idle, self.pool.checkout(self.create))
+
+
+class TestAsyncShotgun(unittest.IsolatedAsyncioTestCase):
+    """Test AsyncShotgun against a local HTTP server."""
+
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0
+        self.close_after_response = False
+        self.respond = self._respond
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        port = server.sockets[0].getsockname()[1]
+        self.sg = api.AsyncShotgun(
+            "http://127.0.0.1:%d" % port, "script_name", "api_key"
+        )
+        self.addAsyncCleanup(self.sg.close)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers["content-length"]))
+                payload = json.loads(body)
+                self.requests.append(payload)
+
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(self.delay)
+                self.in_flight -= 1
+
+                writer.write(self.respond(payload))
+                await writer.drain()
+                if self.close_after_response:
+                    break
+        finally:
+            writer.close()
+
+    def _respond(self, payload):
+        if payload["method_name"] == "info":
+            results = {"version": [9, 0, 0]}
+        elif payload["method_name"] == "read":
+            page = payload["params"][1]["paging"]["current_page"]
+            entities = [
+                {"type": "Shot", "id": i}
+                for i in range(page * 2 - 1, min(page * 2, 3) + 1)
+            ]
+            results = {
+                "entities": entities,
+                "paging_info": {"entity_count": 3, "has_next_page": page < 2},
+            }
+        elif payload["method_name"] == "schema_field_read":
+            results = {"code": {"data_type": {"value": "text"}}}
+        else:
+            results = {"type": "Shot", "id": 1}
+        body = json.dumps({"results": results}).encode("utf-8")
+        return (
+            b"HTTP/1.1 200 OK\r\n"
+            b"content-type: application/json\r\n"
+            b"content-length: %d\r\n\r\n%s" % (len(body), body)
+        )
+
+    async def test_find(self):
+        self.sg.config._records_per_page = 2
+        result = await self.sg.find("Shot", [], ["code"])
+        self.assertEqual([1, 2, 3], [r["id"] for r in result])
+        self.assertEqual(
+            ["info", "read", "read"], [r["method_name"] for r in self.requests]
+        )
+        self.assertEqual((9, 0, 0), self.sg.server_caps.version)
+        # The keep-alive connection is reused for all the requests.
+        self.assertEqual(1, self.connections)
+
+        ids = []
+        async for record in self.sg.find_iter("Shot", [], ["code"]):
+            ids.append(record["id"])
+        self.assertEqual([1, 2, 3], ids)
+
+        # Invalid arguments are reported when find_iter() is called.
+        self.assertRaises(ValueError, self.sg.find_iter, "Shot", [], limit=-1)
+
+    async def test_find_schema_datetime_decoding(self):
+        self.sg.config.schema_datetime_decoding = True
+        respond = self._respond
+
+        def respond_with_code(payload):
+            if payload["method_name"] == "read":
+                results = {
+                    "entities": [{"type": "Shot", "id": 1, "code": "2024-01-02"}],
+                    "paging_info": {"entity_count": 1, "has_next_page": False},
+                }
+                body = json.dumps({"results": results}).encode("utf-8")
+                return (
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"content-type: application/json\r\n"
+                    b"content-length: %d\r\n\r\n%s" % (len(body), body)
+                )
+            return respond(payload)
+
+        self.respond = respond_with_code
+        result = await self.sg.find("Shot", [], ["code"])
+        # Text fields are not decoded as dates, like with the synchronous client.
+        self.assertEqual("2024-01-02", result[0]["code"])
+        self.assertEqual(
+            ["info", "schema_field_read", "read"],
+            [r["method_name"] for r in self.requests],
+        )
+
+    async def test_max_connections(self):
+        self.sg = api.AsyncShotgun(
+            self.sg.config.scheme + "://" + self.sg.config.server,
+            "script_name",
+            "api_key",
+            max_connections=2,
+        )
+        self.addAsyncCleanup(self.sg.close)
+        self.delay = 0.05
+        await asyncio.gather(*[self.sg.info() for _ in range(6)])
+        self.assertEqual(2, self.max_in_flight)
+        self.assertEqual(2, self.connections)
+
+    async def test_reconnect(self):
+        # The server closes the connection without telling the client, which
+        # fails on the next request and sends it again on a new connection.
+        self.close_after_response = True
+        await self.sg.info()
+        await asyncio.sleep(0.01)
+        result = await self.sg.info()
+        self.assertEqual([9, 0, 0], result["version"])
+        self.assertEqual(2, self.connections)
+
+    async def test_chunked_response(self):
+        def respond(payload):
+            return (
+                b"HTTP/1.1 200 OK\r\n"
+                b"content-type: application/json\r\n"
+                b"transfer-encoding: chunked\r\n"
+                b"connection: close\r\n\r\n"
+                b"c\r\n{\"results\": \r\n"
+                b"16\r\n{\"version\": [9, 0, 0]}\r\n"
+                b"1\r\n}\r\n0\r\n\r\n"
+            )
+
+        self.respond = respond
+        self.assertEqual({"version": [9, 0, 0]}, await self.sg.info())
+        self.assertEqual({"version": [9, 0, 0]}, await self.sg.info())
+        # The server asked for the connection to be closed.
+        self.assertEqual(2, self.connections)
+
+    async def test_create_image_not_supported(self):
+        with self.assertRaises(api.ShotgunError):
+            await self.sg.create("Shot", {"code": "x", "image": "/tmp/image.png"})
+        self.assertEqual([], self.requests)
+
 
 class TestServerCapabilities(unittest.TestCase):
     def test_no_server_version(self):
@@ -268,6 +1412,61 @@ class TestServerCapabilities(unittest.TestCase):
         self.assertFalse(serverCapabilities.is_dev)
 
 
+class TestServerInfoCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        api.shotgun._SERVER_INFO_CACHE.clear()
+        self.addCleanup(api.shotgun._SERVER_INFO_CACHE.clear)
+        self.info = mock.Mock(side_effect=lambda: {"version": [8, 0, 0]})
+
+    def _connect(self, ttl="60", cache_dir=None):
+        environ = {"SHOTGUN_API_SERVER_INFO_CACHE_TTL": ttl}
+        if cache_dir:
+            environ["SHOTGUN_API_SERVER_INFO_CACHE_DIR"] = cache_dir
+        with mock.patch.dict(os.environ, environ), mock.patch.object(
+            api.Shotgun, "info", self.info
+        ):
+            return api.Shotgun("http://server_path", "script_name", "api_key")
+
+    def test_process_cache(self):
+        sg = self._connect()
+        self.assertEqual((8, 0, 0), sg.server_caps.version)
+        sg.server_info["version"] = None
+        self.assertEqual((8, 0, 0), self._connect().server_caps.version)
+        self.assertEqual(1, self.info.call_count)
+
+        # Another server, or an expired entry, is read again.
+        with mock.patch.object(api.Shotgun, "info", self.info):
+            sg = api.Shotgun("http://other", "script_name", "api_key")
+        self.assertEqual(2, self.info.call_count)
+        with mock.patch("time.time", return_value=time.time() + 120):
+            self._connect()
+        self.assertEqual(3, self.info.call_count)
+
+        self._connect(ttl="0")
+        self.assertEqual(4, self.info.call_count)
+        with mock.patch.dict(
+            os.environ, {"SHOTGUN_API_SERVER_INFO_CACHE_TTL": "soon"}
+        ), self.assertRaises(ValueError):
+            api.Shotgun("http://server_path", "script_name", "api_key")
+
+    def test_disk_cache(self):
+        self._connect(cache_dir=self.tmp_dir)
+        api.shotgun._SERVER_INFO_CACHE.clear()
+        self.assertEqual(
+            (8, 0, 0), self._connect(cache_dir=self.tmp_dir).server_caps.version
+        )
+        self.assertEqual(1, self.info.call_count)
+        self.assertEqual(1, len(os.listdir(self.tmp_dir)))
+
+    def test_disk_cache_write_error(self):
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            self._connect(cache_dir=self.tmp_dir)
+        # The temporary file is removed.
+        self.assertEqual([], os.listdir(self.tmp_dir))
+
+
 class TestClientCapabilities(unittest.TestCase):
 
     def test_darwin(self):